@@ -0,0 +1,171 @@
+"""게이트웨이 모드별 메모리·준비 시간 비교: Intents.all() 대비 LOW_MEMORY.
+
+python benchmarks/bench_gateway_memory.py --guilds 500 --members 2000
+
+실제 게이트웨이에 접속하지 않고, 각 모드의 intents로 Discord가 보냈을 GUILD_CREATE·
+멤버 청크·메시지 이벤트를 합성해 discord.py 상태(ConnectionState)에 그대로 넣습니다.
+모드마다 새 프로세스에서 재므로 RSS가 서로 섞이지 않습니다. 준비 시간은 받은
+페이로드를 처리하는 시간이고, 청크 요청 왕복 같은 네트워크 지연은 빠져 있습니다.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Discord가 GUILD_CREATE에 멤버 목록을 다 싣는 최대 규모와 청크 하나의 크기
+LARGE_THRESHOLD = 250
+CHUNK_SIZE = 1000
+
+CHILD = """
+import gc, json, sys, time
+sys.path.insert(0, {root!r})
+import discord
+from discord.ext import commands
+from sharding import gateway_options
+
+args = json.loads({args!r})
+LARGE_THRESHOLD, CHUNK_SIZE = {large}, {chunk}
+
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+
+
+def user(i):
+    return {{"id": str(10**17 + i), "username": f"user{{i}}", "discriminator": "0",
+            "global_name": f"User {{i}}", "avatar": None}}
+
+
+def member(i):
+    return {{"user": user(i), "roles": [], "joined_at": "2026-01-01T00:00:00+00:00",
+            "deaf": False, "mute": False, "flags": 0}}
+
+
+def presence(i):
+    return {{"user": {{"id": str(10**17 + i)}}, "status": "online",
+            "client_status": {{"desktop": "online"}},
+            "activities": [{{"name": "game", "type": 0}}]}}
+
+
+def guild_payload(g, intents):
+    gid = 10**16 + g
+    channels = [{{"id": str(gid * 100 + c), "type": 0, "name": f"channel-{{c}}",
+                 "position": c, "permission_overwrites": []}}
+                for c in range(args["channels"])]
+    data = {{"id": str(gid), "name": f"guild-{{g}}", "member_count": args["members"],
+            "large": args["members"] > LARGE_THRESHOLD, "roles": [], "emojis": [],
+            "stickers": [], "features": [], "channels": channels,
+            "members": [], "presences": [], "voice_states": [], "threads": []}}
+    if intents.members or intents.presences:
+        # 작은 길드는 멤버·presence 전체가, 큰 길드는 일부만 GUILD_CREATE에 실립니다.
+        shown = min(args["members"], LARGE_THRESHOLD)
+        data["members"] = [member(g * args["members"] + i) for i in range(shown)]
+        if intents.presences:
+            data["presences"] = [presence(g * args["members"] + i) for i in range(shown)]
+    return data
+
+
+async def main():
+    options = gateway_options(args["low_memory"])
+    bot = commands.Bot(command_prefix="!", help_command=None, **options)
+    state = bot._connection
+    state.dispatch = lambda *a, **k: None
+    intents = state._intents
+
+    gc.collect()
+    before = rss_kb()
+    started = time.perf_counter()
+    chunks = 0
+    for g in range(args["guilds"]):
+        guild = state._add_guild_from_data(guild_payload(g, intents))
+        if state._guild_needs_chunking(guild):
+            # 청킹: 나머지 멤버를 CHUNK_SIZE씩 받아 캐시에 넣습니다.
+            base = g * args["members"]
+            for start in range(0, args["members"], CHUNK_SIZE):
+                chunks += 1
+                for i in range(start, min(start + CHUNK_SIZE, args["members"])):
+                    guild._add_member(discord.Member(data=member(base + i), guild=guild, state=state))
+    ready = time.perf_counter() - started
+
+    # 준비 뒤 길드 채널에 오가는 일반 메시지 (명령어가 아닌 대화)
+    for n in range(args["messages"]):
+        g = n % args["guilds"]
+        gid = 10**16 + g
+        state.parse_message_create({{
+            "id": str(10**18 + n), "channel_id": str(gid * 100), "guild_id": str(gid),
+            "author": user(g * args["members"]), "member": member(g * args["members"]),
+            "content": "오늘 회의 몇 시죠?" * 4, "timestamp": "2026-10-16T09:00:00+00:00",
+            "edited_timestamp": None, "tts": False, "mention_everyone": False,
+            "mentions": [], "mention_roles": [], "attachments": [], "embeds": [],
+            "pinned": False, "type": 0}})
+    gc.collect()
+    after = rss_kb()
+    print(json.dumps({{
+        "ready_s": ready,
+        "rss_mb": after / 1024,
+        "rss_delta_mb": (after - before) / 1024,
+        "cached_members": sum(len(g._members) for g in state._guilds.values()),
+        "cached_messages": len(state._messages or []),
+        "member_chunks": chunks,
+        "intents": intents.value,
+    }}))
+
+
+import asyncio
+asyncio.run(main())
+"""
+
+
+def measure(low_memory: bool, args: argparse.Namespace) -> Dict[str, float]:
+    payload = json.dumps({**vars(args), "low_memory": low_memory})
+    code = CHILD.format(
+        root=ROOT, args=payload, large=LARGE_THRESHOLD, chunk=CHUNK_SIZE
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, default=500)
+    parser.add_argument("--members", type=int, default=2000, help="길드당 멤버 수")
+    parser.add_argument("--channels", type=int, default=30, help="길드당 채널 수")
+    parser.add_argument("--messages", type=int, default=5000, help="준비 뒤 메시지 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    results = {
+        "Intents.all()": measure(False, args),
+        "LOW_MEMORY": measure(True, args),
+    }
+    print(
+        f"길드 {args.guilds}개 × 멤버 {args.members}명 × 채널 {args.channels}개, "
+        f"메시지 {args.messages}개"
+    )
+    print(
+        f"\n{'모드':<16}{'준비(처리)':>12}{'RSS':>10}{'증가분':>10}"
+        f"{'멤버 캐시':>12}{'메시지 캐시':>12}{'청크':>8}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<16}{r['ready_s']:>11.2f}s{r['rss_mb']:>8.0f}MB"
+            f"{r['rss_delta_mb']:>8.0f}MB{r['cached_members']:>12,}"
+            f"{r['cached_messages']:>12,}{r['member_chunks']:>8,}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
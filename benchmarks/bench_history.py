@@ -0,0 +1,145 @@
+"""제출 기록·전송 기록(SQLite WAL) 벤치마크: 기록 비용과 조회 지연.
+
+python benchmarks/bench_history.py --users 50 --days 365
+"""
+
+import argparse
+import datetime
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history import HistoryStore  # noqa: E402
+from ledger import DeliveryLedger  # noqa: E402
+
+KINDS = ["daily_scrum", "weekly_plan", "weekly_retrospect"]
+END = datetime.date(2026, 10, 16)
+
+
+def timed(fn: Callable[[], object], runs: int) -> List[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def report(name: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{name:<28}{statistics.median(ordered):>10.3f} ms{p95:>10.3f} ms"
+        f"{len(ordered):>8}회"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    users = [f"user{i}" for i in range(args.users)]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(os.path.join(tmp, "history.db"))
+        record_ms = []
+        for offset in range(args.days, 0, -1):
+            date = END - datetime.timedelta(days=offset)
+            if date.weekday() >= 5:
+                continue
+            checked = datetime.datetime.combine(date, datetime.time(9, 10))
+            for kind in KINDS:
+                submissions = {
+                    user: checked if rng.random() < 0.8 else None for user in users
+                }
+                reminded = [u for u, at in submissions.items() if at is None]
+                started = time.perf_counter()
+                store.record_sync("default", kind, date, submissions, reminded, checked)
+                record_ms.append((time.perf_counter() - started) * 1000)
+
+        rows = store._execute("SELECT COUNT(*) FROM submissions")[0][0]
+        print(
+            f"기록 {rows:,}줄 (사용자 {args.users}명, {args.days}일, 종류 {len(KINDS)}개)"
+        )
+        print(f"{'항목':<28}{'p50':>13}{'p95':>13}{'횟수':>8}")
+        report(f"record ({args.users}명)", record_ms)
+        report(
+            "streak",
+            timed(
+                lambda: store.streak(rng.choice(users), "daily_scrum", END), args.runs
+            ),
+        )
+        report(
+            "last_submitted",
+            timed(
+                lambda: store.last_submitted(rng.choice(users), "weekly_plan"),
+                args.runs,
+            ),
+        )
+        report(
+            "weekly_compliance",
+            timed(lambda: store.weekly_compliance(END, "daily_scrum"), args.runs),
+        )
+        report(
+            "compliance (전체 기간)",
+            timed(
+                lambda: store.compliance(END - datetime.timedelta(days=args.days), END),
+                max(1, args.runs // 10),
+            ),
+        )
+        store.close()
+
+        # 채널마다 알림을 보내기 전 조회(pending)와 보낸 뒤 기록(mark_sent)
+        ledger = DeliveryLedger(os.path.join(tmp, "history.db"), {"daily_scrum": 5.0})
+        user_ids = [str(10**17 + i) for i in range(args.users)]
+        sent_at = datetime.datetime.combine(END, datetime.time(9, 10))
+        window = END.isoformat()
+        for channel_id in range(100):
+            ledger.mark_sent_sync(
+                1, channel_id, "default", "daily_scrum", window, user_ids, sent_at
+            )
+        report(
+            f"ledger pending ({args.users}명)",
+            timed(
+                lambda: ledger.pending_sync(
+                    1,
+                    rng.randrange(100),
+                    "default",
+                    "daily_scrum",
+                    window,
+                    user_ids,
+                    sent_at,
+                ),
+                args.runs,
+            ),
+        )
+        report(
+            f"ledger mark_sent ({args.users}명)",
+            timed(
+                lambda: ledger.mark_sent_sync(
+                    1,
+                    rng.randrange(100),
+                    "default",
+                    "daily_scrum",
+                    window,
+                    user_ids,
+                    sent_at,
+                ),
+                args.runs,
+            ),
+        )
+        ledger.close()
+
+
+if __name__ == "__main__":
+    main()
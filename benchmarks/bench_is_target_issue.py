@@ -0,0 +1,71 @@
+"""is_target_issue 핫패스: 기존 INFO 덤프 방식과 현재 구현 비교.
+
+python benchmarks/bench_is_target_issue.py [아이템 수]
+"""
+
+import logging
+import os
+import sys
+import timeit
+
+from payloads import make_project_items
+
+from project_items import ProjectIndex, field_node_value
+from tracking import is_target_issue
+
+logger = logging.getLogger("bench.legacy")
+
+
+def legacy_is_target_issue(item, target):
+    """아이템마다 모든 필드를 INFO로 찍던 기존 구현 (비교용 복제본)."""
+    status = None
+    for field in item.get("fieldValues", {}).get("nodes", []):
+        if field.get("field", {}).get("name") == "Status":
+            status = field_node_value(field)
+            break
+    content = item.get("content")
+    if not content:
+        return False
+    title = content.get("title", "")
+    logger.info(f"=== Issue 디버깅 ===")
+    logger.info(f"제목: '{title}'")
+    logger.info(f"Status 필드값: '{status}'")
+    logger.info(f"모든 필드값:")
+    for field in item.get("fieldValues", {}).get("nodes", []):
+        field_name = field.get("field", {}).get("name", "Unknown")
+        field_type = field.get("__typename", "Unknown")
+        value = field_node_value(field)
+        logger.info(f"  - {field_name} ({field_type}): {value}")
+    return status == target
+
+
+def main() -> None:
+    n_items = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    nodes = make_project_items(n_items)
+    items = ProjectIndex.from_nodes(nodes).items
+
+    # 실제 봇처럼 INFO 로그를 핸들러로 내보내되 화면 대신 /dev/null에 씁니다.
+    devnull = open(os.devnull, "w")
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    runs = 20
+    legacy = timeit.timeit(
+        lambda: [legacy_is_target_issue(n, "Weekly-Planning") for n in nodes],
+        number=runs,
+    )
+    current = timeit.timeit(
+        lambda: [is_target_issue(i, "Weekly-Planning") for i in items], number=runs
+    )
+    print(f"아이템 {n_items}개, {runs}회 반복")
+    print(f"  기존 (INFO 덤프): {legacy / runs * 1000:8.3f} ms/loop")
+    print(f"  현재           : {current / runs * 1000:8.3f} ms/loop")
+    print(f"  배율           : {legacy / current:8.1f}x")
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
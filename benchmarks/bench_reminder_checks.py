@@ -0,0 +1,149 @@
+"""check 알림 규칙의 종단 간 지연을 가짜 GitHub 서버로 오프라인 측정합니다.
+
+python benchmarks/bench_reminder_checks.py --latency 0.08 --items 2000
+python benchmarks/bench_reminder_checks.py --replay cassettes/   # 녹화본 재생
+
+실제 토큰이나 네트워크 없이, 같은 시드와 지연 설정이면 같은 요청 흐름이 재현됩니다.
+"""
+
+import argparse
+import asyncio
+import datetime
+import functools
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from payloads import make_project_items
+
+PORT = 8766
+USERS = [f"user{i}" for i in range(10)]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": p95 * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    from tools.fake_github import FakeGitHub, Recorder, serve
+
+    if args.replay:
+        server = Recorder(args.replay, "replay")
+    else:
+        server = FakeGitHub(
+            make_project_items(args.items, n_assignees=len(USERS)),
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+    runner = await serve(server.make_app(), "127.0.0.1", PORT)
+
+    os.environ["GITHUB_GRAPHQL_URL"] = f"http://127.0.0.1:{PORT}/graphql"
+    tmp = tempfile.mkdtemp()
+    os.environ["HISTORY_DB_PATH"] = os.path.join(tmp, "history.db")
+    os.environ["DELIVERY_LEDGER_PATH"] = os.path.join(tmp, "history.db")
+    os.environ["USER_MAP"] = json.dumps({u: str(1000 + i) for i, u in enumerate(USERS)})
+    if args.projects > 1:
+        # 가짜 서버는 org/number와 상관없이 같은 아이템을 돌려줍니다.
+        os.environ["GITHUB_PROJECTS"] = json.dumps(
+            [
+                {"name": f"team{i}", "org": "benchmark", "project": i + 1}
+                for i in range(args.projects)
+            ]
+        )
+        os.environ["GITHUB_PROJECT_CONCURRENCY"] = str(args.concurrency)
+    # main은 import 시 봇과 스케줄러를 구성만 하고 접속하지는 않습니다.
+    import main
+    from github_client import GitHubClient
+    from scheduler import KST
+    from tracking import get_projects
+
+    main.holiday_service._holidays[2026] = set()
+    # reminders.toml의 check 규칙마다 합성 데이터 날짜(10/12~10/16) 안의 첫 실행 시각
+    start = datetime.datetime(2026, 10, 11, 23, tzinfo=KST)
+    checks: Dict[str, Callable] = {}
+    now_by_check = {}
+    for rule in main.reminder_rules:
+        if rule.action == "check":
+            checks[rule.name] = functools.partial(main.run_rule, rule)
+            now_by_check[rule.name] = rule.cron.next_fire(start)
+
+    results = {}
+    async with GitHubClient.from_settings(main.settings) as client:
+        main.set_github_client(client)
+        for name, check in checks.items():
+            samples = []
+            before = client.requests
+            for _ in range(args.runs):
+                for project in get_projects():
+                    project.snapshot.invalidate()
+                started = time.perf_counter()
+                await check(now_by_check[name])
+                samples.append(time.perf_counter() - started)
+            results[name] = {
+                **summarize(samples),
+                "requests_per_run": (client.requests - before) / args.runs,
+            }
+
+        # 스냅샷 경로: 전체 동기화 후 인덱스를 만드는 비용
+        samples = []
+        before = client.requests
+        for _ in range(max(1, args.runs // 5)):
+            for project in get_projects():
+                project.snapshot.invalidate()
+                project.sync.watermark = None
+            started = time.perf_counter()
+            await asyncio.gather(*(p.snapshot.refresh() for p in get_projects()))
+            samples.append(time.perf_counter() - started)
+        results["project_snapshot (full sync)"] = {
+            **summarize(samples),
+            "requests_per_run": (client.requests - before) / len(samples),
+        }
+        main.set_github_client(None)
+
+    await runner.cleanup()
+
+    print(f"\n{'확인':<34}{'평균':>10}{'p50':>10}{'p95':>10}{'요청/회':>9}")
+    for name, r in results.items():
+        print(
+            f"{name:<34}{r['mean_ms']:>8.1f}ms{r['p50_ms']:>8.1f}ms"
+            f"{r['p95_ms']:>8.1f}ms{r['requests_per_run']:>9.1f}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000, help="합성 아이템 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx 비율")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--projects", type=int, default=1, help="프로젝트(팀) 수")
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="동시에 확인할 프로젝트 수"
+    )
+    parser.add_argument("--replay", help="이 디렉터리의 녹화본으로 응답")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
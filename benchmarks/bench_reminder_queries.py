@@ -0,0 +1,215 @@
+"""알림 확인 쿼리: 기존 범용 쿼리(items(last: 100) + body + 모든 필드)와
+알림 종류별 전용 쿼리의 응답 크기·JSON 디코드 시간·GraphQL 비용 비교.
+
+python benchmarks/bench_reminder_queries.py           # 합성 응답으로 비교
+python benchmarks/bench_reminder_queries.py --history-weeks 1,4,12,52   # 기록이 쌓일 때
+python benchmarks/bench_reminder_queries.py --live    # 실제 GitHub에 질의 (.env 필요)
+"""
+
+import argparse
+import asyncio
+import json
+import timeit
+from typing import Any, Dict, List
+
+from payloads import make_project_items
+
+from rules import load_rules
+from settings import get_settings
+from tools.fake_github import matches_filter
+from tracking import REMINDER_ITEMS_QUERY
+
+# 바꾸기 전 fetch_github_project_issues가 보내던 쿼리 (비교용 복제본)
+LEGACY_QUERY = """
+query($org: String!, $number: Int!) {
+    rateLimit { cost remaining resetAt }
+    organization(login: $org) {
+        projectV2(number: $number) {
+            items(last: 100) {
+                nodes {
+                    fieldValues(first: 100) {
+                        nodes {
+                            __typename
+                            ... on ProjectV2ItemFieldSingleSelectValue {
+                                name
+                                field { ... on ProjectV2SingleSelectField { name } }
+                            }
+                            ... on ProjectV2ItemFieldTextValue {
+                                text
+                                field { ... on ProjectV2Field { name } }
+                            }
+                            ... on ProjectV2ItemFieldNumberValue {
+                                number
+                                field { ... on ProjectV2Field { name } }
+                            }
+                            ... on ProjectV2ItemFieldDateValue {
+                                date
+                                field { ... on ProjectV2Field { name } }
+                            }
+                        }
+                    }
+                    content {
+                        ... on Issue {
+                            title
+                            url
+                            body
+                            assignees(first: 10) { nodes { login } }
+                        }
+                    }
+                    createdAt
+                }
+            }
+        }
+    }
+}
+"""
+
+TODAY = "26.10.16"
+# 제목 날짜 조건이 없던 이전 주간 필터 (기록 증가 비교용)
+UNBOUNDED_FILTERS = {
+    "weekly_plan": 'status:"Weekly-Planning"',
+    "weekly_retrospect": 'status:"Weekly-Retrospect"',
+}
+# 일주일에 쌓이는 합성 아이템 수 (10명 × 데일리·주간 문서 + 기타 이슈)
+ITEMS_PER_WEEK = 100
+# 기록 증가 비교의 확인 날짜. 합성 데이터의 마지막 날은 오전까지만 있어 하루 전을 씁니다.
+HISTORY_TODAY = "26.10.15"
+
+
+def reminder_filters(today: str) -> Dict[str, str]:
+    """reminders.toml의 check 규칙이 보내는 알림 종류별 필터."""
+    return {
+        rule.kind: rule.filter_query(today)
+        for rule in load_rules(links=get_settings().links)
+        if rule.action == "check"
+    }
+
+
+def wrap(nodes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "data": {
+            "organization": {
+                "projectV2": {
+                    "items": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": nodes,
+                    }
+                }
+            }
+        }
+    }
+
+
+def slim_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """전용 쿼리가 돌려주는 모양으로 노드를 줄입니다."""
+    status = next(
+        f["name"]
+        for f in node["fieldValues"]["nodes"]
+        if f["field"]["name"] == "Status"
+    )
+    return {
+        "id": node["id"],
+        "createdAt": node["createdAt"],
+        "updatedAt": node["updatedAt"],
+        "status": {"name": status},
+        "content": {
+            "title": node["content"]["title"],
+            "assignees": node["content"]["assignees"],
+        },
+    }
+
+
+def select(nodes: List[Dict[str, Any]], filter_query: str) -> List[Dict[str, Any]]:
+    """가짜 GitHub 서버와 같은 규칙으로 필터에 맞는 노드를 골라 줄입니다."""
+    return [slim_node(n) for n in nodes if matches_filter(n, filter_query)]
+
+
+def measure(body: bytes, runs: int = 200) -> float:
+    return timeit.timeit(lambda: json.loads(body), number=runs) / runs * 1000
+
+
+def run_synthetic(n_items: int) -> None:
+    nodes = make_project_items(n_items, n_fields=8, body_size=1500)
+    legacy_nodes = [
+        {k: v for k, v in n.items() if k not in ("id", "isArchived", "updatedAt")}
+        for n in nodes[:100]
+    ]
+    legacy = json.dumps(wrap(legacy_nodes)).encode()
+    print(f"합성 프로젝트 아이템 {n_items}개 (본문 1500자, 필드 8개)")
+    print(f"{'쿼리':<20}{'아이템':>8}{'응답 크기':>14}{'디코드':>12}")
+    print(f"{'기존 범용':<20}{100:>8}{len(legacy):>12,} B{measure(legacy):>9.3f} ms")
+    for kind, filter_query in reminder_filters(TODAY).items():
+        selected = select(nodes, filter_query)
+        body = json.dumps(wrap(selected)).encode()
+        print(
+            f"{kind:<20}{len(selected):>8}{len(body):>12,} B"
+            f"{measure(body):>9.3f} ms  ({len(body) / len(legacy):.1%})"
+        )
+
+
+def run_history(weeks: List[int]) -> None:
+    """프로젝트에 지난 문서가 쌓일수록 주간 확인 응답이 어떻게 변하는지 비교합니다."""
+    interval = 7 * 24 * 60 / ITEMS_PER_WEEK
+    filters = reminder_filters(HISTORY_TODAY)
+    print(
+        f"\n기록 증가 (주당 아이템 {ITEMS_PER_WEEK}개, 본문 1500자, 필드 8개, "
+        f"확인 날짜 {HISTORY_TODAY})"
+    )
+    print(f"{'주':>4}  {'종류':<20}{'날짜 없는 필터':>22}{'제목 날짜 필터':>22}")
+    for n_weeks in weeks:
+        nodes = make_project_items(
+            n_weeks * ITEMS_PER_WEEK,
+            n_fields=8,
+            body_size=1500,
+            interval_minutes=interval,
+        )
+        for kind, unbounded in UNBOUNDED_FILTERS.items():
+            cells = []
+            for filter_query in (unbounded, filters[kind]):
+                selected = select(nodes, filter_query)
+                body = json.dumps(wrap(selected)).encode()
+                cells.append(f"{len(selected):>6}개 {len(body):>10,} B")
+            print(f"{n_weeks:>4}  {kind:<20}{cells[0]:>22}{cells[1]:>22}")
+
+
+async def run_live() -> None:
+    from github_client import GitHubClient
+    from tracking import get_today_date_str, project_sync
+
+    today = get_today_date_str()
+    base = project_sync.project_variables()
+    cases = [("기존 범용", LEGACY_QUERY, base)]
+    for kind, filter_query in reminder_filters(today).items():
+        variables = {**base, "after": None, "filter": filter_query}
+        cases.append((kind, REMINDER_ITEMS_QUERY, variables))
+
+    async with GitHubClient.from_settings(get_settings()) as client:
+        print(f"{'쿼리':<20}{'응답 크기':>14}{'디코드':>12}{'비용':>6}")
+        for name, query, variables in cases:
+            async with client.post({"query": query, "variables": variables}) as resp:
+                resp.raise_for_status()
+                body = await resp.read()
+            cost = json.loads(body)["data"]["rateLimit"]["cost"]
+            print(f"{name:<20}{len(body):>12,} B{measure(body, 50):>9.3f} ms{cost:>6}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--live", action="store_true", help="실제 GitHub에 질의")
+    parser.add_argument("--items", type=int, default=300, help="합성 아이템 수")
+    parser.add_argument(
+        "--history-weeks",
+        default="1,4,12,52",
+        help="기록 증가 비교에 쓸 주 수 (쉼표로 구분, 비우면 생략)",
+    )
+    args = parser.parse_args()
+    if args.live:
+        asyncio.run(run_live())
+    else:
+        run_synthetic(args.items)
+        if args.history_weeks:
+            run_history([int(w) for w in args.history_weeks.split(",")])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""봇 기동 시간 벤치마크: 새 인터프리터에서 `import main`과 접속 직전 준비까지 걸리는 시간.
+
+python benchmarks/bench_startup.py --runs 10
+python benchmarks/bench_startup.py --repo ../DiscordBot-old   # 다른 체크아웃과 비교
+
+실제 게이트웨이 접속(bot.start)은 하지 않습니다. 접속 전에 main()이 하는 캐시
+로드까지 재고, -X importtime 출력으로 가장 오래 걸린 모듈을 보여 줍니다.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json
+import time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.holiday_service.load_cache()
+main.channel_registry.load()
+ready = time.perf_counter()
+print(json.dumps({"import_ms": (imported - started) * 1000, "ready_ms": (ready - started) * 1000}))
+"""
+
+
+def run_once(repo: str, env: Dict[str, str]) -> Tuple[Dict[str, float], List[str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        cwd=repo,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    return timings, result.stderr.splitlines()
+
+
+def slowest_imports(lines: List[str], top: int) -> List[Tuple[str, int]]:
+    """-X importtime 출력에서 main이 직접 불러온 모듈을 누적 시간순으로 고릅니다."""
+    modules = []
+    for line in lines:
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # 이름 앞 공백: 최상위는 1칸, 한 단계 내려갈 때마다 2칸씩 늘어납니다.
+        if len(name) - len(name.lstrip()) == 3:
+            modules.append((name.strip(), int(cumulative)))
+    return sorted(modules, key=lambda r: r[1], reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--repo", default=ROOT, help="측정할 체크아웃 경로")
+    parser.add_argument("--top", type=int, default=10, help="표시할 느린 모듈 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "GITHUB_TOKEN": "benchmark",
+            "GITHUB_PROJECT_ID": "1",
+            "GITHUB_ORG": "benchmark",
+            "HOLIDAY_CACHE_PATH": os.path.join(tmp, "holiday_cache.json"),
+            "CHANNEL_REGISTRY_PATH": os.path.join(tmp, "channel_registry.json"),
+            "PYTHONDONTWRITEBYTECODE": "",
+        }
+        # 첫 실행은 .pyc 생성 비용이 섞이므로 버립니다.
+        run_once(args.repo, env)
+        samples, lines = [], []
+        for _ in range(args.runs):
+            timings, lines = run_once(args.repo, env)
+            samples.append(timings)
+
+    report = {}
+    for key in ("import_ms", "ready_ms"):
+        values = sorted(s[key] for s in samples)
+        report[key] = {
+            "mean": statistics.fmean(values),
+            "p50": statistics.median(values),
+            "min": values[0],
+            "max": values[-1],
+        }
+    report["slowest_imports_ms"] = {
+        name: us / 1000 for name, us in slowest_imports(lines, args.top)
+    }
+
+    print(f"{args.repo} ({args.runs}회)")
+    for key in ("import_ms", "ready_ms"):
+        r = report[key]
+        print(
+            f"{key:<10} 평균 {r['mean']:7.1f} ms  p50 {r['p50']:7.1f} ms  "
+            f"최소 {r['min']:7.1f} ms  최대 {r['max']:7.1f} ms"
+        )
+    print("\nmain이 불러온 모듈 중 느린 순 (마지막 실행 기준)")
+    for name, ms in report["slowest_imports_ms"].items():
+        print(f"  {name:<30}{ms:>9.1f} ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
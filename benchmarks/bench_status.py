@@ -0,0 +1,108 @@
+"""!현황 동시 요청 벤치마크: 마감 직전 여러 명이 한꺼번에 물을 때의 응답 시간과 GitHub 요청 수.
+
+python benchmarks/bench_status.py --users 200 --items 2000 --latency 0.1
+
+가짜 GitHub 서버로 스냅샷이 없을 때(cold), 신선할 때(warm), --refresh가 몰릴 때를
+각각 재고, 동시에 들어온 요청이 GitHub 왕복을 공유하는지 요청 수로 확인합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+
+from payloads import make_project_items
+
+PORT = 8767
+USERS = [f"user{i}" for i in range(10)]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": p95 * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    from tools.fake_github import FakeGitHub, serve
+
+    server = FakeGitHub(
+        make_project_items(args.items, n_assignees=len(USERS)),
+        latency=args.latency,
+        seed=args.seed,
+    )
+    runner = await serve(server.make_app(), "127.0.0.1", PORT)
+
+    tmp = tempfile.mkdtemp()
+    os.environ["GITHUB_GRAPHQL_URL"] = f"http://127.0.0.1:{PORT}/graphql"
+    os.environ["HISTORY_DB_PATH"] = os.path.join(tmp, "history.db")
+    os.environ["DELIVERY_LEDGER_PATH"] = os.path.join(tmp, "history.db")
+    os.environ["USER_MAP"] = json.dumps({u: str(1000 + i) for i, u in enumerate(USERS)})
+    import main
+    from github_client import GitHubClient
+    from tracking import get_projects
+
+    projects = get_projects()
+    kinds = list(main.status_rules)
+
+    async def burst(refresh: bool) -> Dict[str, float]:
+        async def one() -> float:
+            started = time.perf_counter()
+            await main.build_status_embeds(kinds, projects, refresh)
+            return time.perf_counter() - started
+
+        before = client.requests
+        samples = await asyncio.gather(*(one() for _ in range(args.users)))
+        return {**summarize(samples), "requests": client.requests - before}
+
+    results = {}
+    async with GitHubClient.from_settings(main.settings) as client:
+        main.set_github_client(client)
+        for project in projects:
+            project.snapshot.invalidate()
+        results["cold"] = await burst(refresh=False)
+        results["warm"] = await burst(refresh=False)
+        # 최소 갱신 간격이 지나도록 스냅샷을 오래된 것으로 만듭니다.
+        for project in projects:
+            project.snapshot._fetched_at -= main.STATUS_REFRESH_MIN_AGE + 1
+        results["--refresh"] = await burst(refresh=True)
+        main.set_github_client(None)
+
+    await runner.cleanup()
+
+    print(f"동시 {args.users}명, 아이템 {args.items}개, 응답 지연 {args.latency}s")
+    print(f"\n{'경우':<12}{'p50':>10}{'p95':>10}{'최대':>10}{'GitHub 요청':>12}")
+    for name, r in results.items():
+        print(
+            f"{name:<12}{r['p50_ms']:>8.1f}ms{r['p95_ms']:>8.1f}ms"
+            f"{r['max_ms']:>8.1f}ms{r['requests']:>12}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200, help="동시 요청 수")
+    parser.add_argument("--items", type=int, default=2000, help="합성 아이템 수")
+    parser.add_argument("--latency", type=float, default=0.1, help="응답 지연(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
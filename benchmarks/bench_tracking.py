@@ -0,0 +1,163 @@
+"""tracking 필터 함수 벤치마크: 아이템 수별 실행 시간과 최대 메모리.
+
+python benchmarks/bench_tracking.py --output report.json
+python benchmarks/bench_tracking.py --baseline report.json   # 기준과 비교
+
+기준 보고서와 비교해 허용치보다 느려지거나 메모리를 더 쓰면 종료 코드 1로 끝납니다.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import logging
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from payloads import make_project_items
+
+from project_items import ProjectIndex, build_scrum_days
+from tracking import (
+    check_issue_created_by_users,
+    get_daily_scrum_sub_issues,
+    get_field_value,
+    is_target_issue,
+    sort_items_by_created_at_desc,
+)
+
+DEFAULT_SIZES = [100, 10_000, 100_000]
+TODAY = "26.10.16"
+
+
+def build_cases(
+    n_items: int, n_fields: int, n_assignees: int
+) -> Dict[str, Callable[[], Any]]:
+    """벤치마크 이름 → 인자 없이 호출할 함수."""
+    nodes = make_project_items(n_items, n_fields=n_fields, n_assignees=n_assignees)
+    index = ProjectIndex.from_nodes(nodes)
+    items = index.items
+    users = [f"user{i}" for i in range(n_assignees)]
+    loop = asyncio.new_event_loop()
+
+    return {
+        "ProjectIndex.from_nodes": lambda: ProjectIndex.from_nodes(nodes),
+        "is_target_issue": lambda: [
+            item for item in items if is_target_issue(item, "Weekly-Planning")
+        ],
+        "check_issue_created_by_users": lambda: check_issue_created_by_users(
+            index.with_status("Weekly-Planning"), users, TODAY
+        ),
+        "build_scrum_days": lambda: build_scrum_days(items),
+        "get_daily_scrum_sub_issues": lambda: loop.run_until_complete(
+            get_daily_scrum_sub_issues(index, TODAY)
+        ),
+        "get_field_value": lambda: [get_field_value(node, "Status") for node in nodes],
+        "sort_items_by_created_at_desc": lambda: sort_items_by_created_at_desc(items),
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"time_ms": best * 1000, "peak_kib": peak / 1024}
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, float]] = {}
+    for size in args.sizes:
+        cases = build_cases(size, args.fields, args.assignees)
+        for name, fn in cases.items():
+            if args.only and name not in args.only:
+                continue
+            key = f"{name}@{size}"
+            results[key] = measure(fn, args.repeat)
+            print(
+                f"{key:<42}{results[key]['time_ms']:>12.3f} ms"
+                f"{results[key]['peak_kib']:>12.1f} KiB",
+                flush=True,
+            )
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "fields": args.fields,
+            "assignees": args.assignees,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> List[str]:
+    """기준 대비 허용치를 넘은 항목을 표로 출력하고 그 목록을 반환합니다."""
+    regressions = []
+    print(f"\n{'항목':<42}{'시간 변화':>12}{'메모리 변화':>14}")
+    for key, current in report["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if base is None:
+            print(f"{key:<42}{'(기준 없음)':>12}")
+            continue
+        time_ratio = current["time_ms"] / base["time_ms"] if base["time_ms"] else 1.0
+        mem_ratio = current["peak_kib"] / base["peak_kib"] if base["peak_kib"] else 1.0
+        flag = ""
+        if time_ratio > 1 + time_tolerance or mem_ratio > 1 + memory_tolerance:
+            regressions.append(key)
+            flag = "  ← 회귀"
+        print(f"{key:<42}{time_ratio - 1:>+12.1%}{mem_ratio - 1:>+14.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--fields", type=int, default=5, help="아이템당 필드 수")
+    parser.add_argument("--assignees", type=int, default=10, help="담당자 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="이 이름의 벤치마크만 실행")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준 JSON 경로")
+    parser.add_argument(
+        "--time-tolerance", type=float, default=0.2, help="허용 시간 증가율"
+    )
+    parser.add_argument(
+        "--memory-tolerance", type=float, default=0.1, help="허용 메모리 증가율"
+    )
+    args = parser.parse_args()
+
+    # 서브이슈 검색 등이 남기는 INFO 로그는 측정에서 뺍니다.
+    logging.disable(logging.INFO)
+    report = run(args)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n보고서 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(
+            report, baseline, args.time_tolerance, args.memory_tolerance
+        )
+        if regressions:
+            print(f"\n기준 대비 회귀 {len(regressions)}건: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""벤치마크용 합성 GitHub Project v2 아이템 생성기."""
+
+import datetime
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+# GitHub 조회는 처음 쓸 때 설정을 검증하므로 더미 값을 채워 둡니다.
+os.environ.setdefault("GITHUB_TOKEN", "benchmark")
+os.environ.setdefault("GITHUB_PROJECT_ID", "1")
+os.environ.setdefault("GITHUB_ORG", "benchmark")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STATUSES = ["Daily-Scrum", "Weekly-Planning", "Weekly-Retrospect", "Todo", "Done"]
+
+
+def make_project_items(
+    n_items: int,
+    n_fields: int = 5,
+    n_assignees: int = 10,
+    seed: int = 0,
+    body_size: int = 0,
+    interval_minutes: float = 7,
+) -> List[Dict[str, Any]]:
+    """fetch 결과와 같은 모양의 아이템 노드 리스트를 만듭니다 (최신순).
+
+    body_size를 주면 이슈 본문(body)도 그 길이로 채웁니다. 아이템은
+    interval_minutes 간격으로 과거로 거슬러 올라가며 만들어집니다.
+    """
+    rng = random.Random(seed)
+    logins = [f"user{i}" for i in range(n_assignees)]
+    now = datetime.datetime(2026, 10, 16, 9, 0, tzinfo=datetime.timezone.utc)
+    items = []
+    parents: Dict[str, str] = {}
+    for i in range(n_items):
+        created = now - datetime.timedelta(minutes=i * interval_minutes)
+        date = created.strftime("%y.%m.%d")
+        login = rng.choice(logins)
+        is_parent = i % 20 == 0
+        if is_parent:
+            parents.setdefault(date, f"I_{i}")
+        fields = [
+            {
+                "__typename": "ProjectV2ItemFieldSingleSelectValue",
+                "name": "Daily-Scrum" if is_parent else rng.choice(STATUSES),
+                "field": {"name": "Status"},
+            }
+        ]
+        for f in range(1, n_fields):
+            fields.append(
+                {
+                    "__typename": "ProjectV2ItemFieldTextValue",
+                    "text": f"value {i}-{f}",
+                    "field": {"name": f"Field{f}"},
+                }
+            )
+        content = {
+            "id": f"I_{i}",
+            "title": date if is_parent else f"{date} {login}",
+            "url": f"https://github.com/org/repo/issues/{i}",
+            "assignees": {"nodes": [{"login": login}]},
+        }
+        # 절반은 GitHub 하위 이슈 관계로, 나머지는 제목 접두사로만 묶입니다.
+        if not is_parent and date in parents and i % 2:
+            content["parent"] = {"id": parents[date]}
+            # 일부 하위 이슈는 제목에 날짜 없이 관계로만 묶입니다.
+            if i % 10 == 3:
+                content["title"] = f"{login} 스크럼"
+        if body_size:
+            content["body"] = ("- 오늘 한 일\n- 내일 할 일\n" * body_size)[:body_size]
+        items.append(
+            {
+                "id": f"PVTI_{i}",
+                "isArchived": False,
+                "createdAt": created.isoformat().replace("+00:00", "Z"),
+                "updatedAt": created.isoformat().replace("+00:00", "Z"),
+                "fieldValues": {"nodes": fields},
+                "content": content,
+            }
+        )
+    return items
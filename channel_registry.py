@@ -0,0 +1,185 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional
+
+import discord
+
+from sharding import shard_for_guild
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "channel_registry.json"
+
+# 채널 이름에 포함된 키워드 → 채널 용도
+NAME_KEYWORDS = {
+    "alarm": "alarm",
+    "notice": "notice",
+    "report": "report",
+}
+
+
+class ChannelRegistry:
+    """guild별 용도 채널을 디스크에 저장하고 채널/길드 이벤트로 조금씩 갱신합니다.
+
+    재접속이나 재시작 때는 저장된 항목만 확인하고, 채널 수가 달라졌거나 처음 보는
+    guild만 다시 훑습니다. 전송할 때는 미리 찾아 둔 채널 객체를 그대로 씁니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        self.path = path
+        # guild_id → {"channels": {용도: channel_id}, "channel_count": n}
+        self._guilds: Dict[str, Dict] = {}
+        self._resolved: Dict[str, List[discord.abc.Messageable]] = {}
+        self._client: Optional[discord.Client] = None
+        # 여러 shard가 한꺼번에 준비되면 같은 임시 파일을 겹쳐 쓰므로 하나씩 저장합니다.
+        self._save_lock = asyncio.Lock()
+
+    def load(self) -> None:
+        """디스크에 저장된 레지스트리를 읽습니다."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._guilds = json.load(f).get("guilds", {})
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"채널 레지스트리를 읽을 수 없습니다: {e}")
+            return
+        logger.info(f"채널 레지스트리 로드: guild {len(self._guilds)}개")
+
+    def _save(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"guilds": self._guilds}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    async def persist(self) -> None:
+        async with self._save_lock:
+            try:
+                await asyncio.to_thread(self._save)
+            except OSError as e:
+                logger.error(f"채널 레지스트리 저장 실패: {e}")
+
+    @staticmethod
+    def classify(channel) -> Optional[str]:
+        """봇이 메시지를 보낼 수 있는 텍스트 채널이면 이름으로 용도를 판별합니다."""
+        if not isinstance(channel, discord.TextChannel):
+            return None
+        if not channel.permissions_for(channel.guild.me).send_messages:
+            return None
+        name = channel.name.lower()
+        for keyword, channel_type in NAME_KEYWORDS.items():
+            if keyword in name:
+                return channel_type
+        return None
+
+    def _scan_guild(self, guild: discord.Guild) -> None:
+        channels: Dict[str, int] = {}
+        for channel in guild.text_channels:
+            channel_type = self.classify(channel)
+            if channel_type and channel_type not in channels:
+                channels[channel_type] = channel.id
+                logger.info(
+                    f"[{guild.name}] '{channel.name}' → '{channel_type}' 용도로 자동 등록"
+                )
+        self._guilds[str(guild.id)] = {
+            "channels": channels,
+            "channel_count": len(guild.channels),
+        }
+
+    def _is_valid(self, guild: discord.Guild, entry: Dict) -> bool:
+        if entry.get("channel_count") != len(guild.channels):
+            return False
+        for channel_id in entry.get("channels", {}).values():
+            channel = guild.get_channel(channel_id)
+            if channel is None or self.classify(channel) is None:
+                return False
+        return True
+
+    def sync_guilds(
+        self,
+        client: discord.Client,
+        guilds: Iterable[discord.Guild],
+        shard_id: Optional[int] = None,
+        shard_count: Optional[int] = None,
+    ) -> bool:
+        """현재 guild 목록과 맞춥니다. 바뀐 guild만 다시 훑고 변경 여부를 반환합니다.
+
+        shard_id를 주면 그 shard에 속한 guild만 맞추고 다른 shard 항목은 건드리지 않습니다.
+        """
+        self._client = client
+        changed = False
+        seen = set()
+        for guild in guilds:
+            guild_id = str(guild.id)
+            seen.add(guild_id)
+            entry = self._guilds.get(guild_id)
+            if entry is None or not self._is_valid(guild, entry):
+                self._scan_guild(guild)
+                changed = True
+        for guild_id in set(self._guilds) - seen:
+            if shard_id is not None and shard_count:
+                if shard_for_guild(int(guild_id), shard_count) != shard_id:
+                    continue
+            del self._guilds[guild_id]
+            changed = True
+        self._resolved.clear()
+        return changed
+
+    def add_guild(self, guild: discord.Guild) -> bool:
+        self._scan_guild(guild)
+        self._resolved.clear()
+        return True
+
+    def remove_guild(self, guild: discord.Guild) -> bool:
+        self._resolved.clear()
+        return self._guilds.pop(str(guild.id), None) is not None
+
+    def on_channel_change(self, channel) -> bool:
+        """채널 생성/수정/삭제 후 해당 guild 항목을 갱신합니다."""
+        guild = getattr(channel, "guild", None)
+        if guild is None:
+            return False
+        entry = self._guilds.get(str(guild.id))
+        if entry is None:
+            return self.add_guild(guild)
+
+        channels = entry["channels"]
+        entry["channel_count"] = len(guild.channels)
+        registered = channel.id in channels.values()
+        channel_type = self.classify(channel) if guild.get_channel(channel.id) else None
+
+        if registered and channels.get(channel_type) != channel.id:
+            # 등록된 채널이 삭제·개명·권한 변경되면 그 guild만 다시 훑습니다.
+            self._scan_guild(guild)
+        elif channel_type and channel_type not in channels:
+            channels[channel_type] = channel.id
+            logger.info(
+                f"[{guild.name}] '{channel.name}' → '{channel_type}' 용도로 자동 등록"
+            )
+        else:
+            return False
+        self._resolved.clear()
+        return True
+
+    def channels(self, channel_type: str) -> List[discord.abc.Messageable]:
+        """해당 용도로 등록된 채널 객체 목록 (guild마다 하나)."""
+        resolved = self._resolved.get(channel_type)
+        if resolved is None:
+            resolved = []
+            for entry in self._guilds.values():
+                channel_id = entry["channels"].get(channel_type)
+                if channel_id and self._client is not None:
+                    channel = self._client.get_channel(channel_id)
+                    if channel is not None:
+                        resolved.append(channel)
+            self._resolved[channel_type] = resolved
+        return resolved
+
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        """guild_id → {용도: channel_id} 형태의 사본."""
+        return {
+            guild_id: dict(entry["channels"])
+            for guild_id, entry in self._guilds.items()
+        }
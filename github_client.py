@@ -0,0 +1,324 @@
+import time
+import random
+import asyncio
+import datetime
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+import metrics
+from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# 재시도할 HTTP 상태 코드 (403은 레이트 리밋일 때만 재시도)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class GitHubUnavailableError(Exception):
+    """GitHub 데이터를 신뢰할 수 있게 가져오지 못했음을 나타냅니다.
+
+    호출자는 이 경우 '아무도 작성하지 않음'으로 해석하지 말고 알림을 건너뛰어야 합니다.
+    """
+
+
+class GitHubQueryError(GitHubUnavailableError):
+    """GraphQL 응답에 errors가 포함된 경우 (재시도해도 해결되지 않는 오류)."""
+
+
+class CircuitBreaker:
+    """연속 실패가 임계치를 넘으면 일정 시간 동안 요청을 즉시 실패시킵니다."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인합니다. half-open에서는 시험 요청을 허용합니다."""
+        return self.state != self.OPEN
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info("GitHub 서킷 브레이커 닫힘")
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+                logger.warning(
+                    f"GitHub 서킷 브레이커 열림 ({self.reset_timeout:.0f}초 동안 요청 차단)"
+                )
+            self.opened_at = time.monotonic()
+
+
+class RateLimitState:
+    """응답 헤더와 GraphQL rateLimit 필드에서 읽은 남은 포인트 정보."""
+
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None  # epoch seconds
+        self.last_cost: Optional[int] = None
+        self.total_cost = 0
+
+    def update_from_headers(self, headers) -> None:
+        try:
+            if "X-RateLimit-Limit" in headers:
+                self.limit = int(headers["X-RateLimit-Limit"])
+            if "X-RateLimit-Remaining" in headers:
+                self.remaining = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Reset" in headers:
+                self.reset_at = float(headers["X-RateLimit-Reset"])
+        except ValueError:
+            logger.warning("X-RateLimit 헤더를 해석할 수 없습니다.")
+
+    def update_from_graphql(self, rate_limit: Dict[str, Any]) -> None:
+        if rate_limit.get("limit") is not None:
+            self.limit = rate_limit["limit"]
+        if rate_limit.get("remaining") is not None:
+            self.remaining = rate_limit["remaining"]
+        if rate_limit.get("cost") is not None:
+            self.last_cost = rate_limit["cost"]
+            self.total_cost += rate_limit["cost"]
+        if rate_limit.get("resetAt"):
+            self.reset_at = datetime.datetime.fromisoformat(
+                rate_limit["resetAt"].replace("Z", "+00:00")
+            ).timestamp()
+
+    def seconds_until_reset(self) -> float:
+        if self.reset_at is None:
+            return 0.0
+        return max(0.0, self.reset_at - time.time())
+
+
+class GitHubClient:
+    """커넥션 풀을 공유하는 GitHub GraphQL 클라이언트.
+
+    세션은 봇 수명 동안 하나만 유지되며, keep-alive 커넥션과 DNS 캐시를
+    재사용해 매 요청마다 TCP/TLS 핸드셰이크를 다시 하지 않습니다.
+    graphql()은 레이트 리밋을 추적해 속도를 조절하고, 일시적 오류는 지터가 있는
+    지수 백오프로 재시도하며, 장애가 이어지면 서킷 브레이커로 즉시 실패합니다.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        url: str = GRAPHQL_URL,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        dns_ttl: int = 300,
+        keepalive_timeout: int = 600,
+        total_timeout: int = 30,
+        connect_timeout: int = 10,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        rate_limit_reserve: int = 100,
+        max_rate_wait: float = 60.0,
+        breaker_threshold: int = 5,
+        breaker_reset: float = 120.0,
+    ) -> None:
+        self.url = url
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, sock_connect=connect_timeout
+        )
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limit_reserve = rate_limit_reserve
+        self.max_rate_wait = max_rate_wait
+        self.rate_limit = RateLimitState()
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset)
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "GitHubClient":
+        """Settings의 토큰과 연결 설정으로 클라이언트를 생성합니다."""
+        return cls(
+            settings.github_token or "",
+            url=settings.github_graphql_url or GRAPHQL_URL,
+            **settings.github_client_options,
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    async def start(self) -> None:
+        """세션과 커넥션 풀을 생성합니다. 이미 열려 있으면 아무것도 하지 않습니다."""
+        if not self.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector, headers=self.headers, timeout=self.timeout
+        )
+        logger.info(
+            f"GitHub 클라이언트 시작 (limit={self.limit}, per_host={self.limit_per_host})"
+        )
+
+    async def close(self) -> None:
+        """세션을 닫고 풀에 남은 커넥션을 정리합니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("GitHub 클라이언트 종료")
+        self._session = None
+
+    async def __aenter__(self) -> "GitHubClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def post(self, json: Dict[str, Any]):
+        """GraphQL 엔드포인트로 POST 요청을 보냅니다 (`async with`로 사용)."""
+        if self.closed:
+            raise RuntimeError("GitHub 클라이언트가 시작되지 않았습니다.")
+        return self._session.post(self.url, json=json)
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 0 ~ min(max, base * 2^attempt)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def _pace(self) -> None:
+        """남은 포인트가 예약분 아래면 리셋까지 기다리고, 너무 길면 포기합니다."""
+        remaining = self.rate_limit.remaining
+        if remaining is None or remaining > self.rate_limit_reserve:
+            return
+        wait = self.rate_limit.seconds_until_reset()
+        if wait <= 0:
+            return
+        if wait > self.max_rate_wait:
+            raise GitHubUnavailableError(
+                f"GitHub 레이트 리밋 소진 (남은 포인트 {remaining}, 리셋까지 {wait:.0f}초)"
+            )
+        logger.warning(f"GitHub 레이트 리밋 여유 부족, {wait:.0f}초 대기")
+        await asyncio.sleep(wait)
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_rate_wait)
+            except ValueError:
+                pass
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return min(self.rate_limit.seconds_until_reset(), self.max_rate_wait)
+        return self._backoff(attempt)
+
+    async def graphql(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """GraphQL 요청을 보내고 data를 반환합니다.
+
+        재시도를 모두 소진하거나 서킷이 열려 있으면 GitHubUnavailableError를 던집니다.
+        """
+        if not self.breaker.allow():
+            raise GitHubUnavailableError("GitHub 서킷 브레이커가 열려 있습니다.")
+        await self.start()
+
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+
+        last_error = "알 수 없는 오류"
+        for attempt in range(self.max_retries + 1):
+            await self._pace()
+            self.requests += 1
+            delay = None
+            started = time.perf_counter()
+            status = None
+            try:
+                async with self.post(json=payload) as response:
+                    self.rate_limit.update_from_headers(response.headers)
+                    status = response.status
+                    rate_limited = status == 403 and (
+                        "Retry-After" in response.headers
+                        or response.headers.get("X-RateLimit-Remaining") == "0"
+                    )
+                    if status == 200:
+                        body = await response.read()
+                        metrics.github_response_bytes.observe(len(body))
+                        data = json.loads(body)
+                    elif status in RETRYABLE_STATUSES or rate_limited:
+                        last_error = f"HTTP {status}"
+                        delay = self._retry_delay(response, attempt)
+                    else:
+                        self.failures += 1
+                        self.breaker.record_failure()
+                        raise GitHubUnavailableError(
+                            f"GitHub API 요청 실패: HTTP {status}"
+                        )
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                json.JSONDecodeError,
+            ) as e:
+                last_error = f"{type(e).__name__}: {e}"
+                delay = self._backoff(attempt)
+            finally:
+                metrics.github_request_duration.observe(
+                    time.perf_counter() - started, status=str(status or "error")
+                )
+
+            if delay is None:
+                break
+            if attempt < self.max_retries:
+                self.retries += 1
+                logger.warning(
+                    f"GitHub 요청 실패 ({last_error}), {delay:.1f}초 후 재시도 "
+                    f"({attempt + 1}/{self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+        else:
+            self.failures += 1
+            self.breaker.record_failure()
+            raise GitHubUnavailableError(f"GitHub API 요청 실패: {last_error}")
+
+        self.breaker.record_success()
+        if (data.get("data") or {}).get("rateLimit"):
+            self.rate_limit.update_from_graphql(data["data"]["rateLimit"])
+        if "errors" in data:
+            raise GitHubQueryError(f"GitHub API Error: {data['errors']}")
+        return data.get("data") or {}
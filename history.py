@@ -0,0 +1,221 @@
+import asyncio
+import datetime
+import logging
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "history.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    project TEXT NOT NULL,
+    user TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    date TEXT NOT NULL,
+    submitted_at TEXT,
+    reminded_count INTEGER NOT NULL DEFAULT 0,
+    last_checked TEXT NOT NULL,
+    PRIMARY KEY (project, kind, date, user)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS submissions_by_user
+    ON submissions (user, kind, date);
+CREATE INDEX IF NOT EXISTS submissions_by_date
+    ON submissions (date, kind);
+"""
+
+# 같은 날 여러 번 확인해도 한 줄로 합칩니다. 한 번 제출하면 제출 시각은 유지하고,
+# 리마인드 횟수는 누적합니다.
+UPSERT = """
+INSERT INTO submissions
+    (project, user, kind, date, submitted_at, reminded_count, last_checked)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (project, kind, date, user) DO UPDATE SET
+    submitted_at = COALESCE(submissions.submitted_at, excluded.submitted_at),
+    reminded_count = submissions.reminded_count + excluded.reminded_count,
+    last_checked = excluded.last_checked
+"""
+
+
+def _iso(value: Optional[datetime.datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+class SQLiteStore:
+    """WAL 모드 SQLite 연결 하나를 스레드 간에 나눠 쓰는 저장소의 공통 부분.
+
+    처음 쓸 때 연결하고 SCHEMA를 만듭니다. 쓰기는 스레드로 넘겨 이벤트 루프를
+    막지 않습니다.
+    """
+
+    SCHEMA = ""
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        if self._conn is not None:
+            return
+        conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=5.0
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(self.SCHEMA)
+        self._conn = conn
+        logger.info(f"{type(self).__name__} 열림: {self.path}")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+
+    def _execute(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        self.open()
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _executemany(self, sql: str, rows: List[Tuple]) -> None:
+        """rows를 트랜잭션 하나로 씁니다."""
+        self.open()
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(sql, rows)
+
+
+class HistoryStore(SQLiteStore):
+    """알림 확인 결과(사용자·알림 종류·날짜별 제출 여부)를 SQLite에 쌓는 저장소.
+
+    WAL 모드라 기록 중에도 조회가 막히지 않고, 연속 제출일·주간 준수율·마지막
+    제출 시각을 GitHub API 없이 인덱스 조회로 답합니다.
+    """
+
+    SCHEMA = SCHEMA
+
+    def record_sync(
+        self,
+        project: str,
+        kind: str,
+        date: datetime.date,
+        submissions: Dict[str, Optional[datetime.datetime]],
+        reminded: Iterable[str] = (),
+        checked_at: Optional[datetime.datetime] = None,
+    ) -> None:
+        """확인 한 번의 결과를 기록합니다.
+
+        submissions는 깃허브 아이디 → 제출 시각(미제출이면 None),
+        reminded는 이번에 멘션을 받은 깃허브 아이디입니다.
+        """
+        checked = _iso(checked_at or datetime.datetime.now(datetime.timezone.utc))
+        reminded = {user.lower() for user in reminded}
+        rows = [
+            (
+                project,
+                user.lower(),
+                kind,
+                date.isoformat(),
+                _iso(submitted_at),
+                int(user.lower() in reminded),
+                checked,
+            )
+            for user, submitted_at in submissions.items()
+        ]
+        self._executemany(UPSERT, rows)
+
+    async def record(self, *args, **kwargs) -> None:
+        """record_sync를 스레드에서 실행합니다. 실패해도 알림 흐름은 계속됩니다."""
+        try:
+            await asyncio.to_thread(self.record_sync, *args, **kwargs)
+        except sqlite3.Error as e:
+            logger.error(f"기록 저장 실패: {e}")
+
+    def last_submitted(
+        self, user: str, kind: str, project: Optional[str] = None
+    ) -> Optional[datetime.datetime]:
+        """마지막 제출 시각. 기록이 없으면 None."""
+        sql = (
+            "SELECT submitted_at FROM submissions "
+            "WHERE user = ? AND kind = ? AND submitted_at IS NOT NULL"
+        )
+        params: Tuple = (user.lower(), kind)
+        if project is not None:
+            sql += " AND project = ?"
+            params += (project,)
+        # (user, kind, date) 인덱스를 최근 날짜부터 훑다가 첫 제출에서 멈춥니다.
+        rows = self._execute(sql + " ORDER BY date DESC LIMIT 1", params)
+        return datetime.datetime.fromisoformat(rows[0][0]) if rows else None
+
+    def streak(
+        self,
+        user: str,
+        kind: str,
+        until: Optional[datetime.date] = None,
+        project: Optional[str] = None,
+    ) -> int:
+        """until(포함)부터 거슬러 올라가며 확인된 날마다 연속으로 제출한 횟수.
+
+        확인하지 않은 날(주말·공휴일)은 건너뛰고, 미제출로 기록된 날에서 끊깁니다.
+        """
+        sql = (
+            "SELECT submitted_at IS NOT NULL FROM submissions "
+            "WHERE user = ? AND kind = ? AND date <= ?"
+        )
+        params: Tuple = (
+            user.lower(),
+            kind,
+            (until or datetime.date.today()).isoformat(),
+        )
+        if project is not None:
+            sql += " AND project = ?"
+            params += (project,)
+        sql += " ORDER BY date DESC"
+
+        self.open()
+        count = 0
+        with self._lock:
+            for (submitted,) in self._conn.execute(sql, params):
+                if not submitted:
+                    break
+                count += 1
+        return count
+
+    def compliance(
+        self,
+        start: datetime.date,
+        end: datetime.date,
+        kind: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> Dict[str, Tuple[int, int]]:
+        """기간(양끝 포함) 동안 사용자별 (제출한 날 수, 확인한 날 수)."""
+        sql = (
+            "SELECT user, SUM(submitted_at IS NOT NULL), COUNT(*) FROM submissions "
+            "WHERE date BETWEEN ? AND ?"
+        )
+        params: Tuple = (start.isoformat(), end.isoformat())
+        if kind is not None:
+            sql += " AND kind = ?"
+            params += (kind,)
+        if project is not None:
+            sql += " AND project = ?"
+            params += (project,)
+        sql += " GROUP BY user"
+        return {
+            user: (int(done), int(total))
+            for user, done, total in self._execute(sql, params)
+        }
+
+    def weekly_compliance(
+        self,
+        week_of: datetime.date,
+        kind: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> Dict[str, Tuple[int, int]]:
+        """week_of가 속한 주(월~일)의 사용자별 (제출, 확인) 횟수."""
+        start = week_of - datetime.timedelta(days=week_of.weekday())
+        return self.compliance(start, start + datetime.timedelta(days=6), kind, project)
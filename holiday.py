@@ -1,34 +1,195 @@
-import requests
+import asyncio
 import json
-from dotenv import load_dotenv
 import os
 import datetime
-import xmltodict
-
-
-def is_holiday():
-    load_dotenv()
-    service_key = os.getenv("API_KEY")
-    url = (
-        "http://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService/getRestDeInfo"
-    )
-    now_year = datetime.datetime.now().strftime("%Y")
-    now_month = datetime.datetime.now().strftime("%m")
-    target_date_str = datetime.datetime.now().strftime("%Y%m%d")
-    params = {
-        "serviceKey": service_key,
-        "solYear": now_year,
-        "solMonth": now_month,
+import logging
+from typing import Dict, FrozenSet, Optional, Set
+from xml.parsers.expat import ExpatError
+
+import aiohttp
+
+from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+HOLIDAY_API_URL = (
+    "http://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService/getRestDeInfo"
+)
+DEFAULT_CACHE_PATH = "holiday_cache.json"
+# 임시공휴일 지정 등을 반영하기 위해 캐시된 연도도 이 주기로 다시 받아옵니다.
+DEFAULT_MAX_AGE = datetime.timedelta(days=7)
+
+
+def parse_holiday_dates(xml_text: str) -> Set[str]:
+    """getRestDeInfo XML 응답에서 공휴일 날짜(YYYYMMDD) 집합을 추출합니다."""
+    # 캐시가 있으면 하루 한 번 갱신할 때만 쓰이므로 기동 시에는 불러오지 않습니다.
+    import xmltodict
+
+    try:
+        parsed = xmltodict.parse(xml_text)
+    except ExpatError as e:
+        # 점검 페이지 등 XML이 아닌 본문이 올 때가 있습니다.
+        raise ValueError(f"공휴일 API 응답이 XML이 아닙니다: {e}: {xml_text[:200]}")
+    response = parsed.get("response")
+    if not response:
+        # 인증 실패 등은 OpenAPI_ServiceResponse 형태로 내려옵니다.
+        raise ValueError(f"예상하지 못한 공휴일 API 응답: {xml_text[:200]}")
+
+    header = response.get("header") or {}
+    result_code = header.get("resultCode")
+    if result_code not in (None, "00"):
+        raise ValueError(
+            f"공휴일 API 오류: {result_code} {header.get('resultMsg', '')}"
+        )
+
+    items = (response.get("body") or {}).get("items") or {}
+    item = items.get("item") if isinstance(items, dict) else None
+    if item is None:
+        return set()
+    # 결과가 하나뿐이면 xmltodict는 리스트가 아닌 dict를 돌려줍니다.
+    if isinstance(item, dict):
+        item = [item]
+
+    return {
+        str(entry["locdate"])
+        for entry in item
+        if entry.get("locdate") and entry.get("isHoliday", "Y") == "Y"
     }
-    response = requests.get(url, params=params)
-    decoded_xml = response.content.decode("utf-8")
-    xml_dict = xmltodict.parse(decoded_xml)
-    json_data = json.loads(json.dumps(xml_dict, ensure_ascii=False, indent=4))
-    holiday_dates = [
-        item["locdate"] for item in json_data["response"]["body"]["items"]["item"]
-    ]
-    return target_date_str in holiday_dates
+
+
+class HolidayService:
+    """연도별 공휴일 달력을 디스크에 캐시하고 영업일 여부를 O(1)로 판단합니다."""
+
+    def __init__(
+        self,
+        service_key: Optional[str],
+        cache_path: str = DEFAULT_CACHE_PATH,
+        max_age: datetime.timedelta = DEFAULT_MAX_AGE,
+    ) -> None:
+        self.service_key = service_key
+        self.cache_path = cache_path
+        self.max_age = max_age
+        self._holidays: Dict[int, FrozenSet[datetime.date]] = {}
+        self._fetched_at: Dict[int, datetime.datetime] = {}
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HolidayService":
+        """Settings의 API_KEY, HOLIDAY_CACHE_PATH로 서비스를 생성합니다."""
+        return cls(settings.holiday_api_key, cache_path=settings.holiday_cache_path)
+
+    def load_cache(self) -> None:
+        """디스크 캐시를 메모리로 읽어옵니다. 파일이 없거나 깨졌으면 무시합니다."""
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"공휴일 캐시를 읽을 수 없습니다: {e}")
+            return
+
+        for year, entry in data.get("years", {}).items():
+            self._set_year(
+                int(year),
+                entry.get("dates", []),
+                datetime.datetime.fromisoformat(entry["fetched_at"]),
+            )
+        logger.info(f"공휴일 캐시 로드: {sorted(self._holidays)}")
+
+    def _save_cache(self) -> None:
+        data = {
+            "years": {
+                str(year): {
+                    "fetched_at": self._fetched_at[year].isoformat(),
+                    "dates": sorted(d.strftime("%Y%m%d") for d in dates),
+                }
+                for year, dates in self._holidays.items()
+            }
+        }
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.cache_path)
+
+    def _set_year(self, year: int, dates, fetched_at: datetime.datetime) -> None:
+        self._holidays[year] = frozenset(
+            datetime.datetime.strptime(d, "%Y%m%d").date() for d in dates
+        )
+        self._fetched_at[year] = fetched_at
+
+    async def _fetch_year(self, year: int) -> Set[str]:
+        params = {
+            "serviceKey": self.service_key,
+            "solYear": str(year),
+            "numOfRows": "100",
+        }
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(HOLIDAY_API_URL, params=params) as response:
+                response.raise_for_status()
+                xml_text = await response.text(encoding="utf-8")
+        return parse_holiday_dates(xml_text)
+
+    def _is_stale(self, year: int, now: datetime.datetime) -> bool:
+        fetched_at = self._fetched_at.get(year)
+        return fetched_at is None or now - fetched_at > self.max_age
+
+    async def refresh(self, today: Optional[datetime.date] = None) -> None:
+        """올해(12월에는 내년까지) 달력을 필요할 때만 받아와 캐시에 저장합니다.
+
+        API 호출이 실패하거나 API_KEY가 없으면 기존 캐시를 그대로 사용합니다.
+        """
+        if not self.service_key:
+            logger.warning(
+                "API_KEY가 설정되지 않아 공휴일을 갱신하지 않고 캐시를 사용합니다."
+            )
+            return
+        today = today or datetime.date.today()
+        years = [today.year]
+        if today.month == 12:
+            years.append(today.year + 1)
+
+        async with self._lock:
+            now = datetime.datetime.now()
+            updated = False
+            for year in years:
+                if not self._is_stale(year, now):
+                    continue
+                try:
+                    dates = await self._fetch_year(year)
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    logger.error(f"{year}년 공휴일 조회 실패, 캐시를 사용합니다: {e}")
+                    continue
+                self._set_year(year, dates, now)
+                updated = True
+                logger.info(f"{year}년 공휴일 {len(dates)}건 갱신")
+
+            if updated:
+                try:
+                    await asyncio.to_thread(self._save_cache)
+                except OSError as e:
+                    logger.error(f"공휴일 캐시 저장 실패: {e}")
+
+    def is_holiday(self, date: Optional[datetime.date] = None) -> bool:
+        """해당 날짜가 공휴일인지 확인합니다. 달력이 없는 연도는 평일로 간주합니다."""
+        date = date or datetime.date.today()
+        holidays = self._holidays.get(date.year)
+        if holidays is None:
+            logger.warning(f"{date.year}년 공휴일 정보가 없습니다.")
+            return False
+        return date in holidays
+
+    def is_business_day(self, date: Optional[datetime.date] = None) -> bool:
+        """주말과 공휴일을 제외한 영업일인지 확인합니다."""
+        date = date or datetime.date.today()
+        return date.weekday() < 5 and not self.is_holiday(date)
 
 
 if __name__ == "__main__":
-    print(is_holiday())
+    from settings import get_settings
+
+    service = HolidayService.from_settings(get_settings())
+    service.load_cache()
+    asyncio.run(service.refresh())
+    print(service.is_holiday())
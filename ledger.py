@@ -0,0 +1,182 @@
+import asyncio
+import datetime
+import logging
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from history import DEFAULT_PATH, SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+# 이보다 오래된 창의 전송 기록은 열 때 지웁니다.
+KEEP_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS deliveries (
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    window TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    first_sent TEXT NOT NULL,
+    last_sent TEXT NOT NULL,
+    send_count INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (guild_id, channel_id, project, kind, window, user_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS deliveries_by_window ON deliveries (window);
+"""
+
+UPSERT = """
+INSERT INTO deliveries
+    (guild_id, channel_id, project, kind, window, user_id, first_sent, last_sent)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (guild_id, channel_id, project, kind, window, user_id) DO UPDATE SET
+    last_sent = excluded.last_sent,
+    send_count = deliveries.send_count + 1
+"""
+
+
+class DeliveryLedger(SQLiteStore):
+    """채널·사용자·알림 종류·창(날짜)별로 멘션을 보낸 기록을 남기는 원장.
+
+    알림을 보내기 전에 pending()으로 재멘션 간격이 지난 사용자만 고르고, 보낸
+    뒤 mark_sent()로 기록합니다. 디스크에 남으므로 알림 도중 재시작해도 같은
+    사용자를 다시 멘션하지 않습니다.
+    """
+
+    SCHEMA = SCHEMA
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        reping_minutes: Optional[Dict[str, float]] = None,
+        max_pings: int = 0,
+    ) -> None:
+        super().__init__(path)
+        # 알림 종류 → 재멘션 간격(분). 같은 창에서 이 간격 안에 다시 확인하면 (재시작
+        # 직후 같은 회차를 다시 돌리는 경우 포함) 이미 멘션한 사용자는 건너뜁니다.
+        # 없는 종류는 확인할 때마다 멘션합니다.
+        self.reping_minutes = dict(reping_minutes or {})
+        # 0이면 창마다 멘션 횟수를 제한하지 않습니다.
+        self.max_pings = max_pings
+
+    def open(self) -> None:
+        if self._conn is not None:
+            return
+        super().open()
+        cutoff = datetime.date.today() - datetime.timedelta(days=KEEP_DAYS)
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM deliveries WHERE window < ?", (cutoff.isoformat(),)
+            )
+
+    def pending_sync(
+        self,
+        guild_id: int,
+        channel_id: int,
+        project: str,
+        kind: str,
+        window: str,
+        user_ids: Iterable[str],
+        now: datetime.datetime,
+    ) -> List[str]:
+        """user_ids 중 이 채널에서 지금 멘션해도 되는 사용자를 순서대로 돌려줍니다."""
+        sent = {
+            user_id: (datetime.datetime.fromisoformat(last_sent), count)
+            for user_id, last_sent, count in self._execute(
+                "SELECT user_id, last_sent, send_count FROM deliveries "
+                "WHERE guild_id = ? AND channel_id = ? AND project = ? "
+                "AND kind = ? AND window = ?",
+                (guild_id, channel_id, project, kind, window),
+            )
+        }
+        interval = datetime.timedelta(minutes=self.reping_minutes.get(kind, 0.0))
+        due = []
+        for user_id in user_ids:
+            if user_id in sent:
+                last_sent, count = sent[user_id]
+                if now - last_sent < interval:
+                    continue
+                if self.max_pings and count >= self.max_pings:
+                    continue
+            due.append(user_id)
+        return due
+
+    def delivered_sync(
+        self,
+        guild_id: int,
+        channel_id: int,
+        project: str,
+        kind: str,
+        window: str,
+        user_id: str,
+    ) -> bool:
+        """이 채널에서 같은 창에 user_id로 이미 보낸 기록이 있는지 여부."""
+        return bool(
+            self._execute(
+                "SELECT 1 FROM deliveries WHERE guild_id = ? AND channel_id = ? "
+                "AND project = ? AND kind = ? AND window = ? AND user_id = ?",
+                (guild_id, channel_id, project, kind, window, user_id),
+            )
+        )
+
+    def mark_sent_sync(
+        self,
+        guild_id: int,
+        channel_id: int,
+        project: str,
+        kind: str,
+        window: str,
+        user_ids: Iterable[str],
+        now: datetime.datetime,
+    ) -> None:
+        sent_at = now.isoformat()
+        self._executemany(
+            UPSERT,
+            [
+                (guild_id, channel_id, project, kind, window, user_id, sent_at, sent_at)
+                for user_id in user_ids
+            ],
+        )
+
+    async def pending(
+        self,
+        guild_id: int,
+        channel_id: int,
+        project: str,
+        kind: str,
+        window: str,
+        user_ids: List[str],
+        now: datetime.datetime,
+    ) -> List[str]:
+        """pending_sync를 스레드에서 실행합니다. 원장을 못 읽으면 모두 멘션합니다."""
+        try:
+            return await asyncio.to_thread(
+                self.pending_sync,
+                guild_id,
+                channel_id,
+                project,
+                kind,
+                window,
+                user_ids,
+                now,
+            )
+        except sqlite3.Error as e:
+            logger.error(f"전송 기록 조회 실패: {e}")
+            return list(user_ids)
+
+    async def delivered(self, *args) -> bool:
+        """delivered_sync를 스레드에서 실행합니다. 원장을 못 읽으면 보내지 않은 것으로 봅니다."""
+        try:
+            return await asyncio.to_thread(self.delivered_sync, *args)
+        except sqlite3.Error as e:
+            logger.error(f"전송 기록 조회 실패: {e}")
+            return False
+
+    async def mark_sent(self, *args, **kwargs) -> None:
+        """mark_sent_sync를 스레드에서 실행합니다. 실패해도 알림 흐름은 계속됩니다."""
+        try:
+            await asyncio.to_thread(self.mark_sent_sync, *args, **kwargs)
+        except sqlite3.Error as e:
+            logger.error(f"전송 기록 저장 실패: {e}")
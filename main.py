@@ -1,35 +1,62 @@
+import asyncio
 import discord
-from typing import Dict, List
+import functools
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from discord.ext import commands, tasks
-from threading import Thread
-from dotenv import load_dotenv
-import os
 import datetime
-from holiday import is_holiday
+from holiday import HolidayService
+from history import HistoryStore
+from ledger import DeliveryLedger
+from mentions import MentionResolver
 import logging
-import json
+from github_client import GitHubClient, GitHubUnavailableError
+from rules import (
+    ANNOUNCE,
+    CHECK_SUB_ISSUES,
+    DEFAULT_RULES_PATH,
+    ReminderRule,
+    load_rules,
+)
+from scheduler import KST, ReminderScheduler
+import metrics
+from channel_registry import ChannelRegistry
+from settings import get_settings
+from sharding import (
+    ShardConfig,
+    channel_guild_id,
+    create_bot,
+    describe_channel,
+    fan_out,
+    gateway_options,
+)
 from tracking import (
-    fetch_github_project_issues,
-    is_target_issue,
-    check_issue_created_by_users,
-    get_daily_scrum_sub_issues,
-    get_today_date_str,
+    Project,
+    get_projects,
+    project_snapshot,
+    dump_project_snapshot,
+    fetch_reminder_items,
+    set_github_client,
 )
 
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-load_dotenv(override=True)
-channel_map = {}
-
-
-bot_token = os.getenv("BOT_TOKEN")
-
-bot = commands.Bot(command_prefix="!", intents=discord.Intents.all(), help_command=None)
+# .env와 환경 변수는 여기서 한 번만 읽습니다 (GitHub 값 검증은 처음 조회할 때).
+settings = get_settings()
+
+# SHARDING / SHARD_COUNT / SHARD_IDS가 있으면 AutoShardedBot으로 띄웁니다.
+shard_config = ShardConfig.from_settings(settings)
+# LOW_MEMORY면 필요한 intents만 받고 멤버 청킹·메시지 캐시를 끕니다.
+bot = create_bot(
+    shard_config,
+    command_prefix="!",
+    help_command=None,
+    **gateway_options(settings.low_memory),
+)
+# USER_MAP에 ID 대신 사용자명이 있으면 멘션할 때 그 길드에서 찾습니다.
+mention_resolver = MentionResolver()
 
-IS_HOLIDAY = None
-USER_MAP = json.loads(os.getenv("USER_MAP", "{}"))
+holiday_service = HolidayService.from_settings(settings)
 
 
 @bot.command()
@@ -43,7 +70,7 @@ async def 공지(ctx):
         title="📢 최신 공지사항",
         description="공지 내용을 확인하세요!",
         color=0x00BFFF,
-        url=os.getenv("NOTION"),
+        url=settings.links["NOTION"],
     )
     await ctx.send(embed=embed)
 
@@ -54,7 +81,7 @@ async def 서비스(ctx):
         title="탐나라 서비스 접속",
         description="서비스에 접속하세요!",
         color=0x00BFFF,
-        url=os.getenv("SERVICE"),
+        url=settings.links["SERVICE"],
     )
     await ctx.send(embed=embed)
 
@@ -65,131 +92,132 @@ async def 피드백(ctx):
         title="피드백 확인",
         description="피드백을 확인하세요!",
         color=0x00BFFF,
-        url=os.getenv("FEEDBACK"),
+        url=settings.links["FEEDBACK"],
     )
     await ctx.send(embed=embed)
 
 
-channel_map = {}  # guild_id → {channel_type: channel_id}
+@bot.command(name="debug")
+@commands.has_permissions(administrator=True)
+async def debug(ctx):
+    index = await project_snapshot.get()
+    path = await dump_project_snapshot(index)
+    await ctx.send(f"프로젝트 스냅샷 {len(index)}건을 `{path}`에 저장했습니다.")
+
+
+# guild별 용도 채널 (디스크에 저장되고 채널/길드 이벤트로 갱신됨)
+channel_registry = ChannelRegistry(settings.channel_registry_path)
+# 사용자·알림 종류·날짜별 제출 기록 (HISTORY_DB_PATH를 비우면 사용 안 함)
+history = HistoryStore(settings.history_db_path) if settings.history_db_path else None
+# 알림 규칙은 reminders.toml(REMINDER_RULES_PATH)에서 한 번만 읽어 검증합니다.
+reminder_rules = load_rules(
+    settings.reminder_rules_path or DEFAULT_RULES_PATH, settings.links
+)
+
+
+def reping_minutes(rules: List[ReminderRule]) -> Dict[str, float]:
+    """알림 종류별 재멘션 간격(분).
+
+    규칙의 reping_minutes < REMINDER_REPING_MINUTES 숫자(불러온 모든 종류) <
+    REMINDER_REPING_MINUTES JSON의 종류별 값 순으로 덮어씁니다.
+    """
+    minutes = {r.kind: r.reping_minutes for r in rules if r.reping_minutes is not None}
+    if settings.reping_minutes_all is not None:
+        minutes.update({r.kind: settings.reping_minutes_all for r in rules})
+    minutes.update(settings.reping_minutes)
+    return minutes
+
+
+# 채널·사용자·알림 종류·날짜별 멘션 전송 기록 (재시작해도 같은 회차에 다시 멘션하지 않음)
+ledger = (
+    DeliveryLedger(
+        settings.delivery_ledger_path,
+        reping_minutes(reminder_rules),
+        settings.reminder_max_pings,
+    )
+    if settings.delivery_ledger_path
+    else None
+)
 
 
 @bot.event
 async def on_ready():
-    print(f"🤖 봇 로그인: {bot.user}")
-
-    name_keywords = {
-        "alarm": "alarm",
-        "notice": "notice",
-        "report": "report",
-    }
-
-    for guild in bot.guilds:
-        guild_id = str(guild.id)
-        if guild_id not in channel_map:
-            channel_map[guild_id] = {}
-
-        for channel in guild.text_channels:
-            if not channel.permissions_for(guild.me).send_messages:
-                continue
-
-            for keyword, channel_type in name_keywords.items():
-                if keyword in channel.name.lower():
-                    if channel_type not in channel_map[guild_id]:
-                        channel_map[guild_id][channel_type] = channel.id
-                        print(
-                            f"[{guild.name}] '{channel.name}' → '{channel_type}' 용도로 자동 등록"
-                        )
-    if not alarm.is_running():
-        alarm.start()
+    print(f"🤖 봇 로그인: {bot.user} ({shard_config.describe()})")
+
+    # 샤딩 모드에서는 on_shard_ready가 shard마다 채널을 맞춥니다.
+    if not shard_config.enabled and channel_registry.sync_guilds(bot, bot.guilds):
+        await channel_registry.persist()
     if not refresh_holiday.is_running():
         refresh_holiday.start()
-    if not check_github_weekly_plan.is_running():
-        check_github_weekly_plan.start()
-    if not check_github_weekly_retrospect.is_running():
-        check_github_weekly_retrospect.start()
-    if not check_github_daily_scrum.is_running():
-        check_github_daily_scrum.start()
+    if not scheduler.is_running():
+        scheduler.start()
+
+
+@bot.event
+async def on_shard_ready(shard_id):
+    guilds = [guild for guild in bot.guilds if guild.shard_id == shard_id]
+    logger.info(f"shard {shard_id} 준비 완료: guild {len(guilds)}개")
+    if channel_registry.sync_guilds(bot, guilds, shard_id, bot.shard_count):
+        await channel_registry.persist()
+
+
+@bot.event
+async def on_guild_join(guild):
+    if channel_registry.add_guild(guild):
+        await channel_registry.persist()
+
+
+@bot.event
+async def on_guild_remove(guild):
+    if channel_registry.remove_guild(guild):
+        await channel_registry.persist()
+
+
+@bot.event
+async def on_guild_channel_create(channel):
+    if channel_registry.on_channel_change(channel):
+        await channel_registry.persist()
+
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    if channel_registry.on_channel_change(after):
+        await channel_registry.persist()
+
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    if channel_registry.on_channel_change(channel):
+        await channel_registry.persist()
 
 
 @tasks.loop(hours=24)
 async def refresh_holiday():
-    global IS_HOLIDAY
-    IS_HOLIDAY = is_holiday()
+    with metrics.job_duration.time(job="공휴일 갱신"):
+        await holiday_service.refresh()
 
 
-@tasks.loop(minutes=1)
-async def alarm():
-    now = datetime.datetime.now()
-    current_time = now.strftime("%Y-%m-%d %H:%M:%S")
-    if now.weekday() < 5 and now.hour == 9 and now.minute == 5 and not IS_HOLIDAY:
-        logger.info(f"[{current_time}] 데일리 스크럼 알림 시작")
-        description_text = "스크럼을 `09:10` 까지 작성해주세요!. \n\n Status : `Daily-Scrum` \n Title : `XX.XX.XX 이름` 형식으로 작성해주세요! \n `assignee` 할당해주세요!"
-        link_text = f"스크럼 작성하러 가기:{os.getenv('DAILY_SCRUM')}"
-        link_label, url = link_text.split(":", 1)
-
-        embed = discord.Embed(
-            title="** 📢 데일리 스크럼 ** ",
-            description=(f"{description_text}\n\n" f"🔗 [{link_label}]({url})"),
-            color=0x00BFFF,
-        )
-        for guild_id, channels in channel_map.items():
-            alarm_id = channels.get("alarm")
-            if alarm_id:
-                channel = bot.get_channel(alarm_id)
-                logger.info(
-                    f"[{current_time}] 채널 {channel.name if channel else 'None'} 확인 중..."
-                )
-                if channel:
-                    logger.info(f"[{current_time}] 데일리 스크럼 알림 전송 중...")
-                    await channel.send(content="@everyone", embed=embed)
-                    logger.info(f"[{current_time}] 데일리 스크럼 알림 전송 완료")
-
-    if now.weekday() == 0 and now.hour == 10 and now.minute == 0 and not IS_HOLIDAY:
-        logger.info(f"[{current_time}] 주간 계획 알림 시작")
-        description_text = "계획 문서를 작성해주세요! \n\n Status : `Weekly-Planning` \n Title : `XX.XX.XX 이름` 형식으로 작성해주세요! \n `assignee` 할당해주세요!"
-        link_text = f"계획 작성하러 가기:{os.getenv('WEEK_PLANNING')}"
-        link_label, url = link_text.split(":", 1)
-
-        embed = discord.Embed(
-            title="** 📢 주간 계획 ** ",
-            description=(f"{description_text}\n\n" f"🔗 [{link_label}]({url})"),
-            color=0x00BFFF,
-        )
-        for guild_id, channels in channel_map.items():
-            alarm_id = channels.get("alarm")
-            if alarm_id:
-                channel = bot.get_channel(alarm_id)
-                logger.info(
-                    f"[{current_time}] 채널 {channel.name if channel else 'None'} 확인 중..."
-                )
-                if channel:
-                    logger.info(f"[{current_time}] 주간 계획 알림 전송 중...")
-                    await channel.send(content="@everyone", embed=embed)
-                    logger.info(f"[{current_time}] 주간 계획 알림 전송 완료")
-
-    if now.weekday() == 3 and now.hour == 10 and now.minute == 0 and not IS_HOLIDAY:
-        logger.info(f"[{current_time}] 주간 회고 알림 시작")
-        description_text = "회고 문서를 작성해주세요! \n\n Status : `Weekly-Retrospect`, \n Title : `XX.XX.XX 이름` 형식으로 작성해주세요! \n `assignee` 할당해주세요!"
-        link_text = f"회고 작성하러 가기:{os.getenv('WEEK_RETROSPECT')}"
-        link_label, url = link_text.split(":", 1)
-
-        embed = discord.Embed(
-            title="** 📢 주간 회고 ** ",
-            description=(f"{description_text}\n\n" f"🔗 [{link_label}]({url})"),
-            color=0x00BFFF,
+async def warm_snapshot(project: Project, max_age: float) -> None:
+    """스냅샷이 max_age보다 오래됐으면 미리 동기화합니다. 실패는 다음 주기로 미룹니다."""
+    try:
+        await project.snapshot.get(max_age=max_age)
+    except GitHubUnavailableError as e:
+        logger.warning(
+            f"[{project.name}] 스냅샷 미리 받기 실패, 다음 주기에 재시도: {e}"
         )
+    except Exception:
+        logger.exception(f"[{project.name}] 스냅샷 미리 받기 중 오류 발생")
 
-        for guild_id, channels in channel_map.items():
-            alarm_id = channels.get("alarm")
-            if alarm_id:
-                channel = bot.get_channel(alarm_id)
-                logger.info(
-                    f"[{current_time}] 채널 {channel.name if channel else 'None'} 확인 중..."
-                )
-                if channel:
-                    logger.info(f"[{current_time}] 주간 회고 알림 전송 중...")
-                    await channel.send(content="@everyone", embed=embed)
-                    logger.info(f"[{current_time}] 주간 회고 알림 전송 완료")
+
+@tasks.loop(seconds=60)
+async def warm_project_snapshots():
+    """프로젝트 스냅샷을 시작하자마자 받아 두고 만료되기 전에 이어서 갱신합니다.
+
+    !현황이 GitHub 왕복을 기다리지 않게 하고, 웹훅을 쓸 때는 웹훅이 반영될 저장소와
+    확인 규칙이 읽는 스냅샷을 준비해 둡니다.
+    """
+    max_age = warm_project_snapshots.seconds
+    await asyncio.gather(*(warm_snapshot(p, max_age) for p in get_projects()))
 
 
 @bot.command(name="도움말", aliases=["help"])
@@ -218,6 +246,13 @@ async def 도움말(ctx):
         inline=False,
     )
 
+    embed.add_field(
+        name="`!현황 [스크럼|계획|회고] [--refresh]`",
+        value="데일리 스크럼·주간 계획·주간 회고 미제출자를 보여줍니다. "
+        "`--refresh`를 붙이면 GitHub에서 새로 가져옵니다.",
+        inline=False,
+    )
+
     embed.add_field(
         name="`!도움말` 또는 `!help`",
         value="이 도움말 메시지를 보여줍니다.",
@@ -234,143 +269,559 @@ def get_unsubmitted_user_ids(
     for user, created in result.items():
         if not created:
             mention = user_map.get(user, "")
-            ids.append(mention)
+            if mention:
+                ids.append(mention)
     return ids
 
 
-@tasks.loop(hours=1)
-async def check_github_weekly_plan():
+DISCORD_MESSAGE_LIMIT = 2000
+# coalesced: 채널마다 멘션을 모아 한 번에 전송, individual: 사용자마다 따로 전송
+REMINDER_MODE = settings.reminder_mode
+
+
+def group_mentions(
+    mentions: List[str], limit: int = DISCORD_MESSAGE_LIMIT
+) -> List[List[str]]:
+    """멘션들을 공백으로 이었을 때 메시지 길이 제한을 넘지 않도록 묶습니다."""
+    groups = []
+    current: List[str] = []
+    length = 0
+    for mention in mentions:
+        token_length = len(f"<@{mention}>")
+        if current and length + 1 + token_length > limit:
+            groups.append(current)
+            current, length = [], 0
+        length += token_length + (1 if current else 0)
+        current.append(mention)
+    if current:
+        groups.append(current)
+    return groups
+
+
+async def send_mention_reminder(
+    mentions: List[str],
+    embed: discord.Embed,
+    channels: List[discord.abc.Messageable],
+    project: Optional[str] = None,
+    kind: Optional[str] = None,
+    now: Optional[datetime.datetime] = None,
+) -> Set[str]:
+    """미작성자 멘션을 채널마다 전송합니다. 임베드는 첫 메시지에만 붙입니다.
+
+    kind를 주면 전송 기록을 보고 재멘션 간격이 지난 사용자만 멘션하고, 메시지를
+    보낼 때마다 기록합니다. 창은 now의 날짜입니다. 한 채널에라도 실제로 멘션이
+    나간 mentions 값의 집합을 돌려줍니다.
+    """
+    mentioned: Set[str] = set()
+    if not mentions:
+        return mentioned
+    use_ledger = ledger is not None and kind is not None
+    if use_ledger:
+        now = now or datetime.datetime.now(KST)
+        key = (project or "default", kind, now.date().isoformat())
+
+    async def send(channel):
+        guild_id = channel_guild_id(channel) or 0
+        resolved = await mention_resolver.resolve(channel.guild, mentions)
+        user_ids = list(resolved.values())
+        pending = user_ids
+        if use_ledger:
+            pending = await ledger.pending(guild_id, channel.id, *key, user_ids, now)
+            skipped = len(user_ids) - len(pending)
+            if skipped:
+                metrics.reminder_mentions_skipped.inc(skipped, kind=kind)
+                logger.info(
+                    f"[{describe_channel(channel)}] {kind}: "
+                    f"최근에 멘션한 {skipped}명은 건너뜁니다."
+                )
+        if REMINDER_MODE == "individual":
+            groups = [[mention] for mention in pending]
+        else:
+            groups = group_mentions(pending)
+        for i, group in enumerate(groups):
+            content = " ".join(f"<@{mention}>" for mention in group)
+            if i == 0 or REMINDER_MODE == "individual":
+                await channel.send(content=content, embed=embed)
+            else:
+                await channel.send(content=content)
+            sent = set(group)
+            mentioned.update(m for m, user_id in resolved.items() if user_id in sent)
+            if use_ledger:
+                await ledger.mark_sent(guild_id, channel.id, *key, group, now)
+
+    await fan_out(channels, send, bot.shard_count)
+    return mentioned
+
+
+def peer_channels(channel_type: str) -> List[discord.PartialMessageable]:
+    """다른 shard 프로세스가 찾아 둔 채널을 PartialMessageable로 돌려줍니다.
+
+    게이트웨이로 연결되지 않은 guild에도 메시지는 REST로 보낼 수 있습니다.
+    레지스트리 파일은 각 프로세스가 바꿀 때마다 새로 쓰므로 부를 때마다 읽습니다.
+    """
+    channels = []
+    for path in settings.channel_registry_peers:
+        peer = ChannelRegistry(path)
+        peer.load()
+        for guild_id, entry in peer.as_dict().items():
+            channel_id = entry.get(channel_type)
+            if channel_id:
+                channels.append(
+                    bot.get_partial_messageable(channel_id, guild_id=int(guild_id))
+                )
+    return channels
+
+
+def project_channels(project: Project) -> List[discord.abc.Messageable]:
+    """프로젝트에 지정된 채널을, 지정이 없으면 모든 알림 채널을 반환합니다.
+
+    shard 프로세스가 여럿이면 다른 프로세스가 맡은 guild의 채널도 포함합니다.
+    """
+    if not project.config.channel_ids:
+        return channel_registry.channels("alarm") + peer_channels("alarm")
+    channels = []
+    for channel_id in project.config.channel_ids:
+        channel = bot.get_channel(channel_id)
+        if channel is None and settings.channel_registry_peers:
+            # 다른 shard 프로세스의 guild일 수 있으니 REST로 보냅니다.
+            channel = bot.get_partial_messageable(channel_id)
+        if channel is None:
+            logger.warning(f"[{project.name}] 채널 {channel_id}을 찾을 수 없습니다.")
+        else:
+            channels.append(channel)
+    return channels
+
+
+async def for_each_project(check: Callable[[Project], Awaitable[None]]) -> None:
+    """프로젝트마다 check를 동시에 실행합니다.
+
+    동시에 도는 수는 GITHUB_PROJECT_CONCURRENCY로 제한해, 팀을 늘려도 틱마다
+    지연이 직렬로 쌓이지 않으면서 GitHub 레이트 리밋을 한꺼번에 소모하지 않습니다.
+    """
+    semaphore = asyncio.Semaphore(settings.project_concurrency)
+
+    async def run(project: Project) -> None:
+        async with semaphore:
+            await check(project)
+
+    await asyncio.gather(*(run(project) for project in get_projects()))
+
+
+async def load_reminder_index(project: Project, rule: ReminderRule, today: str):
+    """웹훅을 쓰면 웹훅이 최신으로 유지하는 스냅샷을 읽습니다.
+
+    웹훅 없이는 스냅샷이 신선할 때만 그대로 쓰고, 아니면 알림 전용 쿼리로 필요한
+    아이템만 받습니다.
+    """
+    if settings.github_webhook_secret or project.snapshot.is_fresh():
+        return await project.snapshot.get()
+    return await fetch_reminder_items(
+        rule.kind,
+        rule.filter_query(today),
+        project,
+        follow_sub_issues=rule.check == CHECK_SUB_ISSUES,
+    )
+
+
+async def record_history(
+    project: Project,
+    kind: str,
+    now: datetime.datetime,
+    submissions: Dict[str, Optional[datetime.datetime]],
+    mentioned: Set[str],
+):
+    """확인 결과를 기록합니다.
+
+    mentioned는 send_mention_reminder가 실제로 멘션한 USER_MAP 값입니다. 재멘션
+    간격에 걸려 건너뛰었거나 전송에 실패한 사용자는 리마인드 횟수가 늘지 않습니다.
+    """
+    if history is None:
+        return
+    reminded = [
+        user
+        for user, submitted_at in submissions.items()
+        if submitted_at is None and project.user_map.get(user) in mentioned
+    ]
+    await history.record(project.name, kind, now.date(), submissions, reminded, now)
+
+
+async def announce(rule: ReminderRule, now: datetime.datetime):
+    """알림 채널마다 @everyone과 규칙의 임베드를 보냅니다.
+
+    now는 예정 실행 시각입니다. 전송 기록에 (알림 종류, 실행 시각)으로 남겨, 재시작
+    직후 유예 시간 안의 같은 회차를 다시 실행해도 이미 보낸 채널은 건너뜁니다.
+    """
+    current_time = now.strftime("%Y-%m-%d %H:%M:%S")
+    logger.info(f"[{current_time}] {rule.name} 시작")
+    window = now.isoformat()
+    skipped = 0
+
+    async def send(channel):
+        nonlocal skipped
+        key = (channel_guild_id(channel) or 0, channel.id, ANNOUNCE, rule.kind, window)
+        if ledger is not None and await ledger.delivered(*key, "@everyone"):
+            skipped += 1
+            return
+        await channel.send(content="@everyone", embed=rule.embed)
+        if ledger is not None:
+            await ledger.mark_sent(*key, ["@everyone"], datetime.datetime.now(KST))
+
+    sent = await fan_out(channel_registry.channels("alarm"), send)
+    logger.info(
+        f"[{current_time}] {rule.name} 전송 완료: 채널 {sent - skipped}개"
+        + (f" (이미 보낸 {skipped}개 건너뜀)" if skipped else "")
+    )
+
+
+async def check_project(rule: ReminderRule, project: Project, now: datetime.datetime):
+    """프로젝트 하나에서 미작성자를 찾아 멘션하고 결과를 기록합니다."""
     try:
-        now = datetime.datetime.now()
         current_time = now.strftime("%Y-%m-%d %H:%M:%S")
-        if not (
-            now.weekday() == 0
-            and now.hour >= 10
-            and now.hour <= 13
-            and now.minute == 0
-            and not IS_HOLIDAY
-        ):
-            return
-        logger.info(f"[{current_time}] 주간 계획 체크 시작")
-        issues = await fetch_github_project_issues()
-        target_issues = [
-            item for item in issues if is_target_issue(item, "Weekly-Planning")
-        ]
-        logger.info(f"[{current_time}] [주간 계획] 대상 이슈 수: {len(target_issues)}")
-        result = check_issue_created_by_users(target_issues, USER_MAP)
-        mentions = get_unsubmitted_user_ids(result, USER_MAP)
-        logger.info(f"[{current_time}] [주간 계획] 미작성자 수: {len(mentions)}")
-        description_text = "계획 문서를 작성해주세요! \n\n Status : `Weekly-Planning`, \n Title : `XX.XX.XX 이름` 형식으로 작성해주세요! \n `assignee` 할당해주세요!"
-        link_text = f"계획 작성하러 가기:{os.getenv('WEEK_PLANNING')}"
-        link_label, url = link_text.split(":", 1)
-        for mention in mentions:
-            embed = discord.Embed(
-                title="📢 주간 계획 미작성 알림",
-                description=(f"{description_text}\n\n" f"🔗 [{link_label}]({url})"),
-                color=discord.Color.red(),
-            )
-            for guild_id, channels in channel_map.items():
-                channel_id = channels.get("alarm")
-                if channel_id:
-                    channel = bot.get_channel(channel_id)
-                    if channel:
-                        await channel.send(content=f"<@{mention}>", embed=embed)
+        today = now.strftime("%y.%m.%d")
+        logger.info(f"[{current_time}] [{project.name}] {rule.name} 시작")
+        index = await load_reminder_index(project, rule, today)
+        submissions = await rule.evaluate(index, project.user_map, today)
+        result = {user: at is not None for user, at in submissions.items()}
+        mentions = get_unsubmitted_user_ids(result, project.user_map)
+        logger.info(
+            f"[{current_time}] [{project.name}] {rule.name}: "
+            f"대상 {len(submissions)}명, 미작성자 {len(mentions)}명"
+        )
+        mentioned = await send_mention_reminder(
+            mentions,
+            rule.embed,
+            project_channels(project),
+            project.name,
+            rule.kind,
+            now,
+        )
+        await record_history(project, rule.kind, now, submissions, mentioned)
+    except GitHubUnavailableError as e:
+        # 데이터를 못 가져온 것을 '아무도 작성 안 함'으로 보고 전원을 멘션하지 않습니다.
+        logger.warning(
+            f"[{rule.name}] [{project.name}] GitHub 데이터를 가져올 수 없어 "
+            f"알림을 건너뜁니다: {e}"
+        )
     except Exception:
-        logger.exception("check_github_weekly_plan 실행 중 오류 발생")
+        logger.exception(f"[{project.name}] {rule.name} 중 오류 발생")
 
 
-@tasks.loop(hours=1)
-async def check_github_weekly_retrospect():
+async def run_rule(rule: ReminderRule, now: datetime.datetime):
+    """모든 알림 규칙이 거치는 디스패처. 공휴일이면 아무것도 하지 않습니다."""
     try:
-        now = datetime.datetime.now()
-        current_time = now.strftime("%Y-%m-%d %H:%M:%S")
-        if not (
-            now.weekday() == 3
-            and now.hour >= 10
-            and now.hour <= 16
-            and now.minute == 0
-            and not IS_HOLIDAY
-        ):
+        if holiday_service.is_holiday(now.date()):
             return
-        logger.info(f"[{current_time}] 주간 회고 체크 시작")
-        issues = await fetch_github_project_issues()
-        target_issues = [
-            item for item in issues if is_target_issue(item, "Weekly-Retrospect")
-        ]
-        logger.info(f"[{current_time}] [주간 회고] 대상 이슈 수: {len(target_issues)}")
-        result = check_issue_created_by_users(target_issues, USER_MAP)
-        mentions = get_unsubmitted_user_ids(result, USER_MAP)
-        logger.info(f"[{current_time}] [주간 회고] 미작성자 수: {len(mentions)}")
-        description_text = "회고 문서를 작성해주세요! \n\n Status : `Weekly-Restrospect`, \n Title : `XX.XX.XX 이름` 형식으로 작성해주세요! \n `assignee` 할당해주세요!"
-        link_text = f"회고 작성하러 가기:{os.getenv('WEEK_RETROSPECT')}"
-        link_label, url = link_text.split(":", 1)
-        for mention in mentions:
-            embed = discord.Embed(
-                title="📢 주간 회고 미작성 알림",
-                description=(f"{description_text}\n\n" f"🔗 [{link_label}]({url})"),
-                color=discord.Color.red(),
-            )
-            for guild_id, channels in channel_map.items():
-                channel_id = channels.get("alarm")
-                if channel_id:
-                    channel = bot.get_channel(channel_id)
-                    if channel:
-                        await channel.send(content=f"<@{mention}>", embed=embed)
+        if rule.action == ANNOUNCE:
+            await announce(rule, now)
+        else:
+            await for_each_project(lambda project: check_project(rule, project, now))
     except Exception:
-        logger.exception("check_github_weekly_retrospect 실행 중 오류 발생")
+        logger.exception(f"{rule.name} 실행 중 오류 발생")
+
+
+# 매 분 깨어나 시각을 비교하는 대신, 다음 실행 시각까지 잠드는 스케줄러 (KST 기준)
+scheduler = ReminderScheduler(tz=KST)
+for reminder_rule in reminder_rules:
+    if reminder_rule.action != ANNOUNCE and not settings.reminder_checks:
+        # shard 프로세스가 여럿이면 GitHub 확인은 코디네이터 프로세스만 돌립니다.
+        continue
+    scheduler.add_job(
+        reminder_rule.name,
+        reminder_rule.cron,
+        functools.partial(run_rule, reminder_rule),
+        misfire_policy=reminder_rule.misfire_policy,
+        misfire_grace=reminder_rule.misfire_grace,
+    )
 
 
-@tasks.loop(minutes=10)
-async def check_github_daily_scrum():
+# !현황 종류 → reminders.toml의 check 규칙 (같은 kind면 먼저 적힌 규칙)
+status_rules: Dict[str, ReminderRule] = {}
+for reminder_rule in reminder_rules:
+    if reminder_rule.action != ANNOUNCE:
+        status_rules.setdefault(reminder_rule.kind, reminder_rule)
+STATUS_LABELS = {
+    "daily_scrum": "데일리 스크럼",
+    "weekly_plan": "주간 계획",
+    "weekly_retrospect": "주간 회고",
+}
+STATUS_ALIASES = {
+    "스크럼": "daily_scrum",
+    "데일리": "daily_scrum",
+    "계획": "weekly_plan",
+    "회고": "weekly_retrospect",
+    **{kind: kind for kind in STATUS_LABELS},
+}
+# --refresh가 몰려도 이 시간(초) 안에 받은 스냅샷은 다시 받지 않습니다.
+STATUS_REFRESH_MIN_AGE = 10.0
+# 디스코드 임베드 제한: 필드 값 길이, 임베드당 필드 수, 임베드 전체 글자 수
+EMBED_FIELD_LIMIT = 1024
+EMBED_MAX_FIELDS = 25
+EMBED_TOTAL_LIMIT = 6000
+
+
+def status_max_age() -> float:
+    """!현황이 새로 받지 않고 쓰는 스냅샷 나이(초). 스냅샷은 이 절반마다 데웁니다."""
+    return max([settings.status_max_age] + [p.snapshot.ttl for p in get_projects()])
+
+
+async def load_status_index(project: Project, refresh: bool):
+    """!현황용 스냅샷. 동시에 들어온 요청은 GitHub 요청 하나를 함께 기다립니다.
+
+    TTL 안의 스냅샷은 STATUS_MAX_AGE와 상관없이 그대로 씁니다 (웹훅이 최신으로 유지).
+    새로 받지 못하면 오래된 스냅샷이라도 있으면 그것으로 답합니다.
+    """
+    max_age = STATUS_REFRESH_MIN_AGE if refresh else status_max_age()
     try:
-        now = datetime.datetime.now()
-        current_time = now.strftime("%Y-%m-%d %H:%M:%S")
-        if not (
-            now.weekday() < 5
-            and now.hour == 9
-            and now.minute >= 10
-            and now.minute < 30
-            and not IS_HOLIDAY
-        ):
-            return
-        logger.info(f"[{current_time}] 데일리 스크럼 체크 시작")
-        issues = await fetch_github_project_issues()
-        sub_issues = await get_daily_scrum_sub_issues(
-            issues,
-            get_today_date_str(),
+        return await project.snapshot.get(max_age=max_age)
+    except GitHubUnavailableError as e:
+        if project.snapshot.last is None:
+            raise
+        logger.warning(f"[{project.name}] 스냅샷 갱신 실패, 이전 스냅샷 사용: {e}")
+        return project.snapshot.last
+
+
+async def build_status_embeds(
+    kinds: List[str], projects: List[Project], refresh: bool = False
+) -> List[discord.Embed]:
+    """종류별 제출 현황 임베드를 만듭니다. 멘션 대신 깃허브 아이디로 적습니다.
+
+    (프로젝트, 종류)마다 필드 하나라 프로젝트가 많으면 디스코드 임베드 제한(필드
+    25개, 전체 6000자)을 넘지 않도록 여러 임베드로 나눕니다.
+    """
+    today = datetime.datetime.now(KST).date()
+    indexes = await asyncio.gather(
+        *(load_status_index(project, refresh) for project in projects)
+    )
+    fields: List[Tuple[str, str]] = []
+    for project, index in zip(projects, indexes):
+        for kind in kinds:
+            rule = status_rules[kind]
+            date = rule.last_date(today).strftime("%y.%m.%d")
+            submissions = await rule.evaluate(index, project.user_map, date)
+            missing = sorted(user for user, at in submissions.items() if at is None)
+            value = f"제출 {len(submissions) - len(missing)}/{len(submissions)}명"
+            value += f"\n미제출: {', '.join(missing)}" if missing else " ✅"
+            if len(value) > EMBED_FIELD_LIMIT:
+                value = value[: EMBED_FIELD_LIMIT - 1] + "…"
+            name = f"{STATUS_LABELS.get(kind, rule.name)} ({date})"
+            if len(projects) > 1:
+                name = f"[{project.name}] {name}"
+            fields.append((name, value))
+
+    ages = [p.snapshot.age for p in projects if p.snapshot.age is not None]
+    footer = f"{max(ages):.0f}초 전 스냅샷 기준" if ages else ""
+    # 제목 "(n/m)"과 꼬리말이 들어갈 자리를 남겨 둡니다.
+    budget = EMBED_TOTAL_LIMIT - len(footer) - 32
+    pages: List[List[Tuple[str, str]]] = [[]]
+    used = 0
+    for name, value in fields:
+        size = len(name) + len(value)
+        if pages[-1] and (len(pages[-1]) >= EMBED_MAX_FIELDS or used + size > budget):
+            pages.append([])
+            used = 0
+        pages[-1].append((name, value))
+        used += size
+
+    embeds = []
+    for i, page in enumerate(pages, 1):
+        title = "📋 제출 현황" + (f" ({i}/{len(pages)})" if len(pages) > 1 else "")
+        embed = discord.Embed(title=title, color=0x00BFFF)
+        for name, value in page:
+            embed.add_field(name=name, value=value, inline=False)
+        embeds.append(embed)
+    if footer:
+        embeds[-1].set_footer(text=footer)
+    return embeds
+
+
+@bot.command(name="현황")
+async def 현황(ctx, *args):
+    refresh = "--refresh" in args
+    names = [arg for arg in args if arg != "--refresh"]
+    kinds = list(dict.fromkeys(STATUS_ALIASES.get(name) for name in names))
+    kinds = kinds or list(status_rules)
+    if not all(kind in status_rules for kind in kinds):
+        await ctx.send(
+            "사용법: `!현황 [스크럼|계획|회고] [--refresh]` "
+            f"(알 수 없는 종류: {', '.join(names)})"
         )
-        logger.info(f"[{current_time}] [데일리 스크럼] 서브이슈 수: {len(sub_issues)}")
-
-        # 서브이슈 작성자 추출
-        submitted_users = set()
-        for sub_issue in sub_issues:
-            for assignee in sub_issue.get("assignees", []):
-                if "login" in assignee:
-                    submitted_users.add(assignee["login"].lower())
-
-        # 미작성자 확인
-        result = {user: user.lower() in submitted_users for user in USER_MAP}
-        logging.info(f"{result}")
-
-        mentions = get_unsubmitted_user_ids(result, USER_MAP)
-        description_text = "스크럼 문서를 작성해주세요! \n\n 오늘 날짜 밑의 `sub-issue`를 작성해주세요! \n Title : `XX.XX.XX 이름` 형식으로 작성해주세요! \n `assignee` 할당해주세요!"
-        link_text = f"스크럼 작성하러 가기:{os.getenv('DAILY_SCRUM')}"
-        link_label, url = link_text.split(":", 1)
-        for mention in mentions:
-            embed = discord.Embed(
-                title="📢 데일리 스크럼 미작성 알림",
-                description=(f"{description_text}\n\n" f"🔗 [{link_label}]({url})"),
-                color=discord.Color.red(),
+        return
+    # 이 채널이 지정된 프로젝트가 있으면 그것만, 없으면 전체를 보여 줍니다.
+    projects = [
+        p for p in get_projects() if ctx.channel.id in p.config.channel_ids
+    ] or get_projects()
+    try:
+        embeds = await build_status_embeds(kinds, projects, refresh)
+    except GitHubUnavailableError as e:
+        logger.warning(f"!현황 GitHub 조회 실패: {e}")
+        await ctx.send(
+            "GitHub에서 현황을 가져오지 못했습니다. 잠시 후 다시 시도해주세요."
+        )
+        return
+    # 메시지 하나에 든 임베드들도 합쳐서 6000자 제한을 받으므로 하나씩 보냅니다.
+    for embed in embeds:
+        await ctx.send(embed=embed)
+
+
+def register_metrics(github_client: GitHubClient) -> None:
+    """수집 시점에 값을 읽는 봇·캐시·스케줄러·GitHub 클라이언트 지표를 등록합니다."""
+    metrics.registry.gauge(
+        "discord_gateway_latency_seconds",
+        "디스코드 게이트웨이 heartbeat 지연 (연결 전에는 NaN)",
+        ["shard"],
+        callback=lambda: {
+            (str(shard_id),): latency
+            for shard_id, latency in getattr(bot, "latencies", [(0, bot.latency)])
+        },
+    )
+    metrics.registry.gauge(
+        "project_items",
+        "동기화된 프로젝트 아이템 수",
+        ["project"],
+        callback=lambda: {(p.name,): len(p.sync.items) for p in get_projects()},
+    )
+    metrics.registry.gauge(
+        "project_snapshot_age_seconds",
+        "프로젝트 스냅샷 나이 (없으면 NaN)",
+        ["project"],
+        callback=lambda: {
+            (p.name,): p.snapshot.age if p.snapshot.age is not None else float("nan")
+            for p in get_projects()
+        },
+    )
+    metrics.registry.gauge(
+        "project_snapshot_requests_total",
+        "프로젝트 스냅샷 조회 결과별 횟수",
+        ["project", "result"],
+        type_name="counter",
+        callback=lambda: {
+            (p.name, result): count
+            for p in get_projects()
+            for result, count in (
+                ("hit", p.snapshot.hits),
+                ("miss", p.snapshot.misses),
+                ("coalesced", p.snapshot.coalesced),
             )
-            for guild_id, channels in channel_map.items():
-                channel_id = channels.get("alarm")
-                if channel_id:
-                    channel = bot.get_channel(channel_id)
-                    if channel:
-                        await channel.send(content=f"<@{mention}>", embed=embed)
-    except Exception:
-        logger.exception("check_github_weekly_retrospect 실행 중 오류 발생")
+        },
+    )
+    metrics.registry.gauge(
+        "scheduler_job_runs_total",
+        "예약 작업 실행 결과별 횟수 (late는 늦게 실행, missed는 건너뜀)",
+        ["job", "outcome"],
+        type_name="counter",
+        callback=lambda: {
+            (job.name, outcome): count
+            for job in scheduler.jobs
+            for outcome, count in (
+                ("run", job.runs),
+                ("late", job.late_runs),
+                ("missed", job.missed_runs),
+            )
+        },
+    )
+    rate_limit = github_client.rate_limit
+    metrics.registry.gauge(
+        "github_rate_limit_remaining",
+        "GitHub GraphQL 레이트 리밋 남은 포인트 (응답 전에는 NaN)",
+        callback=lambda: (
+            rate_limit.remaining if rate_limit.remaining is not None else float("nan")
+        ),
+    )
+    metrics.registry.gauge(
+        "github_rate_limit_limit",
+        "GitHub GraphQL 레이트 리밋 시간당 포인트 (응답 전에는 NaN)",
+        callback=lambda: (
+            rate_limit.limit if rate_limit.limit is not None else float("nan")
+        ),
+    )
+    metrics.registry.gauge(
+        "github_rate_limit_reset_timestamp_seconds",
+        "GitHub 레이트 리밋이 초기화되는 시각 (epoch 초, 응답 전에는 NaN)",
+        callback=lambda: (
+            rate_limit.reset_at if rate_limit.reset_at is not None else float("nan")
+        ),
+    )
+    metrics.registry.gauge(
+        "github_rate_limit_cost_total",
+        "GraphQL 쿼리가 소비한 레이트 리밋 포인트 합계",
+        type_name="counter",
+        callback=lambda: rate_limit.total_cost,
+    )
+    breaker = github_client.breaker
+    metrics.registry.gauge(
+        "github_circuit_breaker_state",
+        "GitHub 서킷 브레이커 상태 (현재 상태만 1)",
+        ["state"],
+        callback=lambda: {
+            (state,): float(breaker.state == state)
+            for state in (breaker.CLOSED, breaker.OPEN, breaker.HALF_OPEN)
+        },
+    )
+    metrics.registry.gauge(
+        "github_circuit_breaker_trips_total",
+        "GitHub 서킷 브레이커가 열린 횟수",
+        type_name="counter",
+        callback=lambda: breaker.trips,
+    )
+    metrics.registry.gauge(
+        "github_graphql_requests_total",
+        "GitHub GraphQL 요청 결과별 횟수 (retry는 재시도, failure는 최종 실패)",
+        ["result"],
+        type_name="counter",
+        callback=lambda: {
+            ("request",): github_client.requests,
+            ("retry",): github_client.retries,
+            ("failure",): github_client.failures,
+        },
+    )
 
 
-bot.run(bot_token)
+async def main():
+    # GitHub 클라이언트는 봇과 같은 수명으로 열고 닫습니다.
+    holiday_service.load_cache()
+    channel_registry.load()
+    webhook_server = None
+    if settings.github_webhook_secret:
+        # 웹훅을 쓸 때만 aiohttp.web 서버 모듈을 불러옵니다.
+        from webhook import WebhookServer
+
+        webhook_server = WebhookServer.from_settings(settings)
+    # METRICS_PORT가 있으면 Prometheus 텍스트 형식 지표를 노출합니다.
+    metrics_server = metrics.MetricsServer.from_settings(settings)
+    async with GitHubClient.from_settings(settings) as github_client:
+        set_github_client(github_client)
+        if metrics_server:
+            register_metrics(github_client)
+            metrics.watch_discord_rate_limits()
+            await metrics_server.start()
+        if webhook_server:
+            # 웹훅이 변경분을 밀어주므로 폴링은 안전망 수준으로만 합니다.
+            for project in get_projects():
+                project.snapshot.ttl = settings.webhook_snapshot_ttl
+            await webhook_server.start()
+        if settings.github_token and settings.projects:
+            warm_project_snapshots.change_interval(seconds=status_max_age() / 2)
+            warm_project_snapshots.start()
+        try:
+            async with bot:
+                await bot.start(settings.bot_token)
+        finally:
+            warm_project_snapshots.cancel()
+            if webhook_server:
+                await webhook_server.stop()
+            if metrics_server:
+                await metrics_server.stop()
+            await scheduler.stop()
+            if history is not None:
+                history.close()
+            if ledger is not None:
+                ledger.close()
+            set_github_client(None)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
 # 간단한 웹서버 생성 (슬립 방지용)
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+class MentionResolver:
+    """USER_MAP 값을 멘션에 쓸 디스코드 사용자 ID로 바꿉니다.
+
+    숫자 ID는 그대로 씁니다. 사용자명이 적혀 있으면 멤버 캐시 대신 그 길드에
+    한 번 물어(query_members) 찾은 ID를 기억하므로, 멤버 청킹 없이도 멘션이
+    됩니다.
+    """
+
+    def __init__(self, timeout: float = 5.0) -> None:
+        self.timeout = timeout
+        self._ids: Dict[Tuple[int, str], str] = {}
+
+    async def resolve(
+        self, guild: Optional[discord.Guild], mentions: List[str]
+    ) -> Dict[str, str]:
+        """mentions 중 찾은 것만 {USER_MAP 값: 사용자 ID}로, 입력 순서대로 돌려줍니다.
+
+        guild가 None이면 (다른 프로세스가 맡은 guild의 채널) 숫자 ID만 씁니다.
+        """
+        resolved: Dict[str, str] = {}
+        for mention in mentions:
+            if mention.isdigit():
+                resolved[mention] = mention
+                continue
+            if guild is None:
+                logger.warning(
+                    f"'{mention}'은 이 프로세스에 없는 guild에서 찾을 수 없어 "
+                    "멘션하지 않습니다. USER_MAP에 디스코드 ID를 적어 주세요."
+                )
+                continue
+            key = (guild.id, mention.lower())
+            if key not in self._ids:
+                user_id = await self._lookup(guild, mention)
+                if user_id is None:
+                    continue
+                self._ids[key] = user_id
+            resolved[mention] = self._ids[key]
+        return resolved
+
+    async def _lookup(self, guild: discord.Guild, name: str) -> Optional[str]:
+        member = guild.get_member_named(name)
+        if member is None:
+            try:
+                members = await asyncio.wait_for(
+                    guild.query_members(query=name, limit=5, cache=False),
+                    timeout=self.timeout,
+                )
+            except (asyncio.TimeoutError, discord.ClientException) as e:
+                logger.warning(f"[{guild.name}] '{name}' 멤버 조회 실패: {e}")
+                return None
+            member = next(
+                (
+                    m
+                    for m in members
+                    if name.lower() in (m.name.lower(), (m.global_name or "").lower())
+                ),
+                None,
+            )
+        if member is None:
+            logger.warning(
+                f"[{guild.name}] '{name}' 멤버를 찾을 수 없어 멘션하지 않습니다."
+            )
+            return None
+        return str(member.id)
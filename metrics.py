@@ -0,0 +1,341 @@
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+    from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "/metrics"
+# 초 단위 기본 버킷 (GitHub 요청·디스코드 전송·작업 실행 시간)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# 바이트 단위 응답 크기 버킷
+SIZE_BUCKETS = (1e3, 1e4, 5e4, 1e5, 5e5, 1e6, 5e6)
+
+LabelValues = Tuple[str, ...]
+CallbackResult = Union[float, Dict[LabelValues, float]]
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name}: 레이블 {self.label_names}가 필요합니다.")
+        return tuple(str(labels[n]) for n in self.label_names)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_labels(self.label_names, k)} {_format_value(v)}"
+            for k, v in items
+        ]
+
+
+class Gauge(_Metric):
+    """현재 값을 나타내는 게이지. callback을 주면 수집할 때마다 값을 읽습니다.
+
+    callback은 숫자 하나, 또는 레이블 값 튜플 → 숫자 dict를 반환합니다.
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        callback: Optional[Callable[[], CallbackResult]] = None,
+        type_name: Optional[str] = None,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+        if type_name:
+            self.type_name = type_name
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def samples(self) -> List[str]:
+        if self._callback is not None:
+            try:
+                result = self._callback()
+            except Exception:
+                logger.exception(f"{self.name} 수집 실패")
+                return []
+            values = result if isinstance(result, dict) else {(): result}
+        else:
+            with self._lock:
+                values = dict(self._values)
+        return [
+            f"{self.name}{_labels(self.label_names, k)} {_format_value(float(v))}"
+            for k, v in values.items()
+        ]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 → [버킷별 개수..., 합계, 전체 개수]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        lines = []
+        for key, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.label_names, key, le)} "
+                    f"{_format_value(cumulative)}"
+                )
+            inf = _labels(self.label_names, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {_format_value(state[-1])}")
+            plain = _labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{plain} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{plain} {_format_value(state[-1])}")
+        return lines
+
+
+class Registry:
+    """등록된 지표를 Prometheus 텍스트 형식(0.0.4)으로 내보냅니다."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(
+        self, name: str, help_text: str, labels: Sequence[str] = (), **kw
+    ) -> Gauge:
+        return self.register(Gauge(name, help_text, labels, **kw))
+
+    def histogram(
+        self, name: str, help_text: str, labels: Sequence[str] = (), **kw
+    ) -> Histogram:
+        return self.register(Histogram(name, help_text, labels, **kw))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+class _RateLimitLogCounter(logging.Handler):
+    """discord.py가 남기는 레이트 리밋 경고를 세어 429 횟수로 기록합니다.
+
+    discord.py는 429를 내부에서 기다렸다가 재시도하므로 예외로는 드러나지 않습니다.
+    """
+
+    def __init__(self, counter: Counter) -> None:
+        super().__init__(level=logging.WARNING)
+        self.counter = counter
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if "rate limit" in record.getMessage().lower():
+            self.counter.inc()
+
+
+# 봇 전체가 공유하는 기본 레지스트리와 지표
+registry = Registry()
+
+job_duration = registry.histogram(
+    "bot_job_duration_seconds", "예약 작업·루프 1회 실행 시간", ["job"]
+)
+github_request_duration = registry.histogram(
+    "github_request_duration_seconds", "GitHub GraphQL 요청 지연", ["status"]
+)
+github_response_bytes = registry.histogram(
+    "github_response_bytes",
+    "GitHub GraphQL 응답 크기",
+    buckets=SIZE_BUCKETS,
+)
+discord_send_duration = registry.histogram(
+    "discord_send_duration_seconds", "채널 하나로의 디스코드 전송 시간"
+)
+discord_send_errors = registry.counter(
+    "discord_send_errors_total", "디스코드 전송 실패 수", ["status"]
+)
+discord_rate_limited = registry.counter(
+    "discord_rate_limited_total", "discord.py가 보고한 레이트 리밋(429) 수"
+)
+reminder_mentions_skipped = registry.counter(
+    "reminder_mentions_skipped_total",
+    "전송 기록상 재멘션 간격이 지나지 않아 건너뛴 멘션 수",
+    ["kind"],
+)
+
+
+def watch_discord_rate_limits() -> None:
+    """discord.http 로거에 레이트 리밋 집계 핸들러를 붙입니다 (한 번만)."""
+    http_logger = logging.getLogger("discord.http")
+    if not any(isinstance(h, _RateLimitLogCounter) for h in http_logger.handlers):
+        http_logger.addHandler(_RateLimitLogCounter(discord_rate_limited))
+
+
+class MetricsServer:
+    """레지스트리를 /metrics로 노출하는 작은 HTTP 서버."""
+
+    def __init__(
+        self,
+        metrics: Registry = registry,
+        host: str = "0.0.0.0",
+        port: int = 9100,
+        path: str = DEFAULT_PATH,
+    ) -> None:
+        self.registry = metrics
+        self.host = host
+        self.port = port
+        self.path = path
+        self._runner: Optional["web.AppRunner"] = None
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> Optional["MetricsServer"]:
+        """METRICS_PORT가 있을 때만 서버를 만듭니다."""
+        if not settings.metrics_port:
+            return None
+        return cls(
+            host=settings.metrics_host,
+            port=settings.metrics_port,
+            path=settings.metrics_path or DEFAULT_PATH,
+        )
+
+    async def handle(self, request: "web.Request") -> "web.Response":
+        from aiohttp import web
+
+        return web.Response(
+            text=self.registry.render(),
+            content_type="text/plain",
+            headers={"X-Content-Type-Options": "nosniff"},
+        )
+
+    async def start(self) -> None:
+        # 지표를 켤 때만 aiohttp.web을 불러와 기본 기동 경로를 가볍게 둡니다.
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get(self.path, self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"지표 노출: http://{self.host}:{self.port}{self.path}")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,226 @@
+import re
+import datetime
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+TITLE_DATE_RE = re.compile(r"(\d{2}\.\d{2}\.\d{2})")
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def extract_date_from_title(title: str) -> str:
+    """제목 앞의 'YY.MM.DD' 날짜를 추출합니다. 없으면 빈 문자열."""
+    match = TITLE_DATE_RE.match(title)
+    return match.group(1) if match else ""
+
+
+def parse_github_datetime(value: Optional[str]) -> datetime.datetime:
+    """GitHub ISO-8601 시각을 aware datetime으로 변환합니다."""
+    if not value:
+        return EPOCH
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def field_node_value(field: Dict[str, Any]) -> Optional[Any]:
+    """fieldValues 노드 하나에서 타입에 맞는 값을 꺼냅니다."""
+    field_type = field.get("__typename")
+
+    if field_type == "ProjectV2ItemFieldSingleSelectValue":
+        return field.get("name")
+    elif field_type == "ProjectV2ItemFieldTextValue":
+        return field.get("text")
+    elif field_type == "ProjectV2ItemFieldNumberValue":
+        return field.get("number")
+    elif field_type == "ProjectV2ItemFieldDateValue":
+        return field.get("date")
+    elif field_type == "ProjectV2ItemFieldUserValue":
+        users = field.get("users", {}).get("nodes", [])
+        return [user.get("login") for user in users] if users else None
+    elif field_type == "ProjectV2ItemFieldRepositoryValue":
+        return field.get("repository", {}).get("name")
+    elif field_type == "ProjectV2ItemFieldMilestoneValue":
+        return field.get("milestone", {}).get("title")
+    elif field_type == "ProjectV2ItemFieldLabelValue":
+        labels = field.get("labels", {}).get("nodes", [])
+        return [label.get("name") for label in labels] if labels else None
+    elif field_type == "ProjectV2ItemFieldPullRequestValue":
+        prs = field.get("pullRequests", {}).get("nodes", [])
+        return [pr.get("title") for pr in prs] if prs else None
+    else:
+        logger.warning(f"알 수 없는 필드 타입: {field_type}")
+        return None
+
+
+class ProjectItem:
+    """GraphQL 아이템 노드를 한 번만 파싱해 둔 가벼운 표현."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "url",
+        "status",
+        "fields",
+        "created_at",
+        "updated_at",
+        "title_date",
+        "assignees",
+        "issue_id",
+        "parent_id",
+    )
+
+    def __init__(
+        self,
+        id: Optional[str],
+        title: str,
+        url: str,
+        fields: Dict[str, Any],
+        created_at: datetime.datetime,
+        updated_at: datetime.datetime,
+        assignees: Tuple[str, ...],
+        issue_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.url = url
+        self.fields = fields
+        self.status = fields.get("Status")
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.title_date = extract_date_from_title(title)
+        self.assignees = assignees
+        # 이슈 노드 id와 GitHub 하위 이슈 관계의 상위 이슈 id (없으면 None)
+        self.issue_id = issue_id
+        self.parent_id = parent_id
+
+    @classmethod
+    def from_node(cls, node: Dict[str, Any]) -> "ProjectItem":
+        fields = {}
+        for field in (node.get("fieldValues") or {}).get("nodes", []):
+            field_obj = field.get("field")
+            if not field_obj or "name" not in field_obj:
+                continue
+            fields[field_obj["name"]] = field_node_value(field)
+        # 알림용 쿼리는 fieldValueByName 별칭으로 Status만 받습니다.
+        status = node.get("status")
+        if status and "name" in status:
+            fields.setdefault("Status", status["name"])
+
+        content = node.get("content") or {}
+        assignees = tuple(
+            assignee["login"].lower()
+            for assignee in (content.get("assignees") or {}).get("nodes", [])
+            if assignee and "login" in assignee
+        )
+        parent = content.get("parent") or {}
+        return cls(
+            node.get("id"),
+            content.get("title", ""),
+            content.get("url", ""),
+            fields,
+            parse_github_datetime(node.get("createdAt")),
+            parse_github_datetime(node.get("updatedAt")),
+            assignees,
+            content.get("id"),
+            parent.get("id"),
+        )
+
+    def __repr__(self) -> str:
+        return f"ProjectItem(title={self.title!r}, status={self.status!r})"
+
+
+class ScrumDay:
+    """하루치 Daily-Scrum: 상위 이슈와 그 아래 하위 이슈들."""
+
+    __slots__ = ("date", "parent", "sub_issues")
+
+    def __init__(self, date: str, parent: Optional[ProjectItem] = None) -> None:
+        self.date = date
+        self.parent = parent
+        self.sub_issues: List[ProjectItem] = []
+
+    @property
+    def submitters(self) -> Set[str]:
+        """하위 이슈 담당자(소문자 로그인) 집합."""
+        return {login for item in self.sub_issues for login in item.assignees}
+
+    def __repr__(self) -> str:
+        return f"ScrumDay({self.date!r}, sub_issues={len(self.sub_issues)})"
+
+
+def build_scrum_days(
+    items: Iterable[ProjectItem], parent_status: str = "Daily-Scrum"
+) -> Dict[str, ScrumDay]:
+    """'YY.MM.DD' → ScrumDay 인덱스를 두 번의 순회로 만듭니다.
+
+    상위 이슈는 제목이 날짜뿐이고 Status가 parent_status인 아이템입니다.
+    하위 이슈는 GitHub 하위 이슈 관계(parent)로 상위 이슈를 찾을 수 있으면 그것을
+    따르고, 아니면 '날짜 + 공백 + 이름' 제목 접두사로 그날에 붙입니다.
+    """
+    items = list(items)
+    days: Dict[str, ScrumDay] = {}
+    by_issue_id: Dict[str, ScrumDay] = {}
+    for item in items:
+        if (
+            item.status == parent_status
+            and item.title_date
+            and item.title == item.title_date
+            and item.title_date not in days
+        ):
+            day = days[item.title_date] = ScrumDay(item.title_date, item)
+            if item.issue_id:
+                by_issue_id[item.issue_id] = day
+
+    for item in items:
+        day = by_issue_id.get(item.parent_id) if item.parent_id else None
+        if day is None and item.title.startswith(item.title_date + " "):
+            day = days.get(item.title_date) if item.title_date else None
+        if day is not None and item is not day.parent:
+            day.sub_issues.append(item)
+    return days
+
+
+class ProjectIndex:
+    """Status와 제목 날짜로 아이템을 바로 찾을 수 있는 보조 인덱스."""
+
+    __slots__ = ("items", "by_status", "by_title_date", "_scrum_days")
+
+    def __init__(self, items: Iterable[ProjectItem]) -> None:
+        self.items: List[ProjectItem] = list(items)
+        self.by_status: Dict[Optional[str], List[ProjectItem]] = {}
+        self.by_title_date: Dict[str, List[ProjectItem]] = {}
+        for item in self.items:
+            self.by_status.setdefault(item.status, []).append(item)
+            if item.title_date:
+                self.by_title_date.setdefault(item.title_date, []).append(item)
+        self._scrum_days: Optional[Dict[str, ScrumDay]] = None
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Dict[str, Any]]) -> "ProjectIndex":
+        return cls(ProjectItem.from_node(node) for node in nodes)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def with_status(self, status: str) -> List[ProjectItem]:
+        """Status 값이 일치하는 아이템 목록."""
+        return self.by_status.get(status, [])
+
+    def with_title_date(self, date: str) -> List[ProjectItem]:
+        """제목이 'YY.MM.DD'로 시작하는 아이템 목록."""
+        return self.by_title_date.get(date, [])
+
+    @property
+    def scrum_days(self) -> Dict[str, ScrumDay]:
+        """날짜별 Daily-Scrum 인덱스. 처음 접근할 때 한 번만 만듭니다."""
+        if self._scrum_days is None:
+            self._scrum_days = build_scrum_days(self.items)
+        return self._scrum_days
+
+    def scrum_day(self, date: str) -> Optional[ScrumDay]:
+        """'YY.MM.DD' 날짜의 Daily-Scrum. 그날 상위·하위 이슈가 없으면 None."""
+        return self.scrum_days.get(date)
@@ -0,0 +1,238 @@
+import datetime
+import logging
+import os
+import tomllib
+from typing import Any, Dict, List, Optional
+
+import discord
+
+from project_items import ProjectIndex, ProjectItem
+from scheduler import MISFIRE_RUN_ONCE, MISFIRE_SKIP, CronRule
+from tracking import collect_submissions, get_daily_scrum_sub_issues
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "reminders.toml"
+)
+
+ANNOUNCE = "announce"
+CHECK = "check"
+# check 규칙이 미작성자를 찾는 방식
+CHECK_STATUS = "status"
+CHECK_SUB_ISSUES = "sub_issues"
+
+REQUIRED_KEYS = {"name", "action", "kind", "weekdays", "hours", "minutes", "title"}
+OPTIONAL_KEYS = {
+    "check",
+    "status",
+    "misfire",
+    "misfire_grace",
+    "reping_minutes",
+    "description",
+    "link",
+    "link_label",
+    "color",
+}
+
+
+def _ints(rule: str, key: str, values: Any, low: int, high: int) -> List[int]:
+    if not isinstance(values, list) or not values:
+        raise ValueError(f"[{rule}] {key}는 비어 있지 않은 정수 배열이어야 합니다.")
+    for value in values:
+        if not isinstance(value, int) or not low <= value <= high:
+            raise ValueError(
+                f"[{rule}] {key} 값은 {low}~{high} 정수여야 합니다: {value!r}"
+            )
+    return values
+
+
+def _non_negative(rule: str, key: str, value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise ValueError(f"[{rule}] {key}는 0 이상의 숫자여야 합니다: {value!r}")
+    return float(value)
+
+
+def _color(rule: str, value: Any) -> discord.Color:
+    if isinstance(value, int):
+        return discord.Color(value)
+    factory = getattr(discord.Color, str(value), None)
+    if not callable(factory):
+        raise ValueError(f"[{rule}] 알 수 없는 색: {value!r}")
+    return factory()
+
+
+class ReminderRule:
+    """reminders.toml의 규칙 하나를 검증해 실행 시각·조회 조건·임베드까지 만든 것."""
+
+    def __init__(
+        self,
+        name: str,
+        action: str,
+        kind: str,
+        cron: CronRule,
+        embed: discord.Embed,
+        check: Optional[str] = None,
+        status: Optional[str] = None,
+        misfire_policy: str = MISFIRE_SKIP,
+        misfire_grace: float = 60.0,
+        reping_minutes: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.action = action
+        self.kind = kind
+        self.cron = cron
+        # 틱마다 만들지 않고 모든 채널·실행에서 같은 임베드를 씁니다.
+        self.embed = embed
+        self.check = check
+        self.status = status
+        self.misfire_policy = misfire_policy
+        self.misfire_grace = misfire_grace
+        # 같은 창에서 이미 멘션한 사용자를 다시 멘션하기까지의 간격(분)
+        self.reping_minutes = reping_minutes
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], links: Dict[str, Optional[str]]
+    ) -> "ReminderRule":
+        """규칙 테이블 하나를 읽습니다. 잘못된 값이 있으면 ValueError."""
+        name = str(data.get("name") or "?")
+        missing = REQUIRED_KEYS - data.keys()
+        if missing:
+            raise ValueError(f"[{name}] 필수 키가 없습니다: {sorted(missing)}")
+        unknown = data.keys() - REQUIRED_KEYS - OPTIONAL_KEYS
+        if unknown:
+            raise ValueError(f"[{name}] 알 수 없는 키: {sorted(unknown)}")
+
+        action = data["action"]
+        check = data.get("check")
+        status = data.get("status")
+        if action == ANNOUNCE:
+            check = None
+        elif action == CHECK:
+            if check not in (CHECK_STATUS, CHECK_SUB_ISSUES):
+                raise ValueError(
+                    f"[{name}] check는 {CHECK_STATUS} 또는 {CHECK_SUB_ISSUES}여야 합니다."
+                )
+            if check == CHECK_STATUS and not status:
+                raise ValueError(f"[{name}] status 확인에는 status가 필요합니다.")
+            if check == CHECK_SUB_ISSUES and status not in (None, "Daily-Scrum"):
+                raise ValueError(
+                    f"[{name}] sub_issues 확인은 Daily-Scrum 상위 이슈만 지원합니다."
+                )
+        else:
+            raise ValueError(f"[{name}] action은 {ANNOUNCE} 또는 {CHECK}여야 합니다.")
+
+        misfire = data.get("misfire", MISFIRE_SKIP)
+        if misfire not in (MISFIRE_SKIP, MISFIRE_RUN_ONCE):
+            raise ValueError(f"[{name}] 알 수 없는 misfire 정책: {misfire!r}")
+        misfire_grace = _non_negative(
+            name, "misfire_grace", data.get("misfire_grace", 60.0)
+        )
+        reping_minutes = data.get("reping_minutes")
+        if reping_minutes is not None:
+            reping_minutes = _non_negative(name, "reping_minutes", reping_minutes)
+        cron = CronRule(
+            _ints(name, "weekdays", data["weekdays"], 0, 6),
+            _ints(name, "hours", data["hours"], 0, 23),
+            _ints(name, "minutes", data["minutes"], 0, 59),
+        )
+
+        fields = {"status": status or ""}
+        try:
+            title = str(data["title"]).format(**fields)
+            description = str(data.get("description", "")).format(**fields)
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"[{name}] 템플릿을 채울 수 없습니다: {e}")
+        link = data.get("link")
+        if link:
+            if link not in links:
+                raise ValueError(f"[{name}] 알 수 없는 링크 이름: {link!r}")
+            url = links[link]
+            if url:
+                label = data.get("link_label") or link
+                description = f"{description}\n\n🔗 [{label}]({url})"
+            else:
+                logger.warning(f"[{name}] {link} 링크가 설정되지 않아 생략합니다.")
+
+        return cls(
+            name=name,
+            action=action,
+            kind=str(data["kind"]),
+            cron=cron,
+            embed=discord.Embed(
+                title=title,
+                description=description,
+                color=_color(name, data.get("color", 0x00BFFF)),
+            ),
+            check=check,
+            status=status,
+            misfire_policy=misfire,
+            misfire_grace=misfire_grace,
+            reping_minutes=reping_minutes,
+        )
+
+    def last_date(self, today: datetime.date) -> datetime.date:
+        """today(포함)부터 거슬러 올라가 이 규칙이 실행되는 가장 가까운 요일의 날짜."""
+        for offset in range(7):
+            day = today - datetime.timedelta(days=offset)
+            if day.weekday() in self.cron.weekdays:
+                return day
+        return today
+
+    def filter_query(self, today: str) -> str:
+        """알림 전용 쿼리에 넘길 Projects v2 items(query:) 필터.
+
+        제목 날짜로 범위를 묶어, 프로젝트에 문서가 쌓여도 응답 크기가 늘지 않습니다.
+        sub_issues 확인은 제목에 날짜가 없는 하위 이슈를 상위 이슈에서 따로
+        따라가야 합니다 (fetch_reminder_items의 follow_sub_issues).
+        """
+        if self.check == CHECK_SUB_ISSUES:
+            return f'"{today}"'
+        return f'status:"{self.status}" "{today}"'
+
+    async def target_issues(self, index: ProjectIndex, today: str) -> List[ProjectItem]:
+        """오늘('YY.MM.DD') 제출로 칠 이슈 목록."""
+        if self.check == CHECK_SUB_ISSUES:
+            return await get_daily_scrum_sub_issues(index, today)
+        return [
+            item for item in index.with_status(self.status) if item.title_date == today
+        ]
+
+    async def evaluate(
+        self, index: ProjectIndex, user_map: Dict[str, str], today: str
+    ) -> Dict[str, Optional[datetime.datetime]]:
+        """user_map의 사용자별 오늘 제출 시각 (미제출이면 None)."""
+        return collect_submissions(await self.target_issues(index, today), user_map)
+
+    def __repr__(self) -> str:
+        return f"ReminderRule({self.name!r}, {self.action}, {self.cron})"
+
+
+def load_rules(
+    path: str = DEFAULT_RULES_PATH, links: Optional[Dict[str, Optional[str]]] = None
+) -> List[ReminderRule]:
+    """규칙 파일을 읽어 검증합니다. 하나라도 잘못되면 모아서 ValueError로 알립니다."""
+    with open(path, "rb") as f:
+        try:
+            data = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"{path}: TOML 형식 오류: {e}")
+    entries = data.get("rule", [])
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: 규칙은 [[rule]] 배열로 적어야 합니다.")
+
+    rules, errors = [], []
+    for entry in entries:
+        try:
+            rules.append(ReminderRule.from_dict(entry, links or {}))
+        except ValueError as e:
+            errors.append(str(e))
+    names = [rule.name for rule in rules]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if duplicated:
+        errors.append(f"규칙 이름이 중복됩니다: {duplicated}")
+    if errors:
+        raise ValueError(f"{path}: " + "; ".join(errors))
+    logger.info(f"알림 규칙 {len(rules)}개를 불러왔습니다: {path}")
+    return rules
@@ -0,0 +1,185 @@
+import asyncio
+import datetime
+import heapq
+import itertools
+import logging
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+
+# 예정 시각을 놓쳤을 때의 처리 방식
+MISFIRE_SKIP = "skip"  # 유예 시간을 넘기면 건너뜀
+MISFIRE_RUN_ONCE = "run_once"  # 늦더라도 한 번만 실행 (여러 번 놓쳐도 한 번)
+
+# 벽시계 보정(NTP, 절전 복귀 등)을 위해 한 번에 이보다 오래 자지 않습니다.
+MAX_SLEEP = 300.0
+
+
+class CronRule:
+    """요일·시·분 조합으로 표현한 반복 규칙 (요일은 월요일=0)."""
+
+    def __init__(
+        self,
+        weekdays: Iterable[int],
+        hours: Iterable[int],
+        minutes: Iterable[int],
+        tz: datetime.tzinfo = KST,
+    ) -> None:
+        self.weekdays = frozenset(weekdays)
+        self.times = sorted((h, m) for h in hours for m in minutes)
+        self.tz = tz
+        if not self.weekdays or not self.times:
+            raise ValueError("요일과 시각은 하나 이상 지정해야 합니다.")
+
+    def next_fire(self, after: datetime.datetime) -> datetime.datetime:
+        """after 이후(초과) 가장 가까운 실행 시각을 반환합니다."""
+        local = after.astimezone(self.tz)
+        for day_offset in range(8):
+            day = local.date() + datetime.timedelta(days=day_offset)
+            if day.weekday() not in self.weekdays:
+                continue
+            for hour, minute in self.times:
+                candidate = datetime.datetime(
+                    day.year, day.month, day.day, hour, minute, tzinfo=self.tz
+                )
+                if candidate > local:
+                    return candidate
+        raise RuntimeError("다음 실행 시각을 찾지 못했습니다.")
+
+    def __repr__(self) -> str:
+        return f"CronRule(weekdays={sorted(self.weekdays)}, times={self.times})"
+
+
+class ScheduledJob:
+    """규칙과 콜백, 실행 누락 정책을 묶은 작업."""
+
+    def __init__(
+        self,
+        name: str,
+        rule: CronRule,
+        callback: Callable[[datetime.datetime], Awaitable[None]],
+        misfire_policy: str = MISFIRE_SKIP,
+        misfire_grace: float = 60.0,
+    ) -> None:
+        if misfire_policy not in (MISFIRE_SKIP, MISFIRE_RUN_ONCE):
+            raise ValueError(f"알 수 없는 misfire 정책: {misfire_policy}")
+        self.name = name
+        self.rule = rule
+        self.callback = callback
+        self.misfire_policy = misfire_policy
+        self.misfire_grace = datetime.timedelta(seconds=misfire_grace)
+        self.next_run: Optional[datetime.datetime] = None
+        self.runs = 0
+        self.late_runs = 0
+        self.missed_runs = 0
+
+
+class ReminderScheduler:
+    """다음 실행 시각 순으로 작업을 힙에 두고, 그 시각까지 잠드는 스케줄러."""
+
+    def __init__(self, tz: datetime.tzinfo = KST) -> None:
+        self.tz = tz
+        self.jobs: List[ScheduledJob] = []
+        self._heap: List[Tuple[datetime.datetime, int, ScheduledJob]] = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running: set = set()
+
+    def now(self) -> datetime.datetime:
+        return datetime.datetime.now(self.tz)
+
+    def add_job(
+        self,
+        name: str,
+        rule: CronRule,
+        callback: Callable[[datetime.datetime], Awaitable[None]],
+        misfire_policy: str = MISFIRE_SKIP,
+        misfire_grace: float = 60.0,
+    ) -> ScheduledJob:
+        job = ScheduledJob(name, rule, callback, misfire_policy, misfire_grace)
+        self.jobs.append(job)
+        # 시작 직전 유예 시간 안에 있었던 실행은 놓치지 않도록 그만큼 거슬러 계산합니다.
+        self._push(job, rule.next_fire(self.now() - job.misfire_grace))
+        self._wakeup.set()
+        return job
+
+    def _push(self, job: ScheduledJob, fire_at: datetime.datetime) -> None:
+        job.next_run = fire_at
+        heapq.heappush(self._heap, (fire_at, next(self._counter), job))
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.is_running():
+            self._task = asyncio.create_task(self._run(), name="reminder-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        logger.info(f"스케줄러 시작: 작업 {len(self.jobs)}개")
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            fire_at, _, job = self._heap[0]
+            delay = (fire_at - self.now()).total_seconds()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=min(delay, MAX_SLEEP)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            now = self.now()
+            self._dispatch(job, fire_at, now)
+            self._push(job, job.rule.next_fire(max(now, fire_at)))
+
+    def _dispatch(
+        self, job: ScheduledJob, fire_at: datetime.datetime, now: datetime.datetime
+    ) -> None:
+        lateness = now - fire_at
+        if lateness > job.misfire_grace:
+            if job.misfire_policy == MISFIRE_SKIP:
+                job.missed_runs += 1
+                logger.warning(
+                    f"[{job.name}] {fire_at:%Y-%m-%d %H:%M} 실행을 놓쳐 건너뜁니다 "
+                    f"({lateness.total_seconds():.0f}초 지연)"
+                )
+                return
+            job.late_runs += 1
+            logger.warning(
+                f"[{job.name}] {fire_at:%Y-%m-%d %H:%M} 실행을 "
+                f"{lateness.total_seconds():.0f}초 늦게 따라잡습니다"
+            )
+
+        job.runs += 1
+        task = asyncio.create_task(self._execute(job, fire_at), name=job.name)
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _execute(self, job: ScheduledJob, fire_at: datetime.datetime) -> None:
+        try:
+            with metrics.job_duration.time(job=job.name):
+                await job.callback(fire_at)
+        except Exception:
+            logger.exception(f"{job.name} 실행 중 오류 발생")
@@ -0,0 +1,381 @@
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROJECT_CONCURRENCY = 4
+
+# GitHubClient 생성자 인자 ← 환경 변수. 설정된 것만 넘겨 나머지는 기본값을 씁니다.
+GITHUB_CLIENT_INT_ENV = {
+    "limit": "GITHUB_HTTP_LIMIT",
+    "limit_per_host": "GITHUB_HTTP_LIMIT_PER_HOST",
+    "dns_ttl": "GITHUB_DNS_TTL",
+    "keepalive_timeout": "GITHUB_KEEPALIVE_TIMEOUT",
+    "total_timeout": "GITHUB_HTTP_TIMEOUT",
+    "connect_timeout": "GITHUB_CONNECT_TIMEOUT",
+    "max_retries": "GITHUB_MAX_RETRIES",
+    "rate_limit_reserve": "GITHUB_RATE_LIMIT_RESERVE",
+    "breaker_threshold": "GITHUB_BREAKER_THRESHOLD",
+}
+GITHUB_CLIENT_FLOAT_ENV = {
+    "backoff_base": "GITHUB_BACKOFF_BASE",
+    "backoff_max": "GITHUB_BACKOFF_MAX",
+    "max_rate_wait": "GITHUB_MAX_RATE_WAIT",
+    "breaker_reset": "GITHUB_BREAKER_RESET",
+}
+
+
+def _float(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.error(
+            f"{name} 환경 변수가 숫자가 아닙니다: {value!r} (기본값 {default} 사용)"
+        )
+        return default
+
+
+def _int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.error(
+            f"{name} 환경 변수가 정수가 아닙니다: {value!r} (기본값 {default} 사용)"
+        )
+        return default
+
+
+def _bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in ("1", "true", "on", "yes")
+
+
+def _github_client_options() -> Dict[str, float]:
+    options: Dict[str, Optional[float]] = {
+        **{key: _int(name, None) for key, name in GITHUB_CLIENT_INT_ENV.items()},
+        **{key: _float(name, None) for key, name in GITHUB_CLIENT_FLOAT_ENV.items()},
+    }
+    return {key: value for key, value in options.items() if value is not None}
+
+
+def _user_map(value: str) -> Dict[str, str]:
+    try:
+        user_map = json.loads(value)
+    except json.JSONDecodeError:
+        logger.error("USER_MAP 환경 변수가 올바른 JSON 형식이 아닙니다.")
+        return {}
+    if not isinstance(user_map, dict):
+        logger.error(
+            "USER_MAP 환경 변수는 {깃허브 아이디: 디스코드 ID} 형식이어야 합니다."
+        )
+        return {}
+    return {str(login): str(mention) for login, mention in user_map.items()}
+
+
+def _reping_minutes(value: Optional[str]) -> Tuple[Optional[float], Dict[str, float]]:
+    """REMINDER_REPING_MINUTES: 숫자 하나(모든 종류) 또는 {알림 종류: 분} JSON.
+
+    (모든 종류에 쓸 분, 종류별 분)을 돌려줍니다.
+    """
+    if not value:
+        return None, {}
+    try:
+        parsed = json.loads(value)
+        if isinstance(parsed, dict):
+            return None, {str(kind): float(m) for kind, m in parsed.items()}
+        return float(parsed), {}
+    except (json.JSONDecodeError, TypeError, ValueError):
+        logger.error(
+            f"REMINDER_REPING_MINUTES 환경 변수를 읽을 수 없습니다: {value!r} "
+            "(규칙의 간격 사용)"
+        )
+        return None, {}
+
+
+class ProjectConfig:
+    """알림 대상 GitHub 프로젝트 하나(팀 하나)의 설정."""
+
+    def __init__(
+        self,
+        name: str,
+        org: str,
+        number: int,
+        user_map: Dict[str, str],
+        channel_ids: Optional[List[int]] = None,
+    ) -> None:
+        self.name = name
+        self.org = org
+        self.number = number
+        self.user_map = user_map
+        # 비어 있으면 채널 레지스트리의 모든 알림 채널로 보냅니다.
+        self.channel_ids = channel_ids or []
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], default_user_map: Dict[str, str]
+    ) -> "ProjectConfig":
+        """GITHUB_PROJECTS 항목 하나를 읽습니다. 필수 키가 없으면 ValueError."""
+        try:
+            org = str(data["org"])
+            number = int(data["project"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"GITHUB_PROJECTS 항목에 org/project가 필요합니다: {data}")
+        user_map = data.get("user_map")
+        return cls(
+            name=str(data.get("name") or f"{org}/{number}"),
+            org=org,
+            number=number,
+            user_map=(
+                {str(k): str(v) for k, v in user_map.items()}
+                if isinstance(user_map, dict)
+                else default_user_map
+            ),
+            channel_ids=[int(c) for c in data.get("channels") or []],
+        )
+
+    def __repr__(self) -> str:
+        return f"ProjectConfig({self.name!r}, {self.org}/{self.number})"
+
+
+def _projects(
+    value: Optional[str], default_user_map: Dict[str, str]
+) -> List[ProjectConfig]:
+    if not value:
+        return []
+    try:
+        entries = json.loads(value)
+    except json.JSONDecodeError:
+        logger.error("GITHUB_PROJECTS 환경 변수가 올바른 JSON 형식이 아닙니다.")
+        return []
+    if not isinstance(entries, list):
+        entries = [entries]
+    projects = []
+    for entry in entries:
+        try:
+            projects.append(ProjectConfig.from_dict(entry, default_user_map))
+        except ValueError as e:
+            logger.error(str(e))
+    names = [p.name for p in projects]
+    if len(set(names)) != len(names):
+        logger.error(f"GITHUB_PROJECTS의 name이 중복됩니다: {names}")
+        return []
+    return projects
+
+
+class Settings:
+    """봇 전체 설정. .env와 환경 변수에서 한 번만 읽습니다.
+
+    값이 빠져 있어도 만들 때는 실패하지 않고, 필요한 곳에서 require_github()로
+    처음 쓸 때 검증합니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        bot_token: Optional[str] = None,
+        github_token: Optional[str] = None,
+        github_org: Optional[str] = None,
+        github_project_id: Optional[str] = None,
+        github_graphql_url: Optional[str] = None,
+        github_client_options: Optional[Dict[str, float]] = None,
+        github_webhook_secret: Optional[str] = None,
+        webhook_host: str = "0.0.0.0",
+        webhook_port: int = 8080,
+        webhook_path: Optional[str] = None,
+        metrics_port: Optional[int] = None,
+        metrics_host: str = "0.0.0.0",
+        metrics_path: Optional[str] = None,
+        holiday_api_key: Optional[str] = None,
+        holiday_cache_path: str = "holiday_cache.json",
+        sharding: bool = False,
+        shard_count: Optional[int] = None,
+        shard_ids: Optional[str] = None,
+        user_map: Optional[Dict[str, str]] = None,
+        snapshot_ttl: float = 60.0,
+        webhook_snapshot_ttl: float = 900.0,
+        reconcile_interval: float = 900.0,
+        debug_dump_rate: float = 0.0,
+        debug_dump_dir: str = "debug_dumps",
+        channel_registry_path: str = "channel_registry.json",
+        channel_registry_peers: Optional[List[str]] = None,
+        reminder_checks: bool = True,
+        history_db_path: Optional[str] = "history.db",
+        delivery_ledger_path: Optional[str] = "history.db",
+        reping_minutes: Optional[Dict[str, float]] = None,
+        reping_minutes_all: Optional[float] = None,
+        reminder_max_pings: int = 0,
+        reminder_mode: str = "coalesced",
+        reminder_rules_path: Optional[str] = None,
+        status_max_age: float = 300.0,
+        low_memory: bool = False,
+        links: Optional[Dict[str, Optional[str]]] = None,
+        projects: Optional[List[ProjectConfig]] = None,
+        project_concurrency: int = DEFAULT_PROJECT_CONCURRENCY,
+    ) -> None:
+        self.bot_token = bot_token
+        self.github_token = github_token
+        self.github_org = github_org
+        self.github_project_id = github_project_id
+        # 비워 두면 api.github.com을 씁니다 (벤치마크는 가짜 서버 주소를 넣습니다).
+        self.github_graphql_url = github_graphql_url or None
+        # GitHubClient 생성자에 그대로 넘기는 연결·재시도 설정
+        self.github_client_options: Dict[str, float] = github_client_options or {}
+        # 비워 두면 웹훅 서버를 띄우지 않습니다.
+        self.github_webhook_secret = github_webhook_secret or None
+        self.webhook_host = webhook_host
+        self.webhook_port = webhook_port
+        self.webhook_path = webhook_path or None
+        # 비워 두면 지표 서버를 띄우지 않습니다.
+        self.metrics_port = metrics_port
+        self.metrics_host = metrics_host
+        self.metrics_path = metrics_path or None
+        self.holiday_api_key = holiday_api_key
+        self.holiday_cache_path = holiday_cache_path
+        self.sharding = sharding
+        self.shard_count = shard_count
+        # "0-3,6" 형식 그대로 두고 ShardConfig에서 해석합니다.
+        self.shard_ids = shard_ids or None
+        self.user_map: Dict[str, str] = user_map or {}
+        # 깃허브 아이디는 대소문자를 구분하지 않으므로 소문자 키로도 찾습니다.
+        self.user_map_lower = {
+            login.lower(): mention for login, mention in self.user_map.items()
+        }
+        self.snapshot_ttl = snapshot_ttl
+        self.webhook_snapshot_ttl = webhook_snapshot_ttl
+        self.reconcile_interval = reconcile_interval
+        self.debug_dump_rate = debug_dump_rate
+        self.debug_dump_dir = debug_dump_dir
+        self.channel_registry_path = channel_registry_path
+        # 다른 shard 프로세스의 채널 레지스트리 (코디네이터가 그 채널에도 멘션합니다)
+        self.channel_registry_peers: List[str] = channel_registry_peers or []
+        # False면 GitHub를 조회하는 check 규칙을 돌리지 않고 공지만 보냅니다.
+        self.reminder_checks = reminder_checks
+        # 비워 두면 제출 기록을 남기지 않습니다.
+        self.history_db_path = history_db_path or None
+        # 비워 두면 전송 기록 없이 확인할 때마다 멘션합니다.
+        self.delivery_ledger_path = delivery_ledger_path or None
+        # 알림 종류별 재멘션 간격. 숫자 하나로 주면 불러온 모든 규칙의 종류에 씁니다.
+        self.reping_minutes: Dict[str, float] = reping_minutes or {}
+        self.reping_minutes_all = reping_minutes_all
+        self.reminder_max_pings = max(0, reminder_max_pings)
+        self.reminder_mode = reminder_mode
+        # 비워 두면 저장소에 있는 reminders.toml을 씁니다.
+        self.reminder_rules_path = reminder_rules_path or None
+        # !현황이 GitHub를 다시 조회하지 않고 쓸 수 있는 스냅샷 나이(초)
+        self.status_max_age = status_max_age
+        # 필요한 intents만 받고 멤버·메시지 캐시를 끄는 게이트웨이 모드
+        self.low_memory = low_memory
+        self.links: Dict[str, Optional[str]] = links or {}
+        if projects is None and github_org and github_project_id:
+            # GITHUB_PROJECTS가 없으면 예전처럼 GITHUB_ORG/GITHUB_PROJECT_ID 하나만 봅니다.
+            try:
+                projects = [
+                    ProjectConfig(
+                        "default", github_org, int(github_project_id), self.user_map
+                    )
+                ]
+            except ValueError:
+                logger.error(
+                    f"GITHUB_PROJECT_ID가 정수가 아닙니다: {github_project_id!r}"
+                )
+        self.projects: List[ProjectConfig] = projects or []
+        self.project_concurrency = max(1, project_concurrency)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        user_map = _user_map(os.getenv("USER_MAP", "{}"))
+        reping_minutes_all, reping_minutes = _reping_minutes(
+            os.getenv("REMINDER_REPING_MINUTES")
+        )
+        return cls(
+            bot_token=os.getenv("BOT_TOKEN"),
+            github_token=os.getenv("GITHUB_TOKEN"),
+            github_org=os.getenv("GITHUB_ORG"),
+            github_project_id=os.getenv("GITHUB_PROJECT_ID"),
+            github_graphql_url=os.getenv("GITHUB_GRAPHQL_URL"),
+            github_client_options=_github_client_options(),
+            github_webhook_secret=os.getenv("GITHUB_WEBHOOK_SECRET"),
+            webhook_host=os.getenv("GITHUB_WEBHOOK_HOST", "0.0.0.0"),
+            webhook_port=_int("GITHUB_WEBHOOK_PORT", 8080),
+            webhook_path=os.getenv("GITHUB_WEBHOOK_PATH"),
+            metrics_port=_int("METRICS_PORT", None),
+            metrics_host=os.getenv("METRICS_HOST", "0.0.0.0"),
+            metrics_path=os.getenv("METRICS_PATH"),
+            holiday_api_key=os.getenv("API_KEY"),
+            holiday_cache_path=os.getenv("HOLIDAY_CACHE_PATH", "holiday_cache.json"),
+            sharding=os.getenv("SHARDING", "off").lower()
+            in ("auto", "on", "1", "true"),
+            shard_count=_int("SHARD_COUNT", None),
+            shard_ids=os.getenv("SHARD_IDS"),
+            user_map=user_map,
+            snapshot_ttl=_float("GITHUB_SNAPSHOT_TTL", 60.0),
+            webhook_snapshot_ttl=_float("GITHUB_WEBHOOK_SNAPSHOT_TTL", 900.0),
+            reconcile_interval=_float("GITHUB_RECONCILE_INTERVAL", 900.0),
+            debug_dump_rate=_float("PROJECT_DEBUG_DUMP_RATE", 0.0),
+            debug_dump_dir=os.getenv("PROJECT_DEBUG_DUMP_DIR", "debug_dumps"),
+            channel_registry_path=os.getenv(
+                "CHANNEL_REGISTRY_PATH", "channel_registry.json"
+            ),
+            channel_registry_peers=[
+                path
+                for path in os.getenv("CHANNEL_REGISTRY_PEERS", "").split(os.pathsep)
+                if path
+            ],
+            reminder_checks=_bool("REMINDER_CHECKS", True),
+            history_db_path=os.getenv("HISTORY_DB_PATH", "history.db"),
+            delivery_ledger_path=os.getenv("DELIVERY_LEDGER_PATH", "history.db"),
+            reping_minutes=reping_minutes,
+            reping_minutes_all=reping_minutes_all,
+            reminder_max_pings=_int("REMINDER_MAX_PINGS", 0),
+            reminder_mode=os.getenv("REMINDER_MODE", "coalesced"),
+            reminder_rules_path=os.getenv("REMINDER_RULES_PATH"),
+            status_max_age=_float("STATUS_MAX_AGE", 300.0),
+            low_memory=_bool("LOW_MEMORY", False),
+            links={
+                name: os.getenv(name)
+                for name in (
+                    "NOTION",
+                    "SERVICE",
+                    "FEEDBACK",
+                    "DAILY_SCRUM",
+                    "WEEK_PLANNING",
+                    "WEEK_RETROSPECT",
+                )
+            },
+            projects=_projects(os.getenv("GITHUB_PROJECTS"), user_map) or None,
+            project_concurrency=_int(
+                "GITHUB_PROJECT_CONCURRENCY", DEFAULT_PROJECT_CONCURRENCY
+            ),
+        )
+
+    def require_github(self) -> None:
+        """GitHub 조회에 필요한 토큰과 프로젝트 설정이 있는지 확인합니다."""
+        if not self.github_token or not self.projects:
+            raise ValueError(
+                "필수 환경 변수가 설정되지 않았습니다: GITHUB_TOKEN과 "
+                "GITHUB_PROJECTS 또는 GITHUB_ORG/GITHUB_PROJECT_ID"
+            )
+
+
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """처음 호출할 때 .env를 읽어 설정을 만들고, 이후에는 같은 객체를 돌려줍니다."""
+    global _settings
+    if _settings is None:
+        from dotenv import load_dotenv
+
+        load_dotenv(override=True)
+        _settings = Settings.from_env()
+    return _settings
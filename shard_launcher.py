@@ -0,0 +1,189 @@
+"""shard 범위를 나눠 main.py를 여러 프로세스로 띄우고 감시하는 런처.
+
+    python shard_launcher.py --shard-count 8 --per-process 2
+
+각 프로세스는 SHARD_COUNT / SHARD_IDS 환경 변수로 자기 shard 범위만 맡고,
+채널 레지스트리 파일도 따로 씁니다. 첫 번째 프로세스가 코디네이터로 GitHub
+웹훅과 미작성자 확인(check 규칙)을 혼자 맡아, 다른 프로세스의 레지스트리에 있는
+알림 채널까지 멘션하고 제출 기록을 씁니다. 나머지 프로세스는 자기 shard에
+공지만 보내고 !현황은 폴링으로 답합니다. 전송 기록은 모든 프로세스가 함께
+써서 재시작해도 같은 회차를 다시 보내지 않습니다. 비정상 종료된 프로세스는
+지수 백오프로 다시 띄웁니다.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+import time
+from typing import Dict, List, Optional
+
+from settings import get_settings
+from sharding import format_shard_ids
+
+logger = logging.getLogger("shard_launcher")
+
+# Discord IDENTIFY는 (max_concurrency 1 기준) 5초에 한 번만 허용됩니다.
+IDENTIFY_INTERVAL = 5.0
+# 이 시간 이상 살아 있었으면 재시작 백오프를 초기화합니다.
+STABLE_AFTER = 300.0
+MAX_BACKOFF = 60.0
+
+
+def split_shards(shard_count: int, per_process: int) -> List[List[int]]:
+    """0..shard_count-1을 프로세스당 per_process개씩 연속 구간으로 나눕니다."""
+    if shard_count < 1 or per_process < 1:
+        raise ValueError("shard 수와 프로세스당 shard 수는 1 이상이어야 합니다.")
+    return [
+        list(range(start, min(start + per_process, shard_count)))
+        for start in range(0, shard_count, per_process)
+    ]
+
+
+def registry_path(base_path: str, shard_ids: List[int]) -> str:
+    """shard 범위마다 따로 쓰는 채널 레지스트리 파일 경로."""
+    stem, ext = os.path.splitext(base_path)
+    return f"{stem}.shard{format_shard_ids(shard_ids)}{ext or '.json'}"
+
+
+def child_env(
+    base: Dict[str, str], shard_count: int, groups: List[List[int]], index: int
+) -> Dict[str, str]:
+    env = dict(base)
+    env["SHARD_COUNT"] = str(shard_count)
+    env["SHARD_IDS"] = format_shard_ids(groups[index])
+    registry = base.get("CHANNEL_REGISTRY_PATH", "channel_registry.json")
+    env["CHANNEL_REGISTRY_PATH"] = registry_path(registry, groups[index])
+    if index == 0:
+        # 첫 프로세스가 코디네이터입니다. GitHub 확인을 혼자 돌리고, 다른
+        # 프로세스가 찾아 둔 알림 채널에도 REST로 멘션합니다.
+        env["REMINDER_CHECKS"] = "1"
+        env["CHANNEL_REGISTRY_PEERS"] = os.pathsep.join(
+            registry_path(registry, ids) for ids in groups[1:]
+        )
+    else:
+        # 나머지는 자기 shard에 공지만 보내므로 GitHub를 조회하지 않고, 제출
+        # 기록도 코디네이터 혼자 씁니다. 전송 기록(WAL)은 함께 써서 재시작해도
+        # 같은 공지를 다시 보내지 않습니다.
+        env["REMINDER_CHECKS"] = "0"
+        env["HISTORY_DB_PATH"] = ""
+        # 같은 포트를 두고 다투지 않도록 웹훅 서버는 첫 프로세스에서만 엽니다.
+        env.pop("GITHUB_WEBHOOK_SECRET", None)
+    return env
+
+
+class ShardProcess:
+    """shard 범위 하나를 맡는 자식 프로세스와 재시작 상태."""
+
+    def __init__(self, index: int, shard_ids: List[int], env: Dict[str, str]):
+        self.index = index
+        self.shard_ids = shard_ids
+        self.env = env
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.restarts = 0
+        self.backoff = 1.0
+
+    @property
+    def label(self) -> str:
+        return f"shard {format_shard_ids(self.shard_ids)}"
+
+    async def spawn(self, argv: List[str]) -> None:
+        self.proc = await asyncio.create_subprocess_exec(*argv, env=self.env)
+        logger.info(f"[{self.label}] 시작 (pid {self.proc.pid})")
+
+    async def supervise(self, argv: List[str], stopping: asyncio.Event) -> None:
+        while not stopping.is_set():
+            started = time.monotonic()
+            await self.spawn(argv)
+            code = await self.proc.wait()
+            if stopping.is_set():
+                break
+            if code == 0:
+                logger.info(f"[{self.label}] 정상 종료")
+                break
+            if time.monotonic() - started >= STABLE_AFTER:
+                self.backoff = 1.0
+            self.restarts += 1
+            logger.warning(
+                f"[{self.label}] 종료 코드 {code}, {self.backoff:.0f}초 후 재시작 "
+                f"({self.restarts}회째)"
+            )
+            try:
+                await asyncio.wait_for(stopping.wait(), timeout=self.backoff)
+            except asyncio.TimeoutError:
+                pass
+            self.backoff = min(self.backoff * 2, MAX_BACKOFF)
+
+    def interrupt(self) -> None:
+        if self.proc is not None and self.proc.returncode is None:
+            # main.py는 KeyboardInterrupt로 정리 작업을 하고 끝납니다.
+            self.proc.send_signal(signal.SIGINT)
+
+
+async def run(args: argparse.Namespace) -> None:
+    groups = split_shards(args.shard_count, args.per_process)
+    argv = [args.python, args.script]
+    processes = [
+        ShardProcess(i, ids, child_env(os.environ, args.shard_count, groups, i))
+        for i, ids in enumerate(groups)
+    ]
+    logger.info(
+        f"shard {args.shard_count}개를 프로세스 {len(processes)}개로 나눠 실행합니다"
+    )
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    tasks = []
+    for process in processes:
+        if stopping.is_set():
+            break
+        tasks.append(asyncio.create_task(process.supervise(argv, stopping)))
+        # 앞 프로세스의 shard들이 IDENTIFY를 마칠 시간만큼 띄워서 시작합니다.
+        try:
+            await asyncio.wait_for(
+                stopping.wait(),
+                timeout=IDENTIFY_INTERVAL * len(process.shard_ids),
+            )
+        except asyncio.TimeoutError:
+            pass
+
+    supervisors = asyncio.gather(*tasks, return_exceptions=True)
+    watcher = asyncio.create_task(stopping.wait())
+    await asyncio.wait([watcher, supervisors], return_when=asyncio.FIRST_COMPLETED)
+    if stopping.is_set():
+        logger.info("종료 신호를 받아 자식 프로세스를 정리합니다")
+        for process in processes:
+            process.interrupt()
+    await supervisors
+    watcher.cancel()
+
+
+def main() -> None:
+    # .env도 읽어 두므로 자식 프로세스가 같은 환경 변수를 물려받습니다.
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=settings.shard_count,
+        required=settings.shard_count is None,
+        help="전체 shard 수 (기본값: SHARD_COUNT)",
+    )
+    parser.add_argument(
+        "--per-process", type=int, default=1, help="프로세스 하나가 맡을 shard 수"
+    )
+    parser.add_argument("--script", default="main.py", help="실행할 봇 스크립트")
+    parser.add_argument("--python", default=sys.executable, help="파이썬 실행 파일")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import discord
+from discord.ext import commands
+
+import metrics
+from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def parse_shard_ids(value: Optional[str]) -> Optional[List[int]]:
+    """SHARD_IDS 값("0-3,6" 형식)을 shard id 목록으로 바꿉니다. 비어 있으면 None."""
+    if not value or not value.strip():
+        return None
+    ids = set()
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(x) for x in part.split("-", 1))
+            if start > end:
+                raise ValueError(f"잘못된 shard 범위: {part}")
+            ids.update(range(start, end + 1))
+        else:
+            ids.add(int(part))
+    return sorted(ids)
+
+
+def format_shard_ids(shard_ids: Iterable[int]) -> str:
+    """연속된 id를 범위로 묶어 parse_shard_ids가 읽을 수 있는 문자열로 만듭니다."""
+    parts = []
+    ids = sorted(set(shard_ids))
+    i = 0
+    while i < len(ids):
+        j = i
+        while j + 1 < len(ids) and ids[j + 1] == ids[j] + 1:
+            j += 1
+        parts.append(str(ids[i]) if i == j else f"{ids[i]}-{ids[j]}")
+        i = j + 1
+    return ",".join(parts)
+
+
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    """Discord 규칙대로 guild가 속한 shard id를 계산합니다."""
+    return (int(guild_id) >> 22) % shard_count
+
+
+class ShardConfig:
+    """SHARDING / SHARD_COUNT / SHARD_IDS 환경 변수로 정한 샤딩 설정.
+
+    SHARDING=auto면 Discord 권장 shard 수로 한 프로세스가 모두 맡고,
+    SHARD_COUNT와 SHARD_IDS를 주면 그 범위만 맡습니다 (shard_launcher.py 참고).
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        shard_count: Optional[int] = None,
+        shard_ids: Optional[List[int]] = None,
+    ) -> None:
+        if shard_ids is not None and shard_count is None:
+            raise ValueError("SHARD_IDS를 쓰려면 SHARD_COUNT도 지정해야 합니다.")
+        if shard_ids is not None and any(not 0 <= i < shard_count for i in shard_ids):
+            raise ValueError(
+                f"SHARD_IDS가 SHARD_COUNT({shard_count}) 범위를 벗어납니다."
+            )
+        self.enabled = enabled or shard_count is not None
+        self.shard_count = shard_count
+        self.shard_ids = shard_ids
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ShardConfig":
+        return cls(
+            enabled=settings.sharding,
+            shard_count=settings.shard_count,
+            shard_ids=parse_shard_ids(settings.shard_ids),
+        )
+
+    def describe(self) -> str:
+        if not self.enabled:
+            return "샤딩 사용 안 함"
+        if self.shard_count is None:
+            return "자동 샤딩 (권장 shard 수)"
+        ids = format_shard_ids(self.shard_ids) if self.shard_ids else "전체"
+        return f"shard {ids} / {self.shard_count}"
+
+
+def gateway_options(low_memory: bool = False) -> Dict[str, Any]:
+    """create_bot에 넘길 intents와 캐시 설정.
+
+    저메모리 모드는 봇이 실제로 쓰는 이벤트만 구독합니다. 멤버·presence를
+    받지 않고 멤버 청킹과 메시지 캐시도 끕니다. 알림 멘션은 USER_MAP의 ID로
+    만들기 때문에 멤버 캐시가 없어도 됩니다.
+    """
+    if not low_memory:
+        return {"intents": discord.Intents.all()}
+    intents = discord.Intents.none()
+    intents.guilds = True  # guild·채널 목록과 채널 변경 이벤트 (채널 레지스트리)
+    intents.guild_messages = True  # 서버 채널의 명령어
+    intents.dm_messages = True  # DM으로 보낸 !도움말
+    intents.message_content = True  # 접두사 명령어 본문
+    return {
+        "intents": intents,
+        "member_cache_flags": discord.MemberCacheFlags.none(),
+        "chunk_guilds_at_startup": False,
+        "max_messages": None,
+    }
+
+
+def create_bot(config: ShardConfig, **kwargs) -> commands.Bot:
+    """설정에 따라 일반 Bot 또는 AutoShardedBot을 만듭니다."""
+    if not config.enabled:
+        return commands.Bot(**kwargs)
+    return commands.AutoShardedBot(
+        shard_count=config.shard_count, shard_ids=config.shard_ids, **kwargs
+    )
+
+
+def channel_guild_id(channel: discord.abc.Messageable) -> Optional[int]:
+    """채널이 속한 guild id. 이 프로세스에 없는 guild의 PartialMessageable도 지원합니다."""
+    guild = getattr(channel, "guild", None)
+    if guild is not None:
+        return guild.id
+    return getattr(channel, "guild_id", None)
+
+
+def describe_channel(channel: discord.abc.Messageable) -> str:
+    guild = getattr(channel, "guild", None)
+    if guild is None:
+        return f"채널 {channel.id}(guild {channel_guild_id(channel)})"
+    return f"{channel.name}({guild.name})"
+
+
+def group_by_shard(
+    channels: Iterable[discord.abc.Messageable],
+    shard_count: Optional[int] = None,
+) -> Dict[int, List[discord.abc.Messageable]]:
+    """채널을 shard별로 묶습니다.
+
+    다른 프로세스가 맡은 guild의 채널은 guild 객체가 없으므로 shard_count로 계산합니다.
+    """
+    groups: Dict[int, List[discord.abc.Messageable]] = defaultdict(list)
+    for channel in channels:
+        guild = getattr(channel, "guild", None)
+        if guild is not None:
+            shard_id = guild.shard_id
+        else:
+            guild_id = channel_guild_id(channel)
+            shard_id = (
+                shard_for_guild(guild_id, shard_count)
+                if guild_id and shard_count
+                else 0
+            )
+        groups[shard_id].append(channel)
+    return groups
+
+
+async def fan_out(
+    channels: Iterable[discord.abc.Messageable],
+    send: Callable[[discord.abc.Messageable], Awaitable],
+    shard_count: Optional[int] = None,
+) -> int:
+    """shard끼리는 동시에, 같은 shard 안에서는 순서대로 채널마다 send를 호출합니다.
+
+    한 채널에서 실패해도 나머지 채널에는 계속 보내고, 성공한 채널 수를 반환합니다.
+    """
+
+    async def run(group: List[discord.abc.Messageable]) -> int:
+        sent = 0
+        for channel in group:
+            started = time.perf_counter()
+            try:
+                await send(channel)
+                sent += 1
+            except discord.HTTPException as e:
+                metrics.discord_send_errors.inc(status=str(e.status))
+                logger.error(f"{describe_channel(channel)} 전송 실패: {e}")
+            finally:
+                metrics.discord_send_duration.observe(time.perf_counter() - started)
+        return sent
+
+    groups = group_by_shard(channels, shard_count)
+    if not groups:
+        return 0
+    results = await asyncio.gather(*(run(group) for group in groups.values()))
+    return sum(results)
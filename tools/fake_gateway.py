@@ -0,0 +1,404 @@
+"""디스코드 게이트웨이를 흉내 내 main.py의 봇을 오프라인으로 띄우는 하네스 (샤딩 재현용).
+
+    python tools/fake_gateway.py --shard-count 4 --guilds 50 --latency 0.02
+    python tools/fake_gateway.py --shard-count 4 --per-process 2 --index 0  # 코디네이터
+    python tools/fake_gateway.py --shard-count 4 --per-process 2 --index 1  # 공지 전용
+
+웹소켓 없이 shard마다 READY와 GUILD_CREATE 페이로드를 합성해 봇의
+ConnectionState에 넣습니다. 그러면 discord.py가 실제와 같은 순서로 shard_ready를
+보내고, main.py의 on_shard_ready가 그 shard의 채널만 레지스트리에 맞춥니다.
+메시지 전송은 FakeHTTP가 받아 shard별로 세므로 fan_out이 shard끼리 동시에
+보내는지 확인할 수 있습니다. --per-process와 --index를 주면 shard_launcher.py가
+그 자식에게 줄 환경 변수로 띄우고, 다른 자식들의 채널 레지스트리도 만들어 두어
+코디네이터가 다른 프로세스의 채널까지 멘션하는지 볼 수 있습니다. 멤버 청킹 요청을
+보낼 웹소켓이 없으므로 항상 LOW_MEMORY 모드로 띄웁니다.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import discord
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from channel_registry import NAME_KEYWORDS  # noqa: E402
+from shard_launcher import child_env, registry_path, split_shards  # noqa: E402
+from sharding import format_shard_ids  # noqa: E402
+
+logger = logging.getLogger("fake_gateway")
+
+BOT_USER_ID = 900000000000000001
+# 실제 snowflake처럼 보이도록 guild id의 타임스탬프 부분을 이 값부터 씁니다.
+GUILD_ID_BASE = 1_000_000
+CHANNEL_NAMES = ["general", "alarm", "notice", "report"]
+# @everyone 역할 권한. 채널을 볼 수 있어야 전송 권한도 인정됩니다.
+BOT_PERMISSIONS = discord.Permissions.text() | discord.Permissions(view_channel=True)
+
+
+def guild_ids_for_shard(shard_id: int, shard_count: int, n: int) -> List[int]:
+    """(id >> 22) % shard_count == shard_id인 guild id n개."""
+    return [((GUILD_ID_BASE + k) * shard_count + shard_id) << 22 for k in range(n)]
+
+
+def shard_of_channel(channel_id: int, shard_count: int) -> int:
+    # 채널 id는 guild id 하위 비트에 번호를 더한 값입니다.
+    return (channel_id >> 22) % shard_count
+
+
+def bot_user() -> Dict[str, Any]:
+    return {
+        "id": str(BOT_USER_ID),
+        "username": "reminder-bot",
+        "discriminator": "0",
+        "global_name": None,
+        "avatar": None,
+        "bot": True,
+    }
+
+
+def ready_payload(
+    shard_id: int, shard_count: int, guild_ids: List[int]
+) -> Dict[str, Any]:
+    return {
+        "v": 10,
+        "user": bot_user(),
+        "guilds": [{"id": str(gid), "unavailable": True} for gid in guild_ids],
+        "session_id": f"fake-{shard_id}",
+        "shard": [shard_id, shard_count],
+        "application": {"id": str(BOT_USER_ID), "flags": 0},
+    }
+
+
+def guild_create_payload(guild_id: int, channels: int) -> Dict[str, Any]:
+    names = CHANNEL_NAMES + [f"channel-{c}" for c in range(channels)]
+    return {
+        "id": str(guild_id),
+        "name": f"guild-{guild_id >> 22}",
+        "owner_id": "1",
+        "unavailable": False,
+        "large": False,
+        "member_count": 1,
+        "roles": [
+            {
+                "id": str(guild_id),
+                "name": "@everyone",
+                "permissions": str(BOT_PERMISSIONS.value),
+                "position": 0,
+                "color": 0,
+                "hoist": False,
+                "managed": False,
+                "mentionable": False,
+            }
+        ],
+        "channels": [
+            {
+                "id": str(guild_id + c + 1),
+                "type": 0,
+                "name": name,
+                "position": c,
+                "permission_overwrites": [],
+            }
+            for c, name in enumerate(names)
+        ],
+        # 봇 자신은 멤버 캐시를 꺼도 남으므로 채널 권한 확인에 쓰입니다.
+        "members": [
+            {
+                "user": bot_user(),
+                "roles": [],
+                "joined_at": "2026-01-01T00:00:00+00:00",
+                "deaf": False,
+                "mute": False,
+                "flags": 0,
+            }
+        ],
+        "emojis": [],
+        "stickers": [],
+        "features": [],
+        "presences": [],
+        "voice_states": [],
+        "threads": [],
+    }
+
+
+class FakeHTTP:
+    """ConnectionState.http 자리에서 메시지 전송만 받아 기록합니다.
+
+    그 밖의 호출은 원래 HTTPClient로 넘깁니다.
+    """
+
+    def __init__(self, http: Any, latency: float = 0.0) -> None:
+        self._http = http
+        self.latency = latency
+        self.sent: List[Tuple[int, Dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._http, name)
+
+    async def send_message(self, channel_id: int, *, params: Any) -> Dict[str, Any]:
+        await asyncio.sleep(self.latency)
+        payload = params.payload or {}
+        self.sent.append((int(channel_id), payload))
+        return {
+            "id": str(BOT_USER_ID + len(self.sent)),
+            "channel_id": str(channel_id),
+            "author": bot_user(),
+            "content": payload.get("content") or "",
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": payload.get("embeds") or [],
+            "pinned": False,
+            "type": 0,
+        }
+
+
+class FakeGateway:
+    """봇의 ConnectionState에 shard별 게이트웨이 이벤트를 넣습니다."""
+
+    def __init__(
+        self,
+        bot: discord.AutoShardedClient,
+        shard_ids: List[int],
+        latency: float = 0.0,
+        guild_ready_timeout: float = 0.05,
+    ) -> None:
+        self.bot = bot
+        self.state = bot._connection
+        self.shard_count = bot.shard_count
+        self.shard_ids = shard_ids
+        # launch_shards가 하던 설정을 대신 합니다.
+        self.state.shard_count = bot.shard_count
+        self.state.shard_ids = shard_ids
+        # 마지막 GUILD_CREATE 뒤 이만큼 조용하면 shard_ready를 보냅니다.
+        self.state.guild_ready_timeout = guild_ready_timeout
+        self.http = FakeHTTP(self.state.http, latency)
+        self.state.http = self.http
+        self._ready: Dict[int, asyncio.Event] = {}
+        bot.add_listener(self._on_shard_ready, "on_shard_ready")
+
+    async def _on_shard_ready(self, shard_id: int) -> None:
+        # main.py의 on_shard_ready보다 뒤에 예약되므로 레지스트리 동기화가 끝난 뒤입니다.
+        self._ready.setdefault(shard_id, asyncio.Event()).set()
+
+    async def connect(
+        self, shard_id: int, guild_ids: List[int], channels: int
+    ) -> float:
+        """READY와 GUILD_CREATE를 보내고 shard_ready까지 걸린 시간(초)을 돌려줍니다."""
+        event = self._ready[shard_id] = asyncio.Event()
+        started = time.perf_counter()
+        self.state.parse_ready(ready_payload(shard_id, self.shard_count, guild_ids))
+        for guild_id in guild_ids:
+            self.state.parse_guild_create(guild_create_payload(guild_id, channels))
+        await event.wait()
+        return time.perf_counter() - started
+
+    def drop_guild(self, guild_id: int) -> None:
+        """연결이 끊긴 동안 봇이 나간 guild를 캐시에서 지웁니다."""
+        guild = self.bot.get_guild(guild_id)
+        if guild is not None:
+            self.state._remove_guild(guild)
+
+    def sent_by_shard(self, since: int = 0) -> Counter:
+        return Counter(
+            shard_of_channel(channel_id, self.shard_count)
+            for channel_id, _ in self.http.sent[since:]
+        )
+
+
+def registry_by_shard(registry: Any, shard_count: int) -> Counter:
+    return Counter(
+        (int(guild_id) >> 22) % shard_count
+        for guild_id, channels in registry.as_dict().items()
+        if "alarm" in channels
+    )
+
+
+def peer_registry(guild_ids: List[int], channels: int) -> Dict[str, Any]:
+    """다른 shard 프로세스가 guild_create_payload의 guild들로 써 두었을 레지스트리."""
+    names = CHANNEL_NAMES + [f"channel-{c}" for c in range(channels)]
+    return {
+        "guilds": {
+            str(guild_id): {
+                "channels": {
+                    name: guild_id + c + 1
+                    for c, name in enumerate(names)
+                    if name in NAME_KEYWORDS
+                },
+                "channel_count": len(names),
+            }
+            for guild_id in guild_ids
+        }
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    groups = split_shards(args.shard_count, args.per_process or args.shard_count)
+    shard_ids = groups[args.index]
+    guilds = {
+        shard_id: guild_ids_for_shard(shard_id, args.shard_count, args.guilds)
+        for shard_id in range(args.shard_count)
+    }
+    tmp = tempfile.mkdtemp()
+    base = {
+        **os.environ,
+        "LOW_MEMORY": "1",
+        "CHANNEL_REGISTRY_PATH": os.path.join(tmp, "channel_registry.json"),
+        "HISTORY_DB_PATH": os.path.join(tmp, "history.db"),
+        "DELIVERY_LEDGER_PATH": os.path.join(tmp, "history.db"),
+        "HOLIDAY_CACHE_PATH": os.path.join(tmp, "holiday_cache.json"),
+    }
+    base.setdefault("GITHUB_TOKEN", "fake")
+    base.setdefault("GITHUB_ORG", "fake")
+    base.setdefault("GITHUB_PROJECT_ID", "1")
+    # 런처가 이 프로세스에 줄 환경 변수를 그대로 씁니다.
+    os.environ.update(child_env(base, args.shard_count, groups, args.index))
+    for index, ids in enumerate(groups):
+        if index == args.index:
+            continue
+        path = registry_path(base["CHANNEL_REGISTRY_PATH"], ids)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                peer_registry([g for i in ids for g in guilds[i]], args.channels), f
+            )
+    import main
+
+    bot = main.bot
+    await bot._async_setup_hook()
+    gateway = FakeGateway(bot, shard_ids, args.latency)
+    checks = {r.name for r in main.reminder_rules if r.action != main.ANNOUNCE}
+    check_jobs = [job for job in main.scheduler.jobs if job.name in checks]
+
+    try:
+        ready = await asyncio.gather(
+            *(
+                gateway.connect(shard_id, guilds[shard_id], args.channels)
+                for shard_id in shard_ids
+            )
+        )
+        await bot.wait_until_ready()
+        # on_ready가 띄운 주기 작업은 이 하네스에서 쓰지 않습니다.
+        main.refresh_holiday.cancel()
+        await main.scheduler.stop()
+        registered = registry_by_shard(main.channel_registry, args.shard_count)
+
+        now = datetime.datetime.now(main.KST)
+        rule = next(r for r in main.reminder_rules if r.action == main.ANNOUNCE)
+        before = len(gateway.http.sent)
+        started = time.perf_counter()
+        await main.announce(rule, now)
+        announce_s = time.perf_counter() - started
+        announced = gateway.sent_by_shard(before)
+        # 재시작 직후 유예 시간 안에서 같은 회차를 다시 실행하는 경우
+        before = len(gateway.http.sent)
+        await main.announce(rule, now)
+        repeated = len(gateway.http.sent) - before
+
+        # 코디네이터만 확인 멘션을 보냅니다. 다른 프로세스의 채널에는 REST로 갑니다.
+        mentioned: Counter = Counter()
+        mention_s = 0.0
+        if main.settings.reminder_checks:
+            project = main.get_projects()[0]
+            mentions = [str(10**17 + i) for i in range(args.mentions)]
+            before = len(gateway.http.sent)
+            started = time.perf_counter()
+            await main.send_mention_reminder(
+                mentions,
+                rule.embed,
+                main.project_channels(project),
+                project=project.name,
+                kind=rule.kind,
+                now=now,
+            )
+            mention_s = time.perf_counter() - started
+            mentioned = gateway.sent_by_shard(before)
+
+        # 첫 shard가 끊긴 동안 guild 하나에서 나갔다가 다시 붙는 경우:
+        # 그 shard 항목만 지워지고 다른 shard 항목은 그대로여야 합니다.
+        first = shard_ids[0]
+        gateway.drop_guild(guilds[first][-1])
+        reconnect_s = await gateway.connect(first, guilds[first][:-1], args.channels)
+        after_reconnect = registry_by_shard(main.channel_registry, args.shard_count)
+    finally:
+        main.refresh_holiday.cancel()
+        await main.scheduler.stop()
+        if main.history is not None:
+            main.history.close()
+        if main.ledger is not None:
+            main.ledger.close()
+
+    role = "코디네이터" if main.settings.reminder_checks else "공지 전용"
+    print(
+        f"프로세스 {args.index + 1}/{len(groups)} ({role}): "
+        f"shard {format_shard_ids(shard_ids)} / {args.shard_count}, "
+        f"shard당 guild {args.guilds}개, 전송 지연 {args.latency}s, "
+        f"check 작업 {len(check_jobs)}개"
+    )
+    print(
+        f"\n{'shard':>6}{'준비':>10}{'알림 채널':>10}{'@everyone':>11}"
+        f"{'멘션 메시지':>12}{'재접속 뒤 채널':>15}"
+    )
+    ready_by_shard = dict(zip(shard_ids, ready))
+    for shard_id in range(args.shard_count):
+        if shard_id in ready_by_shard:
+            local = (
+                f"{ready_by_shard[shard_id] * 1000:>8.0f}ms{registered[shard_id]:>10}"
+                f"{announced[shard_id]:>11}"
+            )
+            after = f"{after_reconnect[shard_id]:>15}"
+        elif mentioned[shard_id]:
+            # 다른 프로세스의 shard: 코디네이터가 REST로 보낸 멘션만 있습니다.
+            local, after = f"{'-':>10}{'-':>10}{'-':>11}", f"{'-':>15}"
+        else:
+            continue
+        print(f"{shard_id:>6}{local}{mentioned[shard_id]:>12}{after}")
+    sequential = sum(announced.values()) * args.latency
+    print(
+        f"\n@everyone fan_out {announce_s * 1000:.0f}ms "
+        f"(순차 전송이면 약 {sequential * 1000:.0f}ms), "
+        f"멘션 fan_out {mention_s * 1000:.0f}ms, "
+        f"shard {first} 재접속 {reconnect_s * 1000:.0f}ms, "
+        f"같은 회차 공지 재실행 시 전송 {repeated}건"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shard-count", type=int, default=4)
+    parser.add_argument(
+        "--per-process",
+        type=int,
+        help="shard_launcher.py처럼 프로세스당 맡을 shard 수. 기본값: 전체",
+    )
+    parser.add_argument(
+        "--index",
+        type=int,
+        default=0,
+        help="흉내 낼 런처 자식 프로세스 (0이 코디네이터)",
+    )
+    parser.add_argument("--guilds", type=int, default=25, help="shard당 guild 수")
+    parser.add_argument("--channels", type=int, default=10, help="guild당 추가 채널 수")
+    parser.add_argument("--mentions", type=int, default=30, help="멘션할 사용자 수")
+    parser.add_argument(
+        "--latency", type=float, default=0.01, help="메시지 전송 지연(초)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
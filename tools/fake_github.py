@@ -0,0 +1,386 @@
+"""GitHub GraphQL API를 흉내 내는 로컬 서버 (오프라인 테스트·벤치마크용).
+
+    python tools/fake_github.py --items 500 --latency 0.05          # 합성 데이터
+    python tools/fake_github.py --mode record --cassette cassettes/  # 실제 응답 녹화
+    python tools/fake_github.py --mode replay --cassette cassettes/  # 녹화본 재생
+
+봇은 GITHUB_GRAPHQL_URL=http://127.0.0.1:8765/graphql 로 이 서버를 바라보게 합니다.
+fake 모드는 지연·페이지네이션·오류·레이트 리밋 헤더를 설정할 수 있고,
+record 모드는 실제 GitHub 응답을 요청 해시별 JSON 파일로 저장합니다.
+"""
+
+import argparse
+import asyncio
+import datetime
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger("fake_github")
+
+UPSTREAM_URL = "https://api.github.com/graphql"
+PAGE_SIZE_RE = re.compile(r"items\(\s*first:\s*(\d+)")
+FILTER_TOKEN_RE = re.compile(r'(\w+):(>=|<=|>|<)?("[^"]*"|\S+)|"([^"]*)"|(\S+)')
+
+
+def request_key(payload: Dict[str, Any]) -> str:
+    """공백 차이를 무시한 query와 variables로 녹화본 키를 만듭니다."""
+    normalized = {
+        "query": " ".join((payload.get("query") or "").split()),
+        "variables": payload.get("variables") or {},
+    }
+    body = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(body.encode()).hexdigest()[:32]
+
+
+def _status_of(node: Dict[str, Any]) -> Optional[str]:
+    for field in (node.get("fieldValues") or {}).get("nodes", []):
+        if (field.get("field") or {}).get("name") == "Status":
+            return field.get("name")
+    return None
+
+
+def matches_filter(node: Dict[str, Any], filter_query: Optional[str]) -> bool:
+    """Projects 필터 문법 중 봇이 쓰는 부분(status:, updated:>=, 제목 텍스트)만 해석합니다."""
+    if not filter_query:
+        return True
+    title = (node.get("content") or {}).get("title", "")
+    for key, op, value, quoted, word in FILTER_TOKEN_RE.findall(filter_query):
+        if key:
+            value = value.strip('"')
+            if key == "status" and _status_of(node) != value:
+                return False
+            if key == "updated" and op == ">=" and node.get("updatedAt", "") < value:
+                return False
+        elif (quoted or word) not in title:
+            return False
+    return True
+
+
+def shape_node(node: Dict[str, Any], query: str) -> Dict[str, Any]:
+    """쿼리가 요청한 모양에 가깝게 노드를 줄여 응답 크기를 현실적으로 맞춥니다."""
+    if "ReminderItemFields" in query:
+        content = node.get("content") or {}
+        return {
+            "id": node["id"],
+            "createdAt": node.get("createdAt"),
+            "updatedAt": node.get("updatedAt"),
+            "status": {"name": _status_of(node)},
+            "content": {
+                "id": content.get("id"),
+                "title": content.get("title"),
+                "assignees": content.get("assignees"),
+                "parent": content.get("parent"),
+            },
+        }
+    if "ProjectItemFields" not in query and "fieldValues" not in query:
+        return {
+            "id": node["id"],
+            "isArchived": node.get("isArchived", False),
+            "updatedAt": node.get("updatedAt"),
+        }
+    return node
+
+
+class FakeGitHub:
+    """메모리에 든 아이템으로 Projects v2 GraphQL 요청에 답하는 가짜 서버."""
+
+    def __init__(
+        self,
+        items: List[Dict[str, Any]],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 502,
+        rate_limit: int = 5000,
+        reset_after: float = 3600.0,
+        seed: int = 0,
+    ) -> None:
+        self.items = items
+        self.by_id = {item["id"]: item for item in items}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.reset_after = reset_after
+        self.reset_at = time.time() + reset_after
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self._fail_next: List[int] = []
+
+    def fail_next(self, count: int = 1, status: Optional[int] = None) -> None:
+        """다음 count번의 요청을 지정한 상태 코드로 실패시킵니다."""
+        self._fail_next.extend([status or self.error_status] * count)
+
+    def _headers(self, cost: int) -> Dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(int(self.reset_at)),
+            "X-RateLimit-Used": str(self.rate_limit - self.remaining),
+            "X-RateLimit-Resource": "graphql",
+            "X-Fake-Cost": str(cost),
+        }
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        payload = await request.json()
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self.rng.uniform(0, self.jitter))
+
+        if time.time() >= self.reset_at:
+            self.remaining = self.rate_limit
+            self.reset_at = time.time() + self.reset_after
+
+        status = None
+        if self._fail_next:
+            status = self._fail_next.pop(0)
+        elif self.error_rate and self.rng.random() < self.error_rate:
+            status = self.error_status
+        if status is not None:
+            self.errors += 1
+            return web.json_response(
+                {"message": "fake error"}, status=status, headers=self._headers(0)
+            )
+        if self.remaining <= 0:
+            self.errors += 1
+            return web.json_response(
+                {"message": "API rate limit exceeded"},
+                status=403,
+                headers=self._headers(0),
+            )
+
+        query = payload.get("query") or ""
+        variables = payload.get("variables") or {}
+        data = self.execute(query, variables)
+        cost = 1
+        self.remaining = max(0, self.remaining - cost)
+        reset_iso = datetime.datetime.fromtimestamp(
+            self.reset_at, datetime.timezone.utc
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        data["rateLimit"] = {
+            "cost": cost,
+            "remaining": self.remaining,
+            "resetAt": reset_iso,
+        }
+        return web.json_response({"data": data}, headers=self._headers(cost))
+
+    def execute(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        if "subIssues" in query:
+            return {"nodes": [self._sub_issues(i, query) for i in variables["ids"]]}
+        if "nodes(ids:" in query:
+            ids = variables.get("ids") or []
+            return {
+                "nodes": [
+                    shape_node(self.by_id[i], query) if i in self.by_id else None
+                    for i in ids
+                ]
+            }
+
+        page_size = int(next(iter(PAGE_SIZE_RE.findall(query)), 100))
+        selected = [
+            item for item in self.items if matches_filter(item, variables.get("filter"))
+        ]
+        start = int(variables.get("after") or 0)
+        page = selected[start : start + page_size]
+        end = start + len(page)
+        return {
+            "organization": {
+                "projectV2": {
+                    "id": "PVT_fake",
+                    "items": {
+                        "pageInfo": {
+                            "hasNextPage": end < len(selected),
+                            "endCursor": str(end),
+                        },
+                        "nodes": [shape_node(item, query) for item in page],
+                    },
+                }
+            }
+        }
+
+    def _sub_issues(self, issue_id: str, query: str) -> Dict[str, Any]:
+        """content.parent가 issue_id인 아이템을 그 이슈의 하위 이슈로 돌려줍니다."""
+        children = [
+            item
+            for item in self.items
+            if ((item.get("content") or {}).get("parent") or {}).get("id") == issue_id
+        ]
+        return {
+            "id": issue_id,
+            "subIssues": {
+                "nodes": [
+                    {
+                        "projectItems": {
+                            "nodes": [
+                                {
+                                    "project": {"id": "PVT_fake"},
+                                    **shape_node(item, query),
+                                }
+                            ]
+                        }
+                    }
+                    for item in children
+                ]
+            },
+        }
+
+    def make_app(self, path: str = "/graphql") -> web.Application:
+        app = web.Application()
+        app.router.add_post(path, self.handle)
+        return app
+
+
+class Recorder:
+    """요청을 실제 GitHub로 넘기고 응답을 녹화하거나(record), 녹화본만 돌려줍니다(replay)."""
+
+    def __init__(
+        self, cassette_dir: str, mode: str, upstream: str = UPSTREAM_URL
+    ) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"알 수 없는 모드: {mode}")
+        self.cassette_dir = cassette_dir
+        self.mode = mode
+        self.upstream = upstream
+        self.hits = 0
+        self.misses = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+        os.makedirs(cassette_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cassette_dir, f"{key}.json")
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        key = request_key(payload)
+        path = self._path(key)
+
+        if self.mode == "replay":
+            try:
+                with open(path, encoding="utf-8") as f:
+                    recorded = json.load(f)
+            except FileNotFoundError:
+                self.misses += 1
+                logger.warning(f"녹화본 없음: {key}")
+                return web.json_response(
+                    {"message": f"no recording for {key}"}, status=404
+                )
+            self.hits += 1
+            return web.json_response(
+                recorded["body"],
+                status=recorded["status"],
+                headers=recorded.get("headers", {}),
+            )
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        headers = {"Authorization": request.headers.get("Authorization", "")}
+        async with self._session.post(
+            self.upstream, json=payload, headers=headers
+        ) as response:
+            body = await response.json(content_type=None)
+            kept = {
+                k: v
+                for k, v in response.headers.items()
+                if k.lower().startswith("x-ratelimit") or k.lower() == "retry-after"
+            }
+            status = response.status
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "request": payload,
+                    "status": status,
+                    "headers": kept,
+                    "body": body,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        logger.info(f"녹화: {key} (HTTP {status})")
+        return web.json_response(body, status=status, headers=kept)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def make_app(self, path: str = "/graphql") -> web.Application:
+        app = web.Application()
+        app.router.add_post(path, self.handle)
+        return app
+
+
+async def serve(app: web.Application, host: str, port: int) -> web.AppRunner:
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.mode == "fake":
+        from benchmarks.payloads import make_project_items
+
+        server = FakeGitHub(
+            make_project_items(args.items, n_fields=args.fields),
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit=args.rate_limit,
+            seed=args.seed,
+        )
+        app = server.make_app()
+    else:
+        server = Recorder(args.cassette, args.mode, args.upstream)
+        app = server.make_app()
+
+    runner = await serve(app, args.host, args.port)
+    logger.info(f"[{args.mode}] http://{args.host}:{args.port}/graphql 대기 중")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        if isinstance(server, Recorder):
+            await server.close()
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["fake", "record", "replay"], default="fake")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--items", type=int, default=300, help="합성 아이템 수")
+    parser.add_argument("--fields", type=int, default=5, help="아이템당 필드 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx 비율")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="시간당 포인트")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cassette", default="cassettes", help="녹화본 디렉터리")
+    parser.add_argument("--upstream", default=UPSTREAM_URL)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""기록해 둔 GitHub 웹훅 페이로드를 로컬 웹훅 엔드포인트로 다시 보냅니다.
+
+    python tools/replay_webhooks.py --secret <secret> tools/webhook_samples/*.json
+
+각 파일은 {"event": "<X-GitHub-Event>", "payload": {...}} 형식입니다.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import uuid
+
+import aiohttp
+
+
+def sign(secret: str, body: bytes) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+async def replay(url: str, secret: str, paths, delay: float) -> None:
+    async with aiohttp.ClientSession() as session:
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                recorded = json.load(f)
+            body = json.dumps(recorded["payload"]).encode()
+            headers = {
+                "Content-Type": "application/json",
+                "X-GitHub-Event": recorded["event"],
+                "X-GitHub-Delivery": recorded.get("delivery", str(uuid.uuid4())),
+                "X-Hub-Signature-256": sign(secret, body),
+            }
+            async with session.post(url, data=body, headers=headers) as response:
+                print(f"{path}: HTTP {response.status} {await response.text()}")
+            await asyncio.sleep(delay)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="기록된 페이로드 JSON 파일")
+    parser.add_argument("--url", default="http://127.0.0.1:8080/github/webhook")
+    parser.add_argument("--secret", required=True)
+    parser.add_argument("--delay", type=float, default=0.0, help="전송 간격(초)")
+    args = parser.parse_args()
+    asyncio.run(replay(args.url, args.secret, args.paths, args.delay))
+
+
+if __name__ == "__main__":
+    main()
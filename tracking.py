@@ -1,453 +1,816 @@
+import asyncio
 import json
-import re
-from dotenv import load_dotenv
+import random
+import time
 import os
-import aiohttp
 import logging
-from typing import List, Dict, Any, Set, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 import datetime
+from operator import attrgetter
+from github_client import GitHubClient, GitHubUnavailableError
+from project_items import (
+    ProjectIndex,
+    ProjectItem,
+    field_node_value,
+    parse_github_datetime,
+)
+from scheduler import KST
+from settings import ProjectConfig, get_settings
 
 logger = logging.getLogger(__name__)
-load_dotenv(override=True)
 
-# 환경 변수 로드 및 검증
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-PROJECT_ID = os.getenv("GITHUB_PROJECT_ID")
-ORG_LOGIN = os.getenv("GITHUB_ORG")
+# 봇 수명 동안 공유되는 GitHub 클라이언트 (main.py에서 주입)
+_github_client: Optional[GitHubClient] = None
 
-if not all([GITHUB_TOKEN, PROJECT_ID, ORG_LOGIN]):
-    raise ValueError(
-        "필수 환경 변수가 설정되지 않았습니다: GITHUB_TOKEN, GITHUB_PROJECT_ID, GITHUB_ORG"
-    )
 
-# 디스코드-깃허브 사용자 매핑 (환경 변수에서 로드)
-USER_MAP = os.getenv("USER_MAP", "{}")
-try:
-    user_map = json.loads(USER_MAP)
-except json.JSONDecodeError:
-    logger.error("USER_MAP 환경 변수가 올바른 JSON 형식이 아닙니다.")
-    user_map = {}
-
-HEADERS = {
-    "Authorization": f"Bearer {GITHUB_TOKEN}",
-    "Content-Type": "application/json",
-    "X-GitHub-Api-Version": "2022-11-28",
-}
+def set_github_client(client: Optional[GitHubClient]) -> None:
+    """모든 tracking 함수가 사용할 GitHub 클라이언트를 설정합니다."""
+    global _github_client
+    _github_client = client
+
+
+async def get_github_client() -> GitHubClient:
+    """공용 GitHub 클라이언트를 반환합니다. 설정되지 않았다면 환경 변수로 생성합니다."""
+    global _github_client
+    if _github_client is None:
+        settings = get_settings()
+        settings.require_github()
+        _github_client = GitHubClient.from_settings(settings)
+    await _github_client.start()
+    return _github_client
 
 
-async def fetch_github_project_issues() -> List[Dict[str, Any]]:
-    """GitHub Project v2에서 이슈 목록을 가져옵니다."""
-    url = "https://api.github.com/graphql"
-    query = {
-        "query": f"""
-        query {{
-            organization(login: "{ORG_LOGIN}") {{
-                projectV2(number: {PROJECT_ID}) {{
-                    items(last: 100) {{
-                        nodes {{
-                            fieldValues(first: 100) {{
-                                nodes {{
-                                    __typename
-                                    ... on ProjectV2ItemFieldSingleSelectValue {{
-                                        name
-                                        field {{
-                                            ... on ProjectV2SingleSelectField {{
-                                                name
-                                            }}
-                                        }}
-                                    }}
-                                    ... on ProjectV2ItemFieldTextValue {{
-                                        text
-                                        field {{
-                                            ... on ProjectV2Field {{
-                                                name
-                                            }}
-                                        }}
-                                    }}
-                                    ... on ProjectV2ItemFieldNumberValue {{
-                                        number
-                                        field {{
-                                            ... on ProjectV2Field {{
-                                                name
-                                            }}
-                                        }}
-                                    }}
-                                    ... on ProjectV2ItemFieldDateValue {{
-                                        date
-                                        field {{
-                                            ... on ProjectV2Field {{
-                                                name
-                                            }}
-                                        }}
-                                    }}
-                                }}
-                            }}
-                            content {{
-                                ... on Issue {{
-                                    title
-                                    url
-                                    body
-                                    assignees(first: 10) {{
-                                        nodes {{
-                                            login
-                                        }}
-                                    }}
-                                }}
-                            }}
-                            createdAt
-                        }}
-                    }}
-                }}
-            }}
-        }}
+class ProjectSnapshotCache:
+    """프로젝트 아이템 스냅샷을 TTL 동안 공유하는 캐시.
+
+    동시에 들어온 요청은 진행 중인 하나의 GitHub 요청을 함께 기다립니다
+    (single-flight). 같은 틱에 도는 여러 알림 루프가 한 번의 왕복을 공유합니다.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[ProjectIndex]],
+        ttl: float,
+    ) -> None:
+        self._loader = loader
+        self.ttl = ttl
+        self._items: Optional[ProjectIndex] = None
+        self._fetched_at: Optional[float] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @property
+    def age(self) -> Optional[float]:
+        """마지막 스냅샷 이후 경과 시간(초). 스냅샷이 없으면 None."""
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    @property
+    def last(self) -> Optional[ProjectIndex]:
+        """신선도와 상관없이 마지막 스냅샷. 없으면 None."""
+        return self._items
+
+    def is_fresh(self, max_age: Optional[float] = None) -> bool:
+        age = self.age
+        limit = self.ttl if max_age is None else max_age
+        return age is not None and age <= limit
+
+    async def get(self, max_age: Optional[float] = None) -> ProjectIndex:
+        """신선한 스냅샷을 반환하고, 만료됐으면 새로 가져옵니다.
+
+        max_age를 주면 TTL 대신 해당 초 단위 허용치를 사용합니다.
         """
+        if self.is_fresh(max_age):
+            self.hits += 1
+            return self._items
+        if self._inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(self._inflight)
+        self.misses += 1
+        return await self.refresh()
+
+    async def refresh(self) -> ProjectIndex:
+        """캐시를 무시하고 새로 가져옵니다. 진행 중인 요청이 있으면 합류합니다."""
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._load())
+        return await asyncio.shield(self._inflight)
+
+    async def _load(self) -> ProjectIndex:
+        try:
+            items = await self._loader()
+            self._items = items
+            self._fetched_at = time.monotonic()
+            return items
+        finally:
+            self._inflight = None
+
+    def put(self, value: ProjectIndex) -> None:
+        """외부에서 갱신된 스냅샷(예: 웹훅 반영)을 새 스냅샷으로 저장합니다."""
+        self._items = value
+        self._fetched_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """스냅샷을 폐기해 다음 get()이 새로 가져오도록 합니다."""
+        self._items = None
+        self._fetched_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "age": self.age,
+            "items": len(self._items) if self._items is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+PROJECT_ITEM_FRAGMENT = """
+fragment ProjectItemFields on ProjectV2Item {
+    id
+    isArchived
+    createdAt
+    updatedAt
+    fieldValues(first: 20) {
+        nodes {
+            __typename
+            ... on ProjectV2ItemFieldSingleSelectValue {
+                name
+                field { ... on ProjectV2SingleSelectField { name } }
+            }
+            ... on ProjectV2ItemFieldTextValue {
+                text
+                field { ... on ProjectV2Field { name } }
+            }
+            ... on ProjectV2ItemFieldNumberValue {
+                number
+                field { ... on ProjectV2Field { name } }
+            }
+            ... on ProjectV2ItemFieldDateValue {
+                date
+                field { ... on ProjectV2Field { name } }
+            }
+            ... on ProjectV2ItemFieldUserValue {
+                users(first: 10) { nodes { login } }
+                field { ... on ProjectV2Field { name } }
+            }
+        }
     }
+    content {
+        ... on Issue {
+            id
+            title
+            url
+            createdAt
+            updatedAt
+            assignees(first: 10) { nodes { login } }
+            parent { id }
+        }
+    }
+}
+"""
+
+SYNC_ITEMS_QUERY = """
+query($org: String!, $number: Int!, $after: String, $filter: String) {
+    rateLimit { cost remaining resetAt }
+    organization(login: $org) {
+        projectV2(number: $number) {
+            id
+            items(first: 100, after: $after, query: $filter) {
+                pageInfo { hasNextPage endCursor }
+                nodes { ...ProjectItemFields }
+            }
+        }
+    }
+}
+""" + PROJECT_ITEM_FRAGMENT
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=HEADERS, json=query) as response:
-                if response.status != 200:
-                    logger.error(f"GitHub API 요청 실패: HTTP {response.status}")
-                    return []
+SYNC_NODES_QUERY = """
+query($ids: [ID!]!) {
+    rateLimit { cost remaining resetAt }
+    nodes(ids: $ids) {
+        ... on ProjectV2Item { ...ProjectItemFields }
+    }
+}
+""" + PROJECT_ITEM_FRAGMENT
+
+RECONCILE_QUERY = """
+query($org: String!, $number: Int!, $after: String) {
+    rateLimit { cost remaining resetAt }
+    organization(login: $org) {
+        projectV2(number: $number) {
+            items(first: 100, after: $after) {
+                pageInfo { hasNextPage endCursor }
+                nodes { id isArchived updatedAt }
+            }
+        }
+    }
+}
+"""
 
-                data = await response.json()
 
-                # 응답 로깅 (민감한 정보 제외)
-                logger.debug(f"GitHub GraphQL 응답 상태: {response.status}")
+async def _graphql(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    client = await get_github_client()
+    return await client.graphql(query, variables)
 
-                if "errors" in data:
-                    logger.error(f"GitHub API Error: {data['errors']}")
-                    return []
 
-                # 데이터 구조 검증
+def _item_updated_at(item: Dict[str, Any]) -> str:
+    """아이템과 연결된 이슈 중 더 최근의 updatedAt을 반환합니다."""
+    content = item.get("content") or {}
+    return max(item.get("updatedAt") or "", content.get("updatedAt") or "")
+
+
+class ProjectSyncEngine:
+    """Project v2 아이템을 id 기준으로 보관하고 변경분만 가져와 병합합니다.
+
+    - 첫 동기화(또는 실패 후)는 전체 아이템을 가져옵니다.
+    - 이후에는 updatedAt 고수위(high-water mark) 이후 수정된 아이템만 받습니다.
+    - reconcile_interval마다 id/updatedAt만 훑어 삭제·보관(archived)된 아이템을
+      제거하고, 필터에서 놓친 변경분을 노드 id로 다시 가져옵니다.
+    """
+
+    def __init__(
+        self,
+        org: Optional[str] = None,
+        number: Optional[int] = None,
+        reconcile_interval: float = 900.0,
+    ) -> None:
+        # org/number를 생략하면 처음 동기화할 때 설정에서 읽고 검증합니다.
+        self.org = org
+        self.number = number
+        self.reconcile_interval = reconcile_interval
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.watermark: Optional[str] = None
+        self.project_node_id: Optional[str] = None
+        self._last_reconcile: Optional[float] = None
+
+    def project_variables(self) -> Dict[str, Any]:
+        if self.org is None or self.number is None:
+            settings = get_settings()
+            settings.require_github()
+            self.org = settings.projects[0].org
+            self.number = settings.projects[0].number
+        return {"org": self.org, "number": self.number}
+
+    async def sync(self) -> List[Dict[str, Any]]:
+        """저장소를 최신 상태로 맞추고 전체 아이템 목록을 반환합니다.
+
+        최신 상태를 보장할 수 없으면 GitHubUnavailableError를 던집니다.
+        """
+        if self.watermark is None:
+            await self._full_sync()
+        else:
+            await self._delta_sync()
+            if (
+                self._last_reconcile is None
+                or time.monotonic() - self._last_reconcile >= self.reconcile_interval
+            ):
                 try:
-                    items = data["data"]["organization"]["projectV2"]["items"]["nodes"]
-                    logger.info(f"가져온 프로젝트 아이템 수: {len(items)}")
-                    return items
-                except KeyError as e:
-                    logger.error(f"예상하지 못한 응답 구조: {e}")
-                    return []
-
-    except aiohttp.ClientError as e:
-        logger.error(f"HTTP 클라이언트 오류: {e}")
-        return []
-    except Exception as e:
-        logger.exception(f"GraphQL 요청 중 예상치 못한 오류 발생: {e}")
-        return []
+                    await self._reconcile()
+                except GitHubUnavailableError as e:
+                    # 델타는 이미 반영됐으므로 정합성 검사는 다음 주기로 미룹니다.
+                    logger.warning(f"정합성 검사 실패, 다음 주기에 재시도: {e}")
+        return list(self.items.values())
+
+    async def _fetch_pages(
+        self, query: str, filter_query: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        nodes: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            variables = {**self.project_variables(), "after": cursor}
+            if filter_query is not None:
+                variables["filter"] = filter_query
+            data = await _graphql(query, variables)
+            try:
+                project = data["organization"]["projectV2"]
+                items_data = project["items"]
+            except (KeyError, TypeError) as e:
+                raise GitHubUnavailableError(f"예상하지 못한 응답 구조: {e}") from e
+            self.project_node_id = project.get("id") or self.project_node_id
+            nodes.extend(node for node in items_data["nodes"] if node)
+            page_info = items_data["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return nodes
+            cursor = page_info["endCursor"]
+
+    @property
+    def ready(self) -> bool:
+        """한 번 이상 전체 동기화를 마쳐 저장소를 신뢰할 수 있는지 여부."""
+        return self.watermark is not None
+
+    def remove_item(self, item_id: str) -> bool:
+        """삭제·보관된 아이템을 저장소에서 제거합니다."""
+        return self.items.pop(item_id, None) is not None
+
+    async def refresh_items(self, item_ids: List[str]) -> int:
+        """지정한 아이템만 노드 id로 다시 가져와 병합합니다."""
+        changed = 0
+        for start in range(0, len(item_ids), 100):
+            data = await _graphql(
+                SYNC_NODES_QUERY, {"ids": item_ids[start : start + 100]}
+            )
+            changed += self._merge([node for node in data.get("nodes", []) if node])
+        return changed
+
+    def apply_issue(self, issue: Dict[str, Any], deleted: bool = False) -> int:
+        """이슈 웹훅 페이로드를 해당 이슈를 담은 아이템들에 반영합니다."""
+        node_id = issue.get("node_id")
+        targets = [
+            item_id
+            for item_id, item in self.items.items()
+            if node_id and (item.get("content") or {}).get("id") == node_id
+        ]
+        for item_id in targets:
+            if deleted:
+                del self.items[item_id]
+                continue
+            content = self.items[item_id]["content"]
+            content["title"] = issue.get("title", content.get("title"))
+            content["url"] = issue.get("html_url", content.get("url"))
+            content["updatedAt"] = issue.get("updated_at", content.get("updatedAt"))
+            content["assignees"] = {
+                "nodes": [
+                    {"login": assignee["login"]}
+                    for assignee in issue.get("assignees") or []
+                    if assignee and "login" in assignee
+                ]
+            }
+        return len(targets)
+
+    def _merge(self, nodes: List[Dict[str, Any]]) -> int:
+        changed = 0
+        for node in nodes:
+            item_id = node.get("id")
+            if not item_id:
+                continue
+            if node.get("isArchived"):
+                if self.items.pop(item_id, None) is not None:
+                    changed += 1
+                continue
+            updated_at = _item_updated_at(node)
+            current = self.items.get(item_id)
+            if current is None or _item_updated_at(current) != updated_at:
+                self.items[item_id] = node
+                changed += 1
+            if self.watermark is None or updated_at > self.watermark:
+                self.watermark = updated_at
+        return changed
+
+    async def _full_sync(self) -> None:
+        nodes = await self._fetch_pages(SYNC_ITEMS_QUERY)
+        self.items = {}
+        self.watermark = None
+        self._merge(nodes)
+        # 빈 프로젝트도 다음부터는 델타 동기화를 하도록 고수위를 채워 둡니다.
+        if self.watermark is None:
+            self.watermark = ""
+        self._last_reconcile = time.monotonic()
+        logger.info(f"전체 동기화 완료: {len(self.items)}개 아이템")
+
+    async def _delta_sync(self) -> None:
+        # 검색 필터는 날짜 단위이므로 하루 여유를 두고, 정확한 비교는 병합 시 합니다.
+        since = ""
+        if self.watermark:
+            watermark_date = datetime.datetime.fromisoformat(
+                self.watermark.replace("Z", "+00:00")
+            ).date()
+            since = (watermark_date - datetime.timedelta(days=1)).isoformat()
+        filter_query = f"updated:>={since}" if since else None
+        try:
+            nodes = await self._fetch_pages(SYNC_ITEMS_QUERY, filter_query)
+        except GitHubUnavailableError:
+            # 필터 쿼리가 실패하면 다음 동기화에서 전체를 다시 받습니다.
+            self.watermark = None
+            raise
+        changed = self._merge(nodes)
+        logger.info(f"델타 동기화: {len(nodes)}개 수신, {changed}개 변경")
+
+    async def _reconcile(self) -> None:
+        remote = await self._fetch_pages(RECONCILE_QUERY)
+        alive = {}
+        for node in remote:
+            if node.get("id") and not node.get("isArchived"):
+                alive[node["id"]] = node.get("updatedAt") or ""
+
+        removed = [item_id for item_id in self.items if item_id not in alive]
+        for item_id in removed:
+            del self.items[item_id]
+
+        stale = [
+            item_id
+            for item_id, updated_at in alive.items()
+            if item_id not in self.items
+            or (self.items[item_id].get("updatedAt") or "") != updated_at
+        ]
+        for start in range(0, len(stale), 100):
+            data = await _graphql(SYNC_NODES_QUERY, {"ids": stale[start : start + 100]})
+            self._merge([node for node in data.get("nodes", []) if node])
+
+        self._last_reconcile = time.monotonic()
+        logger.info(f"정합성 검사: {len(removed)}개 삭제, {len(stale)}개 재조회")
+
+
+def _write_snapshot_dump(index: ProjectIndex, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for item in index:
+            record = {
+                "id": item.id,
+                "title": item.title,
+                "url": item.url,
+                "status": item.status,
+                "created_at": item.created_at.isoformat(),
+                "assignees": list(item.assignees),
+                "fields": item.fields,
+            }
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+async def dump_project_snapshot(index: ProjectIndex, path: Optional[str] = None) -> str:
+    """인덱스의 모든 아이템과 필드값을 JSON Lines 파일로 저장하고 경로를 반환합니다."""
+    if path is None:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(get_settings().debug_dump_dir, f"project-{timestamp}.jsonl")
+    await asyncio.to_thread(_write_snapshot_dump, index, path)
+    logger.info(f"프로젝트 스냅샷 덤프 저장: {path} ({len(index)}개 아이템)")
+    return path
+
+
+async def build_project_index(engine: ProjectSyncEngine) -> ProjectIndex:
+    """아이템을 동기화하고 조회용 인덱스를 한 번 만들어 둡니다."""
+    index = ProjectIndex.from_nodes(await engine.sync())
+    # 0보다 크면 스냅샷을 불러올 때마다 이 확률로 디버그 덤프를 남깁니다.
+    dump_rate = get_settings().debug_dump_rate
+    if dump_rate > 0 and random.random() < dump_rate:
+        try:
+            await dump_project_snapshot(index)
+        except OSError as e:
+            logger.error(f"디버그 덤프 저장 실패: {e}")
+    return index
 
 
-def extract_assignees_by_prefix(items: List[Dict[str, Any]], prefix: str) -> Set[str]:
-    """특정 접두사로 시작하는 이슈들의 담당자를 추출합니다."""
-    users = set()
+class Project:
+    """프로젝트(팀) 하나의 설정과 동기화 저장소, 스냅샷 캐시.
 
-    for item in items:
-        content = item.get("content")
-        if not content:
-            continue
+    프로젝트마다 저장소와 캐시가 따로 있어 한 팀의 갱신이 다른 팀의 캐시를
+    무효화하지 않습니다.
+    """
 
-        title = content.get("title", "")
-        if not title.startswith(prefix):
-            continue
+    def __init__(
+        self,
+        config: ProjectConfig,
+        sync: Optional[ProjectSyncEngine] = None,
+        snapshot: Optional[ProjectSnapshotCache] = None,
+    ) -> None:
+        settings = get_settings()
+        self.config = config
+        self.name = config.name
+        self.sync = sync or ProjectSyncEngine(
+            config.org, config.number, settings.reconcile_interval
+        )
+        self.snapshot = snapshot or ProjectSnapshotCache(
+            self.load_index, settings.snapshot_ttl
+        )
 
-        assignees = content.get("assignees", {}).get("nodes", [])
-        for assignee in assignees:
-            if assignee and "login" in assignee:
-                users.add(assignee["login"])
+    @property
+    def user_map(self) -> Dict[str, str]:
+        return self.config.user_map
 
-    return users
+    async def load_index(self) -> ProjectIndex:
+        return await build_project_index(self.sync)
 
+    def publish_local_changes(self) -> None:
+        """웹훅 등으로 바뀐 저장소로 GitHub 호출 없이 스냅샷 인덱스를 다시 만듭니다."""
+        if self.sync.ready:
+            self.snapshot.put(ProjectIndex.from_nodes(self.sync.items.values()))
 
-def get_field_value(item: Dict[str, Any], field_name: str) -> Optional[Any]:
-    """프로젝트 아이템에서 특정 필드의 값을 가져옵니다."""
-    field_values = item.get("fieldValues", {}).get("nodes", [])
+    def __repr__(self) -> str:
+        return f"Project({self.name!r}, {self.config.org}/{self.config.number})"
 
-    for field in field_values:
-        # 필드 객체에서 필드 이름 가져오기
-        field_obj = field.get("field")
-        if not field_obj:
-            continue
 
-        actual_field_name = field_obj.get("name")
-        if actual_field_name != field_name:
-            continue
+# 첫 번째(또는 유일한) 프로젝트의 저장소와 스냅샷. 예전 단일 프로젝트 API는 이것을 씁니다.
+project_sync = ProjectSyncEngine(reconcile_interval=get_settings().reconcile_interval)
 
-        # 필드 타입에 따라 값 반환
-        field_type = field.get("__typename")
-
-        if field_type == "ProjectV2ItemFieldSingleSelectValue":
-            return field.get("name")
-        elif field_type == "ProjectV2ItemFieldTextValue":
-            return field.get("text")
-        elif field_type == "ProjectV2ItemFieldNumberValue":
-            return field.get("number")
-        elif field_type == "ProjectV2ItemFieldDateValue":
-            return field.get("date")
-        elif field_type == "ProjectV2ItemFieldUserValue":
-            users = field.get("users", {}).get("nodes", [])
-            return [user.get("login") for user in users] if users else None
-        elif field_type == "ProjectV2ItemFieldRepositoryValue":
-            return field.get("repository", {}).get("name")
-        elif field_type == "ProjectV2ItemFieldMilestoneValue":
-            return field.get("milestone", {}).get("title")
-        elif field_type == "ProjectV2ItemFieldLabelValue":
-            labels = field.get("labels", {}).get("nodes", [])
-            return [label.get("name") for label in labels] if labels else None
-        elif field_type == "ProjectV2ItemFieldPullRequestValue":
-            prs = field.get("pullRequests", {}).get("nodes", [])
-            return [pr.get("title") for pr in prs] if prs else None
-        else:
-            logger.warning(f"알 수 없는 필드 타입: {field_type}")
 
-    return None
+async def load_project_index() -> ProjectIndex:
+    return await build_project_index(project_sync)
 
 
-def is_target_issue(item: Dict[str, Any], target: str) -> bool:
-    """이슈가 대상 이슈인지 확인합니다 (Status가 '주간 계획'이고 제목이 날짜 형식)."""
-    # Status 필드 값 가져오기
-    status = get_field_value(item, "Status")
-
-    # 제목 가져오기
-    content = item.get("content")
-    if not content:
-        logger.debug("Issue에 content가 없습니다.")
-        return False
-
-    title = content.get("title", "")
-
-    # 모든 필드값 디버깅 출력
-    field_values = item.get("fieldValues", {}).get("nodes", [])
-    logger.info(f"=== Issue 디버깅 ===")
-    logger.info(f"제목: '{title}'")
-    logger.info(f"Status 필드값: '{status}'")
-    logger.info(f"모든 필드값:")
-    for field in field_values:
-        field_obj = field.get("field", {})
-        field_name = field_obj.get("name", "Unknown")
-        field_type = field.get("__typename", "Unknown")
-
-        if field_type == "ProjectV2ItemFieldSingleSelectValue":
-            value = field.get("name")
-        elif field_type == "ProjectV2ItemFieldTextValue":
-            value = field.get("text")
-        elif field_type == "ProjectV2ItemFieldNumberValue":
-            value = field.get("number")
-        elif field_type == "ProjectV2ItemFieldDateValue":
-            value = field.get("date")
-        elif field_type == "ProjectV2ItemFieldUserValue":
-            users = field.get("users", {}).get("nodes", [])
-            value = [user.get("login") for user in users] if users else "No users"
-        elif field_type == "ProjectV2ItemFieldRepositoryValue":
-            value = field.get("repository", {}).get("name", "No repo")
-        elif field_type == "ProjectV2ItemFieldMilestoneValue":
-            value = field.get("milestone", {}).get("title", "No milestone")
-        elif field_type == "ProjectV2ItemFieldLabelValue":
-            labels = field.get("labels", {}).get("nodes", [])
-            value = [label.get("name") for label in labels] if labels else "No labels"
-        elif field_type == "ProjectV2ItemFieldPullRequestValue":
-            prs = field.get("pullRequests", {}).get("nodes", [])
-            value = [pr.get("title") for pr in prs] if prs else "No PRs"
-        else:
-            value = f"Unsupported type: {field_type}"
+project_snapshot = ProjectSnapshotCache(load_project_index, get_settings().snapshot_ttl)
 
-        logger.info(f"  - {field_name} ({field_type}): {value}")
+_projects: Optional[List[Project]] = None
 
-    # Status가 '주간 계획'인지 확인 (여러 가능한 값들 체크)
-    possible_status_values = target
-    status_match = status == possible_status_values
 
-    return status_match
+def get_projects() -> List[Project]:
+    """설정된 프로젝트 목록을 처음 쓸 때 만들어 돌려줍니다.
 
+    첫 프로젝트는 모듈 수준의 project_sync / project_snapshot을 그대로 씁니다.
+    """
+    global _projects
+    if _projects is None:
+        settings = get_settings()
+        settings.require_github()
+        first, *rest = settings.projects
+        _projects = [Project(first, project_sync, project_snapshot)]
+        _projects.extend(Project(config) for config in rest)
+        logger.info(f"알림 대상 프로젝트: {_projects}")
+    return _projects
+
+
+def extract_assignees_by_prefix(items: List[ProjectItem], prefix: str) -> Set[str]:
+    """특정 접두사로 시작하는 이슈들의 담당자를 추출합니다."""
+    users = set()
+    for item in items:
+        if item.title.startswith(prefix):
+            users.update(item.assignees)
+    return users
 
-def sort_items_by_created_at_desc(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """createdAt 기준 내림차순 정렬 (최신순)."""
 
-    def parse_date(item):
-        return datetime.datetime.fromisoformat(
-            item.get("createdAt", "1970-01-01T00:00:00Z").replace("Z", "+00:00")
-        )
+def get_field_value(item: Dict[str, Any], field_name: str) -> Optional[Any]:
+    """GraphQL 아이템 노드에서 특정 필드의 값을 가져옵니다.
 
-    return sorted(items, key=parse_date, reverse=True)
+    파싱된 ProjectItem은 item.fields[field_name]으로 바로 조회하세요.
+    """
+    for field in item.get("fieldValues", {}).get("nodes", []):
+        field_obj = field.get("field")
+        if field_obj and field_obj.get("name") == field_name:
+            return field_node_value(field)
+    return None
 
 
-def get_discord_username(github_username: str) -> str:
-    """GitHub 사용자명을 Discord 사용자명으로 변환합니다."""
-    return user_map.get(github_username, github_username)
+def is_target_issue(item: ProjectItem, target: str) -> bool:
+    """아이템의 Status가 target과 일치하는지 확인합니다.
 
+    필드 전체를 보려면 로그 대신 dump_project_snapshot()을 사용하세요.
+    """
+    return item.status == target
 
-async def fetch_all_github_project_issues() -> List[Dict[str, Any]]:
-    """GitHub Project v2에서 모든 이슈를 페이지네이션으로 가져옵니다."""
-    all_items = []
-    cursor = None
-    page = 1
 
-    while True:
-        logger.info(f"페이지 {page} 가져오는 중...")
-
-        # 커서가 있으면 after 파라미터 추가
-        after_param = f', after: "{cursor}"' if cursor else ""
-
-        url = "https://api.github.com/graphql"
-        query = {
-            "query": f"""
-            query {{
-                organization(login: "{ORG_LOGIN}") {{
-                    projectV2(number: {PROJECT_ID}) {{
-                        items(first: 100, orderBy: {{field: CREATED_AT, direction: DESC}}{after_param}) {{
-                            pageInfo {{
-                                hasNextPage
-                                endCursor
-                            }}
-                            nodes {{
-                                id
-                                fieldValues(first: 20) {{
-                                    nodes {{
-                                        __typename
-                                        ... on ProjectV2ItemFieldSingleSelectValue {{
-                                            name
-                                            field {{
-                                                ... on ProjectV2SingleSelectField {{
-                                                    name
-                                                }}
-                                            }}
-                                        }}
-                                        ... on ProjectV2ItemFieldTextValue {{
-                                            text
-                                            field {{
-                                                ... on ProjectV2Field {{
-                                                    name
-                                                }}
-                                            }}
-                                        }}
-                                        ... on ProjectV2ItemFieldNumberValue {{
-                                            number
-                                            field {{
-                                                ... on ProjectV2Field {{
-                                                    name
-                                                }}
-                                            }}
-                                        }}
-                                        ... on ProjectV2ItemFieldDateValue {{
-                                            date
-                                            field {{
-                                                ... on ProjectV2Field {{
-                                                    name
-                                                }}
-                                            }}
-                                        }}
-                                        ... on ProjectV2ItemFieldUserValue {{
-                                            users(first: 10) {{
-                                                nodes {{
-                                                    login
-                                                }}
-                                            }}
-                                            field {{
-                                                ... on ProjectV2Field {{
-                                                    name
-                                                }}
-                                            }}
-                                        }}
-                                    }}
-                                }}
-                                content {{
-                                    ... on Issue {{
-                                        title
-                                        url
-                                        createdAt
-                                        updatedAt
-                                        assignees(first: 10) {{
-                                            nodes {{
-                                                login
-                                            }}
-                                        }}
-                                    }}
-                                }}
-                                createdAt
-                                updatedAt
-                            }}
-                        }}
-                    }}
-                }}
-            }}
-            """
+def sort_items_by_created_at_desc(items: List[ProjectItem]) -> List[ProjectItem]:
+    """createdAt 기준 내림차순 정렬 (최신순)."""
+    return sorted(items, key=attrgetter("created_at"), reverse=True)
+
+
+def get_discord_username(github_username: str) -> str:
+    """GitHub 사용자명을 Discord 사용자명으로 변환합니다 (대소문자 무시)."""
+    return get_settings().user_map_lower.get(github_username.lower(), github_username)
+
+
+STREAM_ITEMS_QUERY = """
+query($org: String!, $number: Int!, $after: String) {
+    rateLimit { cost remaining resetAt }
+    organization(login: $org) {
+        projectV2(number: $number) {
+            items(first: 100, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) {
+                pageInfo { hasNextPage endCursor }
+                nodes { ...ProjectItemFields }
+            }
         }
+    }
+}
+""" + PROJECT_ITEM_FRAGMENT
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=HEADERS, json=query) as response:
-                    if response.status != 200:
-                        logger.error(f"GitHub API 요청 실패: HTTP {response.status}")
-                        break
 
-                    data = await response.json()
+def week_start(now: Optional[datetime.datetime] = None) -> datetime.datetime:
+    """이번 주 월요일 00:00 (KST)."""
+    now = (now or datetime.datetime.now(KST)).astimezone(KST)
+    monday = now.date() - datetime.timedelta(days=now.weekday())
+    return datetime.datetime(monday.year, monday.month, monday.day, tzinfo=KST)
 
-                    if "errors" in data:
-                        logger.error(f"GitHub API Error: {data['errors']}")
-                        break
 
-                    items_data = data["data"]["organization"]["projectV2"]["items"]
-                    items = items_data["nodes"]
-                    page_info = items_data["pageInfo"]
+def created_before(cutoff: datetime.datetime) -> Callable[[Dict[str, Any]], bool]:
+    """createdAt이 cutoff보다 이른 아이템에서 멈추는 stop 조건을 만듭니다."""
 
-                    all_items.extend(items)
-                    logger.info(
-                        f"페이지 {page}: {len(items)}개 아이템 추가 (전체: {len(all_items)}개)"
-                    )
+    def stop(item: Dict[str, Any]) -> bool:
+        return parse_github_datetime(item.get("createdAt")) < cutoff
 
-                    # 다음 페이지가 있는지 확인
-                    if not page_info["hasNextPage"]:
-                        break
+    return stop
 
-                    cursor = page_info["endCursor"]
-                    page += 1
 
-                    # 안전장치: 최대 10페이지까지만
-                    if page > 10:
-                        logger.warning("최대 페이지 수 (10)에 도달했습니다.")
-                        break
+async def _iter_item_pages(
+    query: str, variables: Dict[str, Any]
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """items 연결을 커서로 따라가며 페이지의 노드 목록을 하나씩 내보냅니다."""
+    cursor = None
+    page = 1
+    while True:
+        data = await _graphql(query, {**variables, "after": cursor})
+        try:
+            items_data = data["organization"]["projectV2"]["items"]
+            nodes = items_data["nodes"]
+            page_info = items_data["pageInfo"]
+        except (KeyError, TypeError) as e:
+            raise GitHubUnavailableError(f"예상하지 못한 응답 구조: {e}") from e
+        logger.debug(f"페이지 {page}: {len(nodes)}개 아이템")
+        yield [node for node in nodes if node]
+        if not page_info["hasNextPage"]:
+            return
+        cursor = page_info["endCursor"]
+        page += 1
+
+
+async def iter_github_project_issues(
+    stop: Optional[Callable[[Dict[str, Any]], bool]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Project v2 아이템을 생성일 내림차순으로 한 페이지씩 받아 하나씩 내보냅니다.
+
+    stop(item)이 참이 되는 아이템을 만나면 그 아이템은 내보내지 않고 멈춥니다.
+    아이템이 생성일 역순이므로 "이번 주 월요일 이전" 같은 조건이면 필요한
+    페이지까지만 요청합니다. 요청이 실패하면 GitHubUnavailableError를 던집니다.
+    """
+    pages = _iter_item_pages(STREAM_ITEMS_QUERY, project_sync.project_variables())
+    try:
+        async for nodes in pages:
+            for node in nodes:
+                if stop is not None and stop(node):
+                    logger.info("stop 조건에 도달해 페이지 요청을 멈춥니다")
+                    return
+                yield node
+    finally:
+        await pages.aclose()
+
+
+# 알림 확인용 쿼리: 필요한 필드(제목·담당자·Status·날짜)만 받고,
+# 알림 종류별 필터로 GitHub 쪽에서 먼저 걸러냅니다.
+REMINDER_ITEM_FRAGMENT = """
+fragment ReminderItemFields on ProjectV2Item {
+    id
+    createdAt
+    updatedAt
+    status: fieldValueByName(name: "Status") {
+        ... on ProjectV2ItemFieldSingleSelectValue { name }
+    }
+    content {
+        ... on Issue {
+            id
+            title
+            assignees(first: 10) { nodes { login } }
+            parent { id }
+        }
+    }
+}
+"""
+
+REMINDER_ITEMS_QUERY = """
+query($org: String!, $number: Int!, $after: String, $filter: String) {
+    rateLimit { cost remaining resetAt }
+    organization(login: $org) {
+        projectV2(number: $number) {
+            id
+            items(first: 100, after: $after, query: $filter) {
+                pageInfo { hasNextPage endCursor }
+                nodes { ...ReminderItemFields }
+            }
+        }
+    }
+}
+""" + REMINDER_ITEM_FRAGMENT
+
+# 상위 이슈의 GitHub 하위 이슈와 그 프로젝트 아이템. 제목에 날짜가 없는 하위
+# 이슈는 제목 필터에 걸리지 않으므로 상위 이슈에서 따라갑니다.
+SUB_ISSUES_QUERY = """
+query($ids: [ID!]!) {
+    rateLimit { cost remaining resetAt }
+    nodes(ids: $ids) {
+        ... on Issue {
+            id
+            subIssues(first: 100) {
+                nodes {
+                    projectItems(first: 20) {
+                        nodes {
+                            project { id }
+                            ...ReminderItemFields
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+""" + REMINDER_ITEM_FRAGMENT
+
+
+async def fetch_sub_issue_items(
+    engine: ProjectSyncEngine, issue_ids: List[str]
+) -> List[Dict[str, Any]]:
+    """상위 이슈들의 하위 이슈 중 engine의 프로젝트에 있는 아이템 노드를 가져옵니다."""
+    nodes: List[Dict[str, Any]] = []
+    for start in range(0, len(issue_ids), 100):
+        data = await _graphql(SUB_ISSUES_QUERY, {"ids": issue_ids[start : start + 100]})
+        for issue in data.get("nodes") or []:
+            for sub_issue in ((issue or {}).get("subIssues") or {}).get("nodes", []):
+                for item in ((sub_issue or {}).get("projectItems") or {}).get(
+                    "nodes", []
+                ):
+                    project = (item or {}).get("project") or {}
+                    if project.get("id") == engine.project_node_id:
+                        nodes.append(item)
+    return nodes
+
+
+async def fetch_reminder_items(
+    kind: str,
+    filter_query: str,
+    project: Optional[Project] = None,
+    follow_sub_issues: bool = False,
+) -> ProjectIndex:
+    """Projects 필터(ReminderRule.filter_query)에 맞는 아이템만 가벼운 쿼리로
+    가져와 인덱스로 만듭니다.
+
+    project를 생략하면 첫 프로젝트를 조회합니다. kind는 로그에만 씁니다.
+    follow_sub_issues면 결과에 있는 Daily-Scrum 상위 이슈의 하위 이슈도 함께
+    가져와, 스냅샷 경로와 같은 하위 이슈를 보게 합니다.
+    요청이 실패하면 GitHubUnavailableError를 던집니다.
+    """
+    engine = project.sync if project is not None else project_sync
+    nodes = await engine._fetch_pages(REMINDER_ITEMS_QUERY, filter_query)
+    index = ProjectIndex.from_nodes(nodes)
+    if follow_sub_issues:
+        parent_ids = [
+            day.parent.issue_id
+            for day in index.scrum_days.values()
+            if day.parent is not None and day.parent.issue_id
+        ]
+        if parent_ids:
+            seen = {node.get("id") for node in nodes}
+            extra = [
+                node
+                for node in await fetch_sub_issue_items(engine, parent_ids)
+                if node.get("id") not in seen
+            ]
+            if extra:
+                nodes.extend(extra)
+                index = ProjectIndex.from_nodes(nodes)
+    logger.info(
+        f"[{kind}] {engine.org}/{engine.number} "
+        f"필터 '{filter_query}'로 {len(nodes)}개 아이템 조회"
+    )
+    return index
+
 
-        except Exception as e:
-            logger.exception(f"페이지 {page} 가져오기 중 오류: {e}")
-            break
+async def fetch_all_github_project_issues() -> List[Dict[str, Any]]:
+    """GitHub Project v2에서 모든 이슈를 페이지네이션으로 가져옵니다.
 
+    요청이 실패하면 일부만 반환하지 않고 GitHubUnavailableError를 던집니다.
+    한 페이지씩 처리할 수 있다면 iter_github_project_issues를 쓰세요.
+    """
+    all_items = [item async for item in iter_github_project_issues()]
     logger.info(f"총 {len(all_items)}개 아이템을 가져왔습니다.")
     return all_items
 
 
 # 사용 예시 함수들
 async def debug_all_issues() -> None:
-    """모든 이슈의 정보를 디버깅 목적으로 출력합니다."""
-    items = await fetch_all_github_project_issues()  # 모든 페이지 가져오기
-    logger.info(f"전체 아이템 수: {len(items)}")
-
-    for i, item in enumerate(items[:10]):  # 처음 10개만 출력
-        content = item.get("content")
-        if content:
-            title = content.get("title", "")
-            created_at = content.get("createdAt", "Unknown")
-            logger.info(f"[{i+1}] 제목: {title} (생성: {created_at})")
-        else:
-            logger.info(f"[{i+1}] Content 없음")
-
-
-async def get_weekly_plan_issues() -> List[Dict[str, Any]]:
-    """주간 계획 이슈들을 가져옵니다."""
-    items = await fetch_all_github_project_issues()  # 모든 페이지에서 검색
-    return [item for item in items if is_target_issue(item)]
+    """최근 이슈 10개의 정보를 디버깅 목적으로 출력합니다."""
+    stream = iter_github_project_issues()
+    i = 0
+    try:
+        async for item in stream:  # 필요한 첫 페이지만 가져옴
+            i += 1
+            content = item.get("content")
+            if content:
+                title = content.get("title", "")
+                created_at = content.get("createdAt", "Unknown")
+                logger.info(f"[{i}] 제목: {title} (생성: {created_at})")
+            else:
+                logger.info(f"[{i}] Content 없음")
+            if i >= 10:
+                break
+    finally:
+        await stream.aclose()
+
+
+async def get_weekly_plan_issues() -> List[ProjectItem]:
+    """이번 주에 만든 주간 계획 이슈들을 가져옵니다."""
+    stream = iter_github_project_issues(stop=created_before(week_start()))
+    items = []
+    async for node in stream:
+        item = ProjectItem.from_node(node)
+        if item.status == "Weekly-Planning":
+            items.append(item)
+    return items
 
 
 async def get_assignees_for_prefix(prefix: str) -> Set[str]:
     """특정 접두사로 시작하는 이슈들의 담당자를 가져옵니다."""
-    items = await fetch_all_github_project_issues()  # 모든 페이지에서 검색
-    github_users = extract_assignees_by_prefix(items, prefix)
+    index = ProjectIndex.from_nodes(await fetch_all_github_project_issues())
+    github_users = extract_assignees_by_prefix(index.items, prefix)
     return {get_discord_username(user) for user in github_users}
 
 
-# --- 날짜 추출 ---
-def extract_date_from_title(title: str) -> str:
-    match = re.match(r"(\d{2}\.\d{2}\.\d{2})", title)
-    return match.group(1) if match else ""
-
-
 # --- 오늘 날짜 반환 (YY.MM.DD 포맷) ---
 def get_today_date_str() -> str:
     return datetime.datetime.today().strftime("%y.%m.%d")
@@ -455,83 +818,64 @@ def get_today_date_str() -> str:
 
 # --- 담당자 이슈 작성 여부 확인 ---
 def check_issue_created_by_users(
-    issues: List[Dict[str, Any]], expected_users: List[str]
+    issues: List[ProjectItem], expected_users: List[str], today: Optional[str] = None
 ) -> Dict[str, bool]:
     created_by = set()
-    today = get_today_date_str()
+    today = today or get_today_date_str()
     for item in issues:
-        content = item.get("content", {})
-        title = content.get("title", "")
-        assignees = content.get("assignees", {}).get("nodes", [])
-        issue_date = extract_date_from_title(title)
+        if item.title_date == today:
+            created_by.update(item.assignees)
 
-        if issue_date != today:
-            continue
+    return {user: user.lower() in created_by for user in expected_users}
 
-        for a in assignees:
-            if "login" in a:
-                created_by.add(a["login"].lower())
 
-    return {user: user.lower() in created_by for user in expected_users}
+def collect_submissions(
+    issues: Iterable[ProjectItem],
+    expected_users: Iterable[str],
+    date: Optional[str] = None,
+) -> Dict[str, Optional[datetime.datetime]]:
+    """사용자별로 이슈를 처음 만든 시각을 찾습니다. 만든 이슈가 없으면 None.
+
+    date('YY.MM.DD')를 주면 제목 날짜가 같은 이슈만 봅니다.
+    """
+    first_created: Dict[str, datetime.datetime] = {}
+    for item in issues:
+        if date is not None and item.title_date != date:
+            continue
+        for login in item.assignees:
+            current = first_created.get(login)
+            if current is None or item.created_at < current:
+                first_created[login] = item.created_at
+    return {user: first_created.get(user.lower()) for user in expected_users}
 
 
-async def get_daily_scrum_sub_issues(issues: list[dict], today: str) -> list[dict]:
+async def get_daily_scrum_sub_issues(
+    index: ProjectIndex, today: str
+) -> List[ProjectItem]:
     """
-    오늘 날짜에 해당하는 Daily-Scrum 상위 이슈 아래의 서브 이슈들을 추출합니다.
+    해당 날짜의 Daily-Scrum 상위 이슈 아래의 서브 이슈들을 반환합니다.
+
+    날짜별 인덱스(index.scrum_days)에서 바로 찾으므로 지난 날짜도 같은 비용으로
+    조회할 수 있습니다. 하위 이슈 관계(parent)가 있으면 그것을, 없으면 제목
+    접두사('YY.MM.DD 이름')를 따릅니다.
 
     Parameters:
-    - issues: GitHub Project v2 이슈 데이터 리스트
-    - today: 'YY.MM.DD' 형식의 오늘 날짜 문자열
+    - index: 프로젝트 아이템 인덱스
+    - today: 'YY.MM.DD' 형식의 날짜 문자열
 
     Returns:
     - 해당 날짜에 대응하는 Daily-Scrum 하위 이슈 리스트
     """
-    logger.info(f"=== 서브이슈 검색 시작 (날짜: {today}) ===")
-
-    # 상위 Daily-Scrum 이슈 찾기 (title이 정확히 오늘 날짜이고 Status가 Daily-Scrum인 이슈)
-    parent_issue = next(
-        (
-            item
-            for item in issues
-            if item.get("content", {}).get("title") == today
-            and get_field_value(item, "Status") == "Daily-Scrum"
-        ),
-        None,
-    )
-
-    if parent_issue:
-        logger.info("=== 상위 이슈 정보 ===")
-        logger.info(f"제목: {parent_issue.get('content', {}).get('title')}")
-        logger.info(f"URL: {parent_issue.get('content', {}).get('url')}")
-        logger.info(f"상태: {get_field_value(parent_issue, 'Status')}")
-        logger.info(f"생성일: {parent_issue.get('createdAt')}")
-    else:
-        logger.info("상위 이슈를 찾을 수 없습니다.")
+    day = index.scrum_day(today)
+    if day is None:
+        logger.info(f"{today} 상위 이슈를 찾을 수 없습니다.")
         return []
 
-    # 서브이슈 찾기 (title이 '오늘 날짜 + 공백 + 이름' 형식인 이슈들)
-    sub_issues = []
-    for item in issues:
-        content = item.get("content", {})
-        title = content.get("title", "")
-
-        # 정확히 'YY.MM.DD 이름' 형식인지 확인
-        if title.startswith(today + " "):
-            logger.info(f"서브이슈 발견: {title}")
-            sub_issues.append(
-                {
-                    "body": title,
-                    "url": content.get("url", ""),
-                    "assignees": content.get("assignees", {}).get("nodes", []),
-                }
-            )
-
-    logger.info(f"=== 서브이슈 검색 결과 ({len(sub_issues)}개) ===")
-    return sub_issues
-
-
-def get_field_value(item: dict, field_name: str) -> str:
-    for field in item.get("fieldValues", {}).get("nodes", []):
-        if field.get("field", {}).get("name") == field_name:
-            return field.get("name") or field.get("text", "")
-    return ""
+    parent = day.parent
+    logger.info(
+        f"{today} 상위 이슈: {parent.title} ({parent.url or parent.id}), "
+        f"서브이슈 {len(day.sub_issues)}개"
+    )
+    for item in day.sub_issues:
+        logger.debug(f"서브이슈 발견: {item.title}")
+    return day.sub_issues
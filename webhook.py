@@ -0,0 +1,161 @@
+import asyncio
+import collections
+import hashlib
+import hmac
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from github_client import GitHubUnavailableError
+from settings import Settings
+from tracking import Project, get_projects
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "/github/webhook"
+
+# 아이템 필드가 페이로드에 없으므로 GitHub에서 해당 아이템만 다시 가져오는 액션
+ITEM_REFRESH_ACTIONS = {"created", "edited", "restored", "converted"}
+ITEM_REMOVE_ACTIONS = {"deleted", "archived"}
+ISSUE_ACTIONS = {
+    "edited",
+    "assigned",
+    "unassigned",
+    "opened",
+    "closed",
+    "reopened",
+    "deleted",
+}
+
+
+def verify_signature(secret: bytes, body: bytes, signature: Optional[str]) -> bool:
+    """X-Hub-Signature-256 헤더가 본문의 HMAC-SHA256과 일치하는지 확인합니다."""
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len("sha256=") :])
+
+
+class WebhookServer:
+    """projects_v2_item / issues 웹훅을 받아 프로젝트 저장소에 바로 반영하는 서버."""
+
+    def __init__(
+        self, secret: str, host: str = "0.0.0.0", port: int = 8080, path=DEFAULT_PATH
+    ) -> None:
+        self.secret = secret.encode()
+        self.host = host
+        self.port = port
+        self.path = path
+        self.received = 0
+        self.rejected = 0
+        self._seen = collections.deque(maxlen=1000)
+        self._tasks: set = set()
+        self._runner: Optional[web.AppRunner] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> Optional["WebhookServer"]:
+        """GITHUB_WEBHOOK_SECRET이 있을 때만 서버를 만듭니다."""
+        if not settings.github_webhook_secret:
+            return None
+        return cls(
+            settings.github_webhook_secret,
+            host=settings.webhook_host,
+            port=settings.webhook_port,
+            path=settings.webhook_path or DEFAULT_PATH,
+        )
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post(self.path, self.handle)
+        return app
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"웹훅 수신 대기: http://{self.host}:{self.port}{self.path}")
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        if not verify_signature(
+            self.secret, body, request.headers.get("X-Hub-Signature-256")
+        ):
+            self.rejected += 1
+            logger.warning("웹훅 서명 검증 실패")
+            return web.Response(status=401, text="invalid signature")
+
+        delivery = request.headers.get("X-GitHub-Delivery")
+        if delivery and delivery in self._seen:
+            return web.Response(status=200, text="duplicate")
+        if delivery:
+            self._seen.append(delivery)
+
+        event = request.headers.get("X-GitHub-Event", "")
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.Response(status=400, text="invalid json")
+
+        self.received += 1
+        # GitHub는 10초 안에 응답을 기대하므로 반영은 백그라운드에서 합니다.
+        task = asyncio.create_task(self.apply(event, payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return web.Response(status=202, text="accepted")
+
+    async def apply(self, event: str, payload: Dict[str, Any]) -> None:
+        """이벤트를 해당 프로젝트 저장소에 반영하고 스냅샷을 갱신합니다."""
+        action = payload.get("action")
+        for project in get_projects():
+            try:
+                if event == "projects_v2_item":
+                    changed = await self._apply_item(project, action, payload)
+                elif event == "issues" and action in ISSUE_ACTIONS:
+                    # 이슈는 어느 프로젝트에 속했는지 알 수 없으므로 모두에 반영합니다.
+                    changed = project.sync.apply_issue(
+                        payload.get("issue") or {}, deleted=action == "deleted"
+                    )
+                else:
+                    return
+            except GitHubUnavailableError as e:
+                logger.warning(
+                    f"[{project.name}] 웹훅 반영 실패 ({event}.{action}), "
+                    f"다음 동기화에서 반영: {e}"
+                )
+                continue
+            except Exception:
+                logger.exception(
+                    f"[{project.name}] 웹훅 처리 중 오류 발생 ({event}.{action})"
+                )
+                continue
+
+            if changed:
+                logger.info(
+                    f"[{project.name}] 웹훅 반영: {event}.{action} ({changed}개 아이템)"
+                )
+                project.publish_local_changes()
+
+    async def _apply_item(
+        self, project: Project, action: Optional[str], payload: Dict[str, Any]
+    ) -> int:
+        item = payload.get("projects_v2_item") or {}
+        item_id = item.get("node_id")
+        project_node_id = item.get("project_node_id")
+        engine = project.sync
+        # 저장소가 아직 프로젝트 node id를 모르면(동기화 전) 곧 있을 동기화가 반영합니다.
+        if not item_id or not engine.ready or project_node_id != engine.project_node_id:
+            return 0
+        if action in ITEM_REMOVE_ACTIONS:
+            return int(engine.remove_item(item_id))
+        if action in ITEM_REFRESH_ACTIONS:
+            return await engine.refresh_items([item_id])
+        return 0